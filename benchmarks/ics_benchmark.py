@@ -0,0 +1,68 @@
+"""Measures speed (events per second) and peak memory of the streaming iCalendar export and import.
+
+Events are deserialized from a generated fixture (same as in `serializers_benchmark.py`) and written with
+`gcsa.ics.write_ics` to a file that discards the output. Peak memory is measured with `tracemalloc` while
+events are generated one by one, so it should not grow with the number of events.
+Import is measured by parsing the exported file with `gcsa.ics.read_ics` from `mmap`.
+
+Usage:
+    python benchmarks/ics_benchmark.py [number_of_events]
+"""
+import json
+import mmap
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from serializers_benchmark import make_events_json
+
+from gcsa.ics import read_ics, write_ics
+from gcsa.serializers.event_serializer import EventSerializer
+
+
+class NullFile:
+    def write(self, s):
+        pass
+
+
+def measure_speed(events):
+    start = time.perf_counter()
+    write_ics(events, NullFile())
+    return len(events) / (time.perf_counter() - start)
+
+
+def measure_peak_memory(event_json, n):
+    tracemalloc.start()
+    write_ics((EventSerializer.to_object(event_json) for _ in range(n)), NullFile())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def measure_read_speed(events):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'calendar.ics')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            write_ics(events, f)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            start = time.perf_counter()
+            n = sum(1 for _ in read_ics(m))
+            return n / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events = [EventSerializer.to_object(event_json) for event_json in json.loads(make_events_json(n))]
+    event_json = EventSerializer.to_json(events[0])
+
+    print(f'Events: {n}')
+    print(f'write_ics:            {measure_speed(events):,.0f} events/s')
+    print(f'Peak memory ({n // 10} events): {measure_peak_memory(event_json, n // 10):,} bytes')
+    print(f'Peak memory ({n} events): {measure_peak_memory(event_json, n):,} bytes')
+    print(f'read_ics:             {measure_read_speed(events):,.0f} events/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Measures memory used by events (bytes per event).
+
+Events are deserialized from a generated fixture (same as in `serializers_benchmark.py`) and kept in memory.
+Memory is measured with `tracemalloc`, so it includes the events and all their sub-objects (attendees, reminders,
+datetimes, etc.), but not the fixture itself.
+
+As a baseline for the slotted models, events are also copied into "dict-backed" objects that keep the same
+attributes in their `__dict__` (as the models did before they used `__slots__`).
+
+Usage:
+    python benchmarks/memory_benchmark.py [number_of_events]
+"""
+import json
+import sys
+import tracemalloc
+from datetime import date
+
+from serializers_benchmark import make_events_json
+
+from gcsa.serializers.event_serializer import EventSerializer, LazyEventSerializer
+
+
+def measure(events_json, serializer):
+    events = json.loads(events_json)
+    tracemalloc.start()
+    objects = [serializer.to_object(event_json) for event_json in events]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / len(events)
+
+
+_dict_backed_types: dict = {}
+
+
+def to_dict_backed(value):
+    """Returns copy of the slotted object (and its sub-objects) that keeps the attributes in `__dict__`."""
+    if isinstance(value, list):
+        return [to_dict_backed(v) for v in value]
+    if isinstance(value, dict):
+        # Values of `Event.other` are shared with the resource, as in the deserialized event
+        return dict(value)
+    if isinstance(value, date):
+        # New object, as created by the deserialization
+        return value.replace()
+    slots = [name for cls in type(value).__mro__ for name in getattr(cls, '__slots__', ())]
+    if not slots:
+        return value
+    dict_backed_type = _dict_backed_types.setdefault(type(value), type(type(value).__name__, (), {}))
+    copy = dict_backed_type()
+    for name in slots:
+        if hasattr(value, name):
+            setattr(copy, name, to_dict_backed(getattr(value, name)))
+    return copy
+
+
+def measure_dict_backed(events_json):
+    events = [EventSerializer.to_object(event_json) for event_json in json.loads(events_json)]
+    tracemalloc.start()
+    objects = [to_dict_backed(event) for event in events]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / len(events)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events_json = make_events_json(n)
+
+    print(f'Events: {n}')
+    print(f'Dict-backed Event: {measure_dict_backed(events_json):,.0f} bytes/event')
+    print(f'Event:             {measure(events_json, EventSerializer):,.0f} bytes/event')
+    print(f'LazyEvent:         {measure(events_json, LazyEventSerializer):,.0f} bytes/event')
+
+
+if __name__ == '__main__':
+    main()
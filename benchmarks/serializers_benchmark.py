@@ -0,0 +1,67 @@
+"""Measures deserialization speed of events (events per second).
+
+Compares datetime parsing with `dateutil.parser.parse` (before) and `gcsa.util.date_time_util.parse_datetime` (after)
+on a generated fixture of events.
+
+Usage:
+    python benchmarks/serializers_benchmark.py [number_of_events]
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import dateutil.parser
+
+from gcsa.serializers.base_serializer import BaseSerializer
+from gcsa.serializers.event_serializer import EventSerializer
+
+
+def make_events_json(n):
+    start = datetime(2023, 1, 1, 9)
+    events = []
+    for i in range(n):
+        event_start = start + timedelta(hours=i)
+        events.append({
+            'id': f'event_id_{i}',
+            'summary': f'Event {i}',
+            'status': 'confirmed',
+            'created': '2022-12-01T10:15:30.000Z',
+            'updated': '2022-12-02T11:20:40.123Z',
+            'start': {'dateTime': event_start.isoformat() + '+01:00', 'timeZone': 'Europe/Prague'},
+            'end': {'dateTime': (event_start + timedelta(hours=1)).isoformat() + '+01:00',
+                    'timeZone': 'Europe/Prague'},
+            'attendees': [
+                {'email': f'attendee{j}@gmail.com', 'responseStatus': 'accepted'}
+                for j in range(3)
+            ],
+            'reminders': {'useDefault': True},
+        })
+    return json.dumps(events)
+
+
+def measure(events_json):
+    events = json.loads(events_json)
+    start = time.perf_counter()
+    for event_json in events:
+        EventSerializer.to_object(event_json)
+    return len(events) / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events_json = make_events_json(n)
+
+    with patch.object(BaseSerializer, '_get_datetime_from_string', staticmethod(dateutil.parser.parse)):
+        before = measure(events_json)
+    after = measure(events_json)
+
+    print(f'Events: {n}')
+    print(f'dateutil.parser.parse: {before:,.0f} events/s')
+    print(f'parse_datetime:        {after:,.0f} events/s')
+    print(f'Speedup:               {after / before:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class Resource(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self):
@@ -11,8 +11,11 @@ class ACLService(BaseService):
     def get_acl_rules(
             self,
             calendar_id: Optional[str] = None,
-            show_deleted: bool = False
-    ) -> Iterable[AccessControlRule]:
+            show_deleted: bool = False,
+            prefetch_pages: int = 0,
+            fields: Optional[Union[str, Iterable[str]]] = None,
+            raw: bool = False
+    ) -> Iterable[Union[AccessControlRule, dict]]:
         """Returns the rules in the access control list for the calendar.
 
         :param calendar_id:
@@ -22,6 +25,16 @@ class ACLService(BaseService):
         :param show_deleted:
                 Whether to include deleted ACLs in the result. Deleted ACLs are represented by role equal to "none".
                 Deleted ACLs will always be included if syncToken is provided. Optional. The default is False.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the rules of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param fields:
+                Fields of the rules to request (e.g. ``['id', 'role']``, or a string in the
+                `fields` parameter syntax, e.g. ``'id,role,scope(value)'``).
+                Only these fields are downloaded and set in the returned objects. Default: all fields.
+        :param raw:
+                Whether to return rules as dicts (resources as returned by the API) without converting them
+                to `AccessControlRule` objects. Faster if you don't need the objects. Default: False
 
         :return:
                 Iterable of `AccessControlRule` objects
@@ -29,10 +42,12 @@ class ACLService(BaseService):
         calendar_id = calendar_id or self.default_calendar
         yield from self._list_paginated(
             self.service.acl().list,
-            serializer_cls=ACLRuleSerializer,
+            serializer_cls=None if raw else ACLRuleSerializer,
+            prefetch_pages=prefetch_pages,
             calendarId=calendar_id,
             **{
                 'showDeleted': show_deleted,
+                **self._get_fields(fields, listing=True)
             }
         )
 
@@ -54,11 +69,11 @@ class ACLService(BaseService):
                 The corresponding `AccessControlRule` object
         """
         calendar_id = calendar_id or self.default_calendar
-        acl_rule_resource = self.service.acl().get(
+        request = self.service.acl().get(
             calendarId=calendar_id,
             ruleId=rule_id
-        ).execute()
-        return ACLRuleSerializer.to_object(acl_rule_resource)
+        )
+        return self._execute(request, ACLRuleSerializer.to_object)
 
     def add_acl_rule(
             self,
@@ -82,12 +97,12 @@ class ACLService(BaseService):
         """
         calendar_id = calendar_id or self.default_calendar
         body = ACLRuleSerializer.to_json(acl_rule)
-        acl_rule_json = self.service.acl().insert(
+        request = self.service.acl().insert(
             calendarId=calendar_id,
             body=body,
             sendNotifications=send_notifications
-        ).execute()
-        return ACLRuleSerializer.to_object(acl_rule_json)
+        )
+        return self._execute(request, ACLRuleSerializer.to_object)
 
     def update_acl_rule(
             self,
@@ -112,13 +127,13 @@ class ACLService(BaseService):
         calendar_id = calendar_id or self.default_calendar
         acl_id = self._get_resource_id(acl_rule)
         body = ACLRuleSerializer.to_json(acl_rule)
-        acl_json = self.service.acl().update(
+        request = self.service.acl().update(
             calendarId=calendar_id,
             ruleId=acl_id,
             body=body,
             sendNotifications=send_notifications
-        ).execute()
-        return ACLRuleSerializer.to_object(acl_json)
+        )
+        return self._execute(request, ACLRuleSerializer.to_object)
 
     def delete_acl_rule(
             self,
@@ -137,7 +152,8 @@ class ACLService(BaseService):
         calendar_id = calendar_id or self.default_calendar
         acl_id = self._get_resource_id(acl_rule)
 
-        self.service.acl().delete(
+        request = self.service.acl().delete(
             calendarId=calendar_id,
             ruleId=acl_id
-        ).execute()
+        )
+        self._execute(request)
@@ -1,8 +1,10 @@
+import json
 import logging
 import pickle
 import os.path
 import glob
 import webbrowser
+from functools import lru_cache
 from typing import List, Optional
 
 from googleapiclient import discovery
@@ -10,9 +12,27 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.auth.credentials import Credentials
 
+from gcsa._services.http_pool import HttpPool
+
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_discovery_document() -> Optional[dict]:
+    """Loads Calendar API discovery document shipped with google-api-python-client.
+
+    The document is read and parsed only once per process. Returns None if static discovery document
+    is not available (google-api-python-client<2.0).
+    """
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+    except ImportError:
+        return None
+
+    content = get_static_doc('calendar', 'v3')
+    return json.loads(content) if content else None
+
+
 class AuthenticatedService:
     """Handles authentication of the `GoogleCalendar`"""
 
@@ -29,7 +49,8 @@ class AuthenticatedService:
             authentication_flow_host: str = 'localhost',
             authentication_flow_port: int = 8080,
             authentication_flow_bind_addr: Optional[str] = None,
-            open_browser: Optional[bool] = None
+            open_browser: Optional[bool] = None,
+            http_pool_size: int = 10
     ):
         """
         Specify ``credentials`` to use in requests or ``credentials_path`` and ``token_path`` to get credentials from.
@@ -63,6 +84,9 @@ class AuthenticatedService:
                     - `True`: try opening the URL in the browser,
                       raise `webbrowser.Error` if runnable browser can not be located
                     - `False`: do not open URL in the browser.
+        :param http_pool_size:
+                Maximum number of HTTP connections (and concurrent requests) when the object is shared
+                between threads.
         """
 
         if credentials:
@@ -85,7 +109,17 @@ class AuthenticatedService:
                 open_browser
             )
 
-        self.service = discovery.build('calendar', 'v3', credentials=self.credentials)
+        self.service = self._build_service(self.credentials)
+        self._http_pool = HttpPool(self.credentials, size=http_pool_size)
+
+    @staticmethod
+    def _build_service(credentials: Credentials):
+        """Builds Calendar API resource from the cached discovery document,
+        so that no discovery document is fetched or parsed on construction."""
+        discovery_document = _get_discovery_document()
+        if discovery_document is None:
+            return discovery.build('calendar', 'v3', credentials=credentials)
+        return discovery.build_from_document(discovery_document, credentials=credentials)
 
     @staticmethod
     def _ensure_refreshed(
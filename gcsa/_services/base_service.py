@@ -1,11 +1,25 @@
-from typing import Callable, Type, Union, Optional
+import queue
+import threading
+from typing import Callable, Type, Union, Optional, Iterator, Iterable
 
 from gcsa._resource import Resource
 from gcsa._services.authentication import AuthenticatedService
+from gcsa.batch import BatchRequest
+from gcsa.rate_limit import RateLimiter
+from gcsa.retry import RetryPolicy
 
 
 class BaseService(AuthenticatedService):
-    def __init__(self, default_calendar, *args, **kwargs):
+    _batch: Optional[BatchRequest] = None
+
+    def __init__(
+            self,
+            default_calendar,
+            *args,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            **kwargs
+    ):
         """
         :param default_calendar:
                 Users email address or name/id of the calendar. Default: primary calendar of the user
@@ -15,31 +29,183 @@ class BaseService(AuthenticatedService):
 
                 To use a different calendar you need to specify its id.
                 Go to calendar's `settings and sharing` -> `Integrate calendar` -> `Calendar ID`.
+        :param retry_policy:
+                Policy for retrying failed requests. Default: no retries.
+        :param rate_limiter:
+                Rate limiter that throttles every request before it is sent. Default: no rate limiting.
         """
         super().__init__(*args, **kwargs)
         self.default_calendar = default_calendar
+        # Retries are opt-in. Policy with a single attempt still counts requests and failures
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.rate_limiter = rate_limiter
+
+    def batch(self, batch_size: int = BatchRequest.MAX_BATCH_SIZE) -> BatchRequest:
+        """Creates a batch request that groups multiple calls into batch HTTP requests.
+
+        Supports get/add/update/delete (and other single-resource) methods of events, calendars,
+        calendar list entries and access control rules.
+
+        .. code-block:: python
+
+            with gc.batch() as batch:
+                for event in events:
+                    batch.add_event(event)
+
+            events = batch.results
+
+        :param batch_size:
+                Maximum number of requests in a single batch HTTP request (up to 50).
+
+        :return:
+                :py:class:`~gcsa.batch.BatchRequest` object.
+        """
+        return BatchRequest(self, batch_size=batch_size)
+
+    def _execute(self, request, callback: Optional[Callable] = None, idempotent: Optional[bool] = None):
+        """Executes the request (using HTTP transport from the pool) and converts its response with `callback`.
+        Request is throttled by the `rate_limiter` and retried according to the `retry_policy`.
+
+        If called on the :py:class:`~gcsa.batch.BatchRequest`, adds the request to the batch instead and returns None.
+
+        :param idempotent:
+                Whether the request can be safely retried after the server error.
+                Default: all but POST requests are considered idempotent.
+        """
+        if idempotent is None:
+            idempotent = self._is_idempotent(request)
+
+        if self._batch is not None:
+            self._batch.add(request, callback, idempotent=idempotent)
+            return None
+
+        def execute():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            with self._http_pool.checkout() as http:
+                return request.execute(http=http)
+
+        response = self.retry_policy.execute(execute, idempotent=idempotent)
+        return callback(response) if callback else response
 
     @staticmethod
+    def _is_idempotent(request) -> bool:
+        return getattr(request, 'method', 'GET') != 'POST'
+
     def _list_paginated(
+            self,
             request_method: Callable,
             serializer_cls: Optional[Type] = None,
+            prefetch_pages: int = 0,
             **kwargs
     ):
-        page_token = None
-        while True:
-            response_json = request_method(
-                **kwargs,
-                pageToken=page_token
-            ).execute()
+        """Yields items from all the pages of the listing. Returns `nextSyncToken` of the last page (if any).
+
+        If `prefetch_pages` is positive, up to `prefetch_pages` following pages are requested in a background thread
+        while the items of the current page are being deserialized and consumed.
+        """
+        pages = self._list_pages(request_method, **kwargs)
+        if prefetch_pages > 0:
+            pages = self._prefetch(pages, prefetch_pages)
+
+        response_json: dict = {}
+        for response_json in pages:
             for item_json in response_json['items']:
                 if serializer_cls:
                     yield serializer_cls(item_json).get_object()
                 else:
                     yield item_json
+        return response_json.get('nextSyncToken')
+
+    def _list_pages(
+            self,
+            request_method: Callable,
+            **kwargs
+    ) -> Iterator[dict]:
+        """Yields responses for all the pages of the listing."""
+        page_token = None
+        while True:
+            response_json = self._execute(request_method(
+                **kwargs,
+                pageToken=page_token
+            ))
+            yield response_json
             page_token = response_json.get('nextPageToken')
             if not page_token:
                 break
 
+    @staticmethod
+    def _prefetch(
+            pages: Iterator[dict],
+            prefetch_pages: int
+    ) -> Iterator[dict]:
+        """Iterates over `pages` in a background thread keeping up to `prefetch_pages` pages ready in a queue.
+
+        The background thread stops if the returned generator is closed before all the pages are consumed.
+        """
+        stopped = threading.Event()
+        try:
+            yield from BaseService._start_prefetch(pages, prefetch_pages, stopped)
+        finally:
+            stopped.set()
+
+    @staticmethod
+    def _start_prefetch(
+            items: Iterator,
+            maxsize: int,
+            stopped: threading.Event
+    ) -> Iterator:
+        """Starts iterating over `items` in a background thread right away, keeping up to `maxsize` items ready
+        in a queue. Returns generator of the items from the queue.
+
+        The background thread stops when `stopped` is set.
+        """
+        items_queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        end_of_items = object()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    items_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch():
+            try:
+                for item in items:
+                    if not put((item, None)):
+                        return
+                put((end_of_items, None))
+            except Exception as e:
+                put((None, e))
+
+        threading.Thread(target=fetch, daemon=True).start()
+
+        def consume():
+            while True:
+                item, error = items_queue.get()
+                if error is not None:
+                    raise error
+                if item is end_of_items:
+                    break
+                yield item
+
+        return consume()
+
+    @staticmethod
+    def _get_fields(fields: Optional[Union[str, Iterable[str]]], listing: bool = False) -> dict:
+        """Returns `fields` API parameter (as kwargs) for the partial response with the requested fields of the
+        resource. For listings, adds the fields needed for the pagination."""
+        if fields is None:
+            return {}
+        if not isinstance(fields, str):
+            fields = ','.join(fields)
+        if listing:
+            fields = f'nextPageToken,nextSyncToken,items({fields})'
+        return {'fields': fields}
+
     @staticmethod
     def _get_resource_id(resource: Union[Resource, str]):
         """If `resource` is `Resource` returns its id.
@@ -12,8 +12,11 @@ class CalendarListService(BaseService):
             self,
             min_access_role: Optional[str] = None,
             show_deleted: bool = False,
-            show_hidden: bool = False
-    ) -> Iterable[CalendarListEntry]:
+            show_hidden: bool = False,
+            prefetch_pages: int = 0,
+            fields: Optional[Union[str, Iterable[str]]] = None,
+            raw: bool = False
+    ) -> Iterable[Union[CalendarListEntry, dict]]:
         """Returns the calendars on the user's calendar list.
 
         :param min_access_role:
@@ -23,16 +26,29 @@ class CalendarListService(BaseService):
                 Whether to include deleted calendar list entries in the result. The default is False.
         :param show_hidden:
                 Whether to show hidden entries. The default is False.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the entries of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param fields:
+                Fields of the calendar list entries to request (e.g. ``['id', 'summary']``, or a string in the
+                `fields` parameter syntax, e.g. ``'id,summary,defaultReminders(method)'``).
+                Only these fields are downloaded and set in the returned objects. Default: all fields.
+        :param raw:
+                Whether to return entries as dicts (resources as returned by the API) without converting
+                them to :py:class:`~gcsa.calendar.CalendarListEntry` objects. Faster if you don't need the objects.
+                Default: False
 
         :return:
                 Iterable of :py:class:`~gcsa.calendar.CalendarListEntry` objects.
         """
         yield from self._list_paginated(
             self.service.calendarList().list,
-            serializer_cls=CalendarListEntrySerializer,
+            serializer_cls=None if raw else CalendarListEntrySerializer,
+            prefetch_pages=prefetch_pages,
             minAccessRole=min_access_role,
             showDeleted=show_deleted,
             showHidden=show_hidden,
+            **self._get_fields(fields, listing=True)
         )
 
     def get_calendar_list_entry(
@@ -50,8 +66,8 @@ class CalendarListService(BaseService):
                 The corresponding :py:class:`~gcsa.calendar.CalendarListEntry` object.
         """
         calendar_id = calendar_id or self.default_calendar
-        calendar_resource = self.service.calendarList().get(calendarId=calendar_id).execute()
-        return CalendarListEntrySerializer.to_object(calendar_resource)
+        request = self.service.calendarList().get(calendarId=calendar_id)
+        return self._execute(request, CalendarListEntrySerializer.to_object)
 
     def add_calendar_list_entry(
             self,
@@ -74,11 +90,11 @@ class CalendarListService(BaseService):
             color_rgb_format = (calendar.foreground_color is not None) or (calendar.background_color is not None)
 
         body = CalendarListEntrySerializer.to_json(calendar)
-        calendar_json = self.service.calendarList().insert(
+        request = self.service.calendarList().insert(
             body=body,
             colorRgbFormat=color_rgb_format
-        ).execute()
-        return CalendarListEntrySerializer.to_object(calendar_json)
+        )
+        return self._execute(request, CalendarListEntrySerializer.to_object)
 
     def update_calendar_list_entry(
             self,
@@ -102,12 +118,12 @@ class CalendarListService(BaseService):
             color_rgb_format = calendar.foreground_color is not None or calendar.background_color is not None
 
         body = CalendarListEntrySerializer.to_json(calendar)
-        calendar_json = self.service.calendarList().update(
+        request = self.service.calendarList().update(
             calendarId=calendar_id,
             body=body,
             colorRgbFormat=color_rgb_format
-        ).execute()
-        return CalendarListEntrySerializer.to_object(calendar_json)
+        )
+        return self._execute(request, CalendarListEntrySerializer.to_object)
 
     def delete_calendar_list_entry(
             self,
@@ -120,4 +136,5 @@ class CalendarListService(BaseService):
                 with the set `calendar_id`.
         """
         calendar_id = self._get_resource_id(calendar)
-        self.service.calendarList().delete(calendarId=calendar_id).execute()
+        request = self.service.calendarList().delete(calendarId=calendar_id)
+        self._execute(request)
@@ -23,10 +23,10 @@ class CalendarsService(BaseService):
                 The corresponding :py:class:`~gcsa.calendar.Calendar` object.
         """
         calendar_id = calendar_id or self.default_calendar
-        calendar_resource = self.service.calendars().get(
+        request = self.service.calendars().get(
             calendarId=calendar_id
-        ).execute()
-        return CalendarSerializer.to_object(calendar_resource)
+        )
+        return self._execute(request, CalendarSerializer.to_object)
 
     def add_calendar(
             self,
@@ -40,10 +40,10 @@ class CalendarsService(BaseService):
                 Created calendar object with ID.
         """
         body = CalendarSerializer.to_json(calendar)
-        calendar_json = self.service.calendars().insert(
+        request = self.service.calendars().insert(
             body=body
-        ).execute()
-        return CalendarSerializer.to_object(calendar_json)
+        )
+        return self._execute(request, CalendarSerializer.to_object)
 
     def update_calendar(
             self,
@@ -59,11 +59,11 @@ class CalendarsService(BaseService):
         """
         calendar_id = self._get_resource_id(calendar)
         body = CalendarSerializer.to_json(calendar)
-        calendar_json = self.service.calendars().update(
+        request = self.service.calendars().update(
             calendarId=calendar_id,
             body=body
-        ).execute()
-        return CalendarSerializer.to_object(calendar_json)
+        )
+        return self._execute(request, CalendarSerializer.to_object)
 
     def delete_calendar(
             self,
@@ -77,7 +77,8 @@ class CalendarsService(BaseService):
                 Calendar's ID or :py:class:`~gcsa.calendar.Calendar` object with set `calendar_id`.
         """
         calendar_id = self._get_resource_id(calendar)
-        self.service.calendars().delete(calendarId=calendar_id).execute()
+        request = self.service.calendars().delete(calendarId=calendar_id)
+        self._execute(request)
 
     def clear_calendar(self):
         """Clears a **primary** calendar.
@@ -87,7 +88,8 @@ class CalendarsService(BaseService):
         You can use :py:meth:`~gcsa.google_calendar.GoogleCalendar.delete_event` method with the secondary calendar's ID
         to delete events from a secondary calendar.
         """
-        self.service.calendars().clear(calendarId='primary').execute()
+        request = self.service.calendars().clear(calendarId='primary')
+        self._execute(request, idempotent=True)
 
     def clear(self):
         """Kept for back-compatibility. Use :py:meth:`~gcsa.google_calendar.GoogleCalendar.clear_calendar` instead.
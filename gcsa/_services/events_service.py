@@ -1,14 +1,24 @@
-from datetime import date, datetime
-from typing import Union, Iterator, Iterable, Callable, Optional
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime, time
+from operator import attrgetter, itemgetter
+from typing import Union, Iterator, Iterable, Callable, Optional, List, Sequence, Type, Dict, cast
 
 from beautiful_date import BeautifulDate
 from dateutil.relativedelta import relativedelta
+from dateutil.tz import tzutc
+from googleapiclient.errors import HttpError
 from tzlocal import get_localzone_name
 
 from gcsa._services.base_service import BaseService
+from gcsa.bulk_import import BulkImportResult, ImportCheckpoint, generate_event_id
+from gcsa.cache import EventCache
 from gcsa.event import Event
-from gcsa.serializers.event_serializer import EventSerializer
-from gcsa.util.date_time_util import to_localized_iso
+from gcsa.frame import EventFrame
+from gcsa.serializers.event_serializer import EventSerializer, LazyEventSerializer
+from gcsa.sync import SyncState
+from gcsa.util.date_time_util import to_localized_iso, ensure_localisation, parse_datetime
 
 
 class SendUpdatesMode:
@@ -29,6 +39,32 @@ class EventsService(BaseService):
 
     _EVENTS_LIST_ORDERS = ("startTime", "updated")
 
+    def __init__(self, *args, event_cache: Optional[EventCache] = None, **kwargs):
+        """
+        :param event_cache:
+                Cache of the events (e.g. :py:class:`~gcsa.cache.LRUEventCache`). If specified,
+                :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_event` only downloads the event if it was
+                modified since it was cached.
+        """
+        super().__init__(*args, **kwargs)
+        self.event_cache = event_cache
+
+    def _cache_callback(self, calendar_id: str) -> Callable:
+        """Returns callback that stores received event in the `event_cache` and converts it to `Event`."""
+
+        def to_object(event_json):
+            if self.event_cache is not None:
+                self.event_cache.set(calendar_id, event_json['id'], event_json)
+            return EventSerializer.to_object(event_json)
+
+        return to_object
+
+    @staticmethod
+    def _get_event_serializer(raw: bool, lazy: bool) -> Optional[Type[EventSerializer]]:
+        if raw:
+            return None
+        return LazyEventSerializer if lazy else EventSerializer
+
     def _list_events(
             self,
             request_method: Callable,
@@ -36,8 +72,11 @@ class EventsService(BaseService):
             time_max: Union[date, datetime, BeautifulDate],
             timezone: str,
             calendar_id: str,
+            prefetch_pages: int = 0,
+            raw: bool = False,
+            lazy: bool = False,
             **kwargs
-    ) -> Iterable[Event]:
+    ) -> Iterable[Union[Event, dict]]:
         """Lists paginated events received from request_method."""
 
         time_min = time_min or datetime.now()
@@ -48,7 +87,8 @@ class EventsService(BaseService):
 
         yield from self._list_paginated(
             request_method,
-            serializer_cls=EventSerializer,
+            serializer_cls=self._get_event_serializer(raw, lazy),
+            prefetch_pages=prefetch_pages,
             calendarId=calendar_id,
             timeMin=time_min,
             timeMax=time_max,
@@ -64,8 +104,12 @@ class EventsService(BaseService):
             single_events: bool = False,
             query: Optional[str] = None,
             calendar_id: Optional[str] = None,
+            prefetch_pages: int = 0,
+            fields: Optional[Union[str, Iterable[str]]] = None,
+            raw: bool = False,
+            lazy: bool = False,
             **kwargs
-    ) -> Iterable[Event]:
+    ) -> Iterable[Union[Event, dict]]:
         """Lists events.
 
         :param time_min:
@@ -87,6 +131,19 @@ class EventsService(BaseService):
                 Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
                 To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
                 If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the events of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param fields:
+                Fields of the events to request (e.g. ``['id', 'start', 'end', 'status']``, or a string in the
+                `fields` parameter syntax, e.g. ``'id,start,attendees(email)'``).
+                Only these fields are downloaded and set in the returned objects. Default: all fields.
+        :param raw:
+                Whether to return events as dicts (resources as returned by the API) without converting them
+                to `Event` objects. Faster if you don't need the objects. Default: False
+        :param lazy:
+                Whether to return :py:class:`~gcsa.event.LazyEvent` objects that decode attendees, attachments,
+                reminders, conference solution, creator and organizer only on first access. Default: False
         :param kwargs:
                 Additional API parameters.
                 See https://developers.google.com/calendar/v3/reference/events/list#optional-parameters
@@ -105,14 +162,245 @@ class EventsService(BaseService):
             time_max=time_max,
             timezone=timezone,
             calendar_id=calendar_id,
+            prefetch_pages=prefetch_pages,
+            raw=raw,
+            lazy=lazy,
             **{
                 'singleEvents': single_events,
                 'orderBy': order_by,
                 'q': query,
+                **self._get_fields(fields, listing=True),
                 **kwargs
             }
         )
 
+    def get_events_frame(
+            self,
+            time_min: Optional[Union[date, datetime, BeautifulDate]] = None,
+            time_max: Optional[Union[date, datetime, BeautifulDate]] = None,
+            timezone: str = get_localzone_name(),
+            single_events: bool = False,
+            query: Optional[str] = None,
+            calendar_id: Optional[str] = None,
+            prefetch_pages: int = 0,
+            **kwargs
+    ) -> EventFrame:
+        """Lists events into the :py:class:`~gcsa.frame.EventFrame` - columnar representation for the bulk analysis.
+
+        Pages of the events are converted to the columns as they arrive, without creating `Event` objects.
+        Only the fields stored in the frame are requested.
+
+        :param time_min:
+                Staring date/datetime
+        :param time_max:
+                Ending date/datetime
+        :param timezone:
+                Timezone formatted as an IANA Time Zone Database name, e.g. "Europe/Zurich". By default,
+                the computers local timezone is used if it is configured. UTC is used otherwise.
+                Also used for the dates of all-day events in the frame.
+        :param single_events:
+                Whether to expand recurring events into instances and only return single one-off events and
+                instances of recurring events, but not the underlying recurring events themselves.
+        :param query:
+                Free text search terms to find events that match these terms in any field, except for
+                extended properties.
+        :param calendar_id:
+                Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
+                To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
+                If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the events of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param kwargs:
+                Additional API parameters.
+                See https://developers.google.com/calendar/v3/reference/events/list#optional-parameters
+
+        :return:
+                :py:class:`~gcsa.frame.EventFrame` with the events
+        """
+        calendar_id = calendar_id or self.default_calendar
+        events = self.get_events(
+            time_min=time_min,
+            time_max=time_max,
+            timezone=timezone,
+            single_events=single_events,
+            query=query,
+            calendar_id=calendar_id,
+            prefetch_pages=prefetch_pages,
+            fields=EventFrame.FIELDS,
+            raw=True,
+            **kwargs
+        )
+        return EventFrame.from_json(cast(Iterable[dict], events), calendar_id=calendar_id, timezone=timezone)
+
+    def get_events_parallel(
+            self,
+            time_min: Optional[Union[date, datetime, BeautifulDate]] = None,
+            time_max: Optional[Union[date, datetime, BeautifulDate]] = None,
+            order_by: Optional[str] = None,
+            timezone: str = get_localzone_name(),
+            single_events: bool = False,
+            query: Optional[str] = None,
+            calendar_id: Optional[str] = None,
+            shards: int = 4,
+            buffer_size: int = 500,
+            raw: bool = False,
+            lazy: bool = False,
+            **kwargs
+    ) -> Iterable[Union[Event, dict]]:
+        """Lists events like :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events`, but splits the time range
+        into `shards` equal sub-ranges that are listed concurrently.
+
+        Events are streamed: events of the first sub-range are returned as soon as they arrive, while the following
+        sub-ranges are listed in the background up to `buffer_size` events each.
+        Events that span multiple sub-ranges are only returned once. If `order_by` is specified,
+        events are returned in the requested order.
+
+        :param time_min:
+                Staring date/datetime
+        :param time_max:
+                Ending date/datetime
+        :param order_by:
+                Order of the events. Possible values: "startTime", "updated". Default is unspecified stable order.
+        :param timezone:
+                Timezone formatted as an IANA Time Zone Database name, e.g. "Europe/Zurich". By default,
+                the computers local timezone is used if it is configured. UTC is used otherwise.
+        :param single_events:
+                Whether to expand recurring events into instances and only return single one-off events and
+                instances of recurring events, but not the underlying recurring events themselves.
+        :param query:
+                Free text search terms to find events that match these terms in any field, except for
+                extended properties.
+        :param calendar_id:
+                Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
+                To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
+                If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param shards:
+                Number of sub-ranges (and concurrent requests) the time range is split into.
+        :param buffer_size:
+                Maximum number of events of each sub-range listed ahead of their consumption.
+        :param raw:
+                Whether to return events as dicts (resources as returned by the API) without converting them
+                to `Event` objects. Faster if you don't need the objects. Default: False
+        :param lazy:
+                Whether to return :py:class:`~gcsa.event.LazyEvent` objects that decode attendees, attachments,
+                reminders, conference solution, creator and organizer only on first access. Default: False
+        :param kwargs:
+                Additional API parameters.
+                See https://developers.google.com/calendar/v3/reference/events/list#optional-parameters
+
+        :return:
+                Iterable of `Event` objects
+        """
+        calendar_id = calendar_id or self.default_calendar
+        if not single_events and order_by == 'startTime':
+            raise ValueError(
+                '"startTime" ordering is only available when querying single events, i.e. single_events=True'
+            )
+        if shards < 1:
+            raise ValueError(f'"shards" must be a positive int. {shards} was provided.')
+
+        def ensure_datetime(d):
+            if not isinstance(d, datetime):
+                d = datetime.combine(d, time())
+            return ensure_localisation(d, timezone)
+
+        time_min = ensure_datetime(time_min or datetime.now())
+        time_max = ensure_datetime(time_max or time_min + relativedelta(years=1))
+        step = (time_max - time_min) / shards
+        boundaries = [time_min + i * step for i in range(shards)] + [time_max]
+
+        def list_shard(shard_min, shard_max):
+            return self._list_events(
+                self.service.events().list,
+                time_min=shard_min,
+                time_max=shard_max,
+                timezone=timezone,
+                calendar_id=calendar_id,
+                raw=raw,
+                lazy=lazy,
+                **{
+                    'singleEvents': single_events,
+                    'orderBy': order_by,
+                    'q': query,
+                    **kwargs
+                }
+            )
+
+        # Stops the background listing of all the shards if the generator is closed
+        stopped = threading.Event()
+        try:
+            shards_events = [
+                self._start_prefetch(list_shard(shard_min, shard_max), buffer_size, stopped)
+                for shard_min, shard_max in zip(boundaries, boundaries[1:])
+            ]
+            yield from self._merge_shards(shards_events, cast(List[datetime], boundaries), order_by, raw)
+        finally:
+            stopped.set()
+
+    @staticmethod
+    def _merge_shards(
+            shards_events: Sequence[Iterable],
+            boundaries: List[datetime],
+            order_by: Optional[str],
+            raw: bool = False
+    ) -> Iterator:
+        """Merges events of consecutive time ranges dropping duplicates (events that span multiple ranges).
+
+        Shards are consumed lazily one by one (or all at once for "updated" order). Events in each shard are
+        expected to be in `order_by` order. Event spanning multiple ranges is first returned for the earliest range,
+        which is the right position for "startTime" order.
+        If `raw`, events are dicts (RFC 3339 UTC "updated" strings are ordered as the datetimes).
+
+        Only ids that can repeat are remembered: ids of the events that end near or after the end of their range
+        or, for "updated" order, ids of the events with the same "updated" (copies of an event are adjacent).
+        """
+        get = itemgetter if raw else attrgetter
+        get_id = get('id')
+
+        if order_by == 'updated':
+            get_updated = get('updated')
+            updated = None
+            seen_ids: set = set()
+            for event in heapq.merge(*shards_events, key=get_updated):
+                if get_updated(event) != updated:
+                    updated = get_updated(event)
+                    seen_ids.clear()
+                event_id = get_id(event)
+                if event_id not in seen_ids:
+                    seen_ids.add(event_id)
+                    yield event
+            return
+
+        get_end = (lambda e: e.get('end')) if raw else attrgetter('end')
+        spanning_ids = set()
+        last_shard = len(shards_events) - 1
+        for shard_index, shard_events in enumerate(shards_events):
+            # A day of margin covers all-day events whose end is a date in unknown timezone
+            threshold = boundaries[shard_index + 1].timestamp() - 24 * 60 * 60
+            for event in shard_events:
+                event_id = get_id(event)
+                if event_id in spanning_ids:
+                    continue
+                if shard_index < last_shard and EventsService._get_end_timestamp(get_end(event)) > threshold:
+                    spanning_ids.add(event_id)
+                yield event
+
+    @staticmethod
+    def _get_end_timestamp(end: Union[date, datetime, dict, None]) -> float:
+        """Returns UNIX timestamp of the event's end. Dates are taken as UTC midnight.
+        Unknown end (e.g. of a cancelled event) is taken as infinite."""
+        if isinstance(end, dict):
+            end = end.get('dateTime') or end.get('date')
+            end = parse_datetime(end) if end else None
+        if end is None:
+            return float('inf')
+        if not isinstance(end, datetime):
+            end = datetime(end.year, end.month, end.day, tzinfo=tzutc())
+        elif end.tzinfo is None:
+            end = end.replace(tzinfo=tzutc())
+        return end.timestamp()
+
     def get_instances(
             self,
             recurring_event: Union[Event, str],
@@ -120,8 +408,11 @@ class EventsService(BaseService):
             time_max: Union[date, datetime, BeautifulDate] = None,
             timezone: str = get_localzone_name(),
             calendar_id: Optional[str] = None,
+            prefetch_pages: int = 0,
+            raw: bool = False,
+            lazy: bool = False,
             **kwargs
-    ) -> Iterable[Event]:
+    ) -> Iterable[Union[Event, dict]]:
         """Lists instances of recurring event
 
         :param recurring_event:
@@ -137,6 +428,15 @@ class EventsService(BaseService):
                 Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
                 To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
                 If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the events of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param raw:
+                Whether to return instances as dicts (resources as returned by the API) without converting them
+                to `Event` objects. Faster if you don't need the objects. Default: False
+        :param lazy:
+                Whether to return :py:class:`~gcsa.event.LazyEvent` objects that decode attendees, attachments,
+                reminders, conference solution, creator and organizer only on first access. Default: False
         :param kwargs:
                 Additional API parameters.
                 See https://developers.google.com/calendar/v3/reference/events/instances#optional-parameters
@@ -156,14 +456,90 @@ class EventsService(BaseService):
             time_max=time_max,
             timezone=timezone,
             calendar_id=calendar_id,
+            prefetch_pages=prefetch_pages,
+            raw=raw,
+            lazy=lazy,
             **{
                 'eventId': event_id,
                 **kwargs
             }
         )
 
+    def sync_events(
+            self,
+            sync_state: SyncState,
+            single_events: bool = False,
+            calendar_id: Optional[str] = None,
+            prefetch_pages: int = 0,
+            raw: bool = False,
+            lazy: bool = False,
+            **kwargs
+    ) -> Iterable[Union[Event, dict]]:
+        """Lists events that have been created, updated or deleted since the previous synchronization.
+
+        If `sync_state` doesn't have a sync token (first synchronization), all the events of the calendar are listed
+        (full synchronization). Once all the events are retrieved, the new sync token is stored in `sync_state`
+        and the next call returns only the events changed since then. Deleted events are listed with
+        ``event.other['status'] == 'cancelled'``.
+
+        If the server reports that the sync token is no longer valid (410 Gone), the token is dropped and
+        a full synchronization is performed instead. Whether the last synchronization was a full one
+        is stored in `sync_state.full_sync`.
+
+        .. note:: The sync token is only updated after all the events have been iterated over.
+
+        :param sync_state:
+                :py:class:`~gcsa.sync.SyncState` object that stores the sync token between calls.
+        :param single_events:
+                Whether to expand recurring events into instances and only return single one-off events and
+                instances of recurring events, but not the underlying recurring events themselves.
+                Has to be the same for all the synchronizations with the same `sync_state`.
+        :param calendar_id:
+                Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
+                To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
+                If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param prefetch_pages:
+                Number of pages to request in advance in a background thread while the events of the current page
+                are being processed. Default is 0 (next page is requested after the current one is consumed).
+        :param raw:
+                Whether to return events as dicts (resources as returned by the API) without converting them
+                to `Event` objects. Faster if you don't need the objects. Default: False
+        :param lazy:
+                Whether to return :py:class:`~gcsa.event.LazyEvent` objects that decode attendees, attachments,
+                reminders, conference solution, creator and organizer only on first access. Default: False
+        :param kwargs:
+                Additional API parameters.
+                See https://developers.google.com/calendar/v3/reference/events/list#optional-parameters
+                Note that `timeMin`, `timeMax`, `orderBy`, `q` and `updatedMin` can not be used with sync token.
+
+        :return:
+                Iterable of `Event` objects
+        """
+        calendar_id = calendar_id or self.default_calendar
+
+        def list_events():
+            sync_state.full_sync = sync_state.sync_token is None
+            return self._list_paginated(
+                self.service.events().list,
+                serializer_cls=self._get_event_serializer(raw, lazy),
+                prefetch_pages=prefetch_pages,
+                calendarId=calendar_id,
+                syncToken=sync_state.sync_token,
+                singleEvents=single_events,
+                **kwargs
+            )
+
+        try:
+            sync_state.sync_token = yield from list_events()
+        except HttpError as e:
+            if e.resp.status != 410 or sync_state.sync_token is None:
+                raise
+            # Sync token has expired or was invalidated by the server
+            sync_state.sync_token = None
+            sync_state.sync_token = yield from list_events()
+
     def __iter__(self) -> Iterator[Event]:
-        return iter(self.get_events())
+        return iter(cast(Iterable[Event], self.get_events()))
 
     def __getitem__(self, r):
         if isinstance(r, slice):
@@ -188,6 +564,7 @@ class EventsService(BaseService):
             self,
             event_id: str,
             calendar_id: Optional[str] = None,
+            fields: Optional[Union[str, Iterable[str]]] = None,
             **kwargs
     ) -> Event:
         """Returns the event with the corresponding event_id.
@@ -201,17 +578,34 @@ class EventsService(BaseService):
                 Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
                 To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
                 If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param fields:
+                Fields of the event to request (e.g. ``['id', 'start', 'end', 'status']``, or a string in the
+                `fields` parameter syntax, e.g. ``'id,start,attendees(email)'``).
+                Only these fields are downloaded and set in the returned objects. Default: all fields.
 
         :return:
                 The corresponding event object.
         """
         calendar_id = calendar_id or self.default_calendar
-        event_resource = self.service.events().get(
+        kwargs.update(self._get_fields(fields))
+        request = self.service.events().get(
             calendarId=calendar_id,
             eventId=event_id,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(event_resource)
+        )
+        # Additional parameters (and partial responses) change the representation of the event, so it is not cached
+        if self.event_cache is None or self._batch is not None or kwargs:
+            return self._execute(request, EventSerializer.to_object)
+
+        cached_event_json = self.event_cache.get(calendar_id, event_id)
+        if cached_event_json is not None and 'etag' in cached_event_json:
+            request.headers['If-None-Match'] = cached_event_json['etag']
+        try:
+            return self._execute(request, self._cache_callback(calendar_id))
+        except HttpError as e:
+            if e.resp.status == 304 and cached_event_json is not None:
+                return EventSerializer.to_object(cached_event_json)
+            raise
 
     def add_event(
             self,
@@ -240,14 +634,15 @@ class EventsService(BaseService):
         """
         calendar_id = calendar_id or self.default_calendar
         body = EventSerializer.to_json(event)
-        event_json = self.service.events().insert(
+        request = self.service.events().insert(
             calendarId=calendar_id,
             body=body,
             conferenceDataVersion=1,
             sendUpdates=send_updates,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(event_json)
+        )
+        # Insert with client-supplied id can't create a duplicate
+        return self._execute(request, self._cache_callback(calendar_id), idempotent=event.id is not None)
 
     def add_quick_event(
             self,
@@ -278,13 +673,13 @@ class EventsService(BaseService):
                 Created event object with id.
         """
         calendar_id = calendar_id or self.default_calendar
-        event_json = self.service.events().quickAdd(
+        request = self.service.events().quickAdd(
             calendarId=calendar_id,
             text=event_string,
             sendUpdates=send_updates,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(event_json)
+        )
+        return self._execute(request, self._cache_callback(calendar_id))
 
     def update_event(
             self,
@@ -314,15 +709,15 @@ class EventsService(BaseService):
         calendar_id = calendar_id or self.default_calendar
         event_id = self._get_resource_id(event)
         body = EventSerializer.to_json(event)
-        event_json = self.service.events().update(
+        request = self.service.events().update(
             calendarId=calendar_id,
             eventId=event_id,
             body=body,
             conferenceDataVersion=1,
             sendUpdates=send_updates,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(event_json)
+        )
+        return self._execute(request, self._cache_callback(calendar_id))
 
     def import_event(
             self,
@@ -349,13 +744,127 @@ class EventsService(BaseService):
         """
         calendar_id = calendar_id or self.default_calendar
         body = EventSerializer.to_json(event)
-        event_json = self.service.events().import_(
+        request = self.service.events().import_(
             calendarId=calendar_id,
             body=body,
             conferenceDataVersion=1,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(event_json)
+        )
+        # Imported events are identified by iCalUID
+        return self._execute(request, self._cache_callback(calendar_id), idempotent=True)
+
+    def bulk_import(
+            self,
+            events: Iterable[Union[Event, dict]],
+            calendar_id: Optional[str] = None,
+            *,
+            concurrency: int = 8,
+            checkpoint_path: Optional[str] = None,
+            **kwargs
+    ) -> BulkImportResult:
+        """Imports a stream of events in the calendar (see :py:meth:`import_event`) concurrently.
+
+        Events without id get a deterministic one (see :py:func:`~gcsa.bulk_import.generate_event_id`) and
+        events without "iCalUID" get one derived from the id, so the import of the same events can be repeated.
+        Events are consumed from `events` lazily and at most ``2 * concurrency`` of them are in flight at a time,
+        so the memory doesn't grow with the number of imported events.
+
+        If `checkpoint_path` is specified, ids of the succeeded events are appended to this file. Events that are
+        already recorded there are skipped, so the interrupted import can be restarted with the same arguments
+        and continues where it stopped. Event that already exists in the calendar (409 response) counts as
+        succeeded. Failed events are collected in the result and retried by the next run.
+
+        .. code-block:: python
+
+            result = gc.bulk_import(read_legacy_events(), concurrency=16, checkpoint_path='import.checkpoint')
+
+        :param events:
+                Iterable of `Event` objects or event resources (dicts).
+        :param calendar_id:
+                Calendar identifier. Default is `default_calendar` specified in `GoogleCalendar`.
+                To retrieve calendar IDs call the :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_calendar_list`.
+                If you want to access the primary calendar of the currently logged-in user, use the "primary" keyword.
+        :param concurrency:
+                Number of concurrent requests.
+        :param checkpoint_path:
+                Path to the file that records progress of the import
+                (see :py:class:`~gcsa.bulk_import.ImportCheckpoint`).
+        :param kwargs:
+                Additional API parameters.
+                See https://developers.google.com/calendar/v3/reference/events/import#optional-parameters
+
+        :return:
+                :py:class:`~gcsa.bulk_import.BulkImportResult` with numbers of imported, duplicate and skipped events
+                and errors of the failed ones.
+        """
+        calendar_id = calendar_id or self.default_calendar
+        if concurrency < 1:
+            raise ValueError(f'"concurrency" must be a positive int. {concurrency} was provided.')
+
+        result = BulkImportResult()
+        checkpoint = ImportCheckpoint(checkpoint_path) if checkpoint_path is not None else None
+        # Event ids by the futures of their import
+        in_flight: Dict[Future, str] = {}
+
+        def import_event(body):
+            request = self.service.events().import_(
+                calendarId=calendar_id,
+                body=body,
+                conferenceDataVersion=1,
+                **kwargs
+            )
+            try:
+                self._execute(request, idempotent=True)
+            except HttpError as e:
+                if e.resp.status != 409:
+                    raise
+                return False
+            return True
+
+        def process(done):
+            for future in done:
+                event_id = in_flight.pop(future)
+                try:
+                    imported = future.result()
+                except Exception as e:
+                    # Including connection errors that persisted after the retries
+                    result.failed[event_id] = e
+                    continue
+                if imported:
+                    result.imported += 1
+                else:
+                    result.duplicates += 1
+                if checkpoint is not None:
+                    checkpoint.add(event_id)
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for event in events:
+                    body = self._get_import_body(event)
+                    if checkpoint is not None and body['id'] in checkpoint:
+                        result.skipped += 1
+                        continue
+
+                    if len(in_flight) >= 2 * concurrency:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        process(done)
+                    in_flight[executor.submit(import_event, body)] = body['id']
+
+                process(wait(in_flight).done)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        return result
+
+    @staticmethod
+    def _get_import_body(event: Union[Event, dict]) -> dict:
+        """Returns resource of the event with (generated if missing) "id" and "iCalUID"."""
+        body = EventSerializer.to_json(event) if isinstance(event, Event) else dict(event)
+        if not body.get('id'):
+            body['id'] = generate_event_id(body)
+        if not body.get('iCalUID'):
+            body['iCalUID'] = body['id'] + '@gcsa'
+        return body
 
     def move_event(
             self,
@@ -387,14 +896,18 @@ class EventsService(BaseService):
         """
         source_calendar_id = source_calendar_id or self.default_calendar
         event_id = self._get_resource_id(event)
-        moved_event_json = self.service.events().move(
+        request = self.service.events().move(
             calendarId=source_calendar_id,
             eventId=event_id,
             destination=destination_calendar_id,
             sendUpdates=send_updates,
             **kwargs
-        ).execute()
-        return EventSerializer.to_object(moved_event_json)
+        )
+        if self.event_cache is not None:
+            self.event_cache.delete(source_calendar_id, event_id)
+        # Not retried after the server error: the event could have been moved, so that the retry would fail
+        # with a misleading "not found" from the source calendar
+        return self._execute(request, self._cache_callback(destination_calendar_id), idempotent=False)
 
     def delete_event(
             self,
@@ -421,9 +934,12 @@ class EventsService(BaseService):
         calendar_id = calendar_id or self.default_calendar
         event_id = self._get_resource_id(event)
 
-        self.service.events().delete(
+        request = self.service.events().delete(
             calendarId=calendar_id,
             eventId=event_id,
             sendUpdates=send_updates,
             **kwargs
-        ).execute()
+        )
+        if self.event_cache is not None:
+            self.event_cache.delete(calendar_id, event_id)
+        self._execute(request)
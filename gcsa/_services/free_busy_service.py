@@ -1,17 +1,23 @@
-from datetime import date, datetime
-from typing import Union, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import Union, List, Optional, Iterable, Tuple, Dict, Iterator, cast
 
 from beautiful_date import BeautifulDate
 from dateutil.relativedelta import relativedelta
+from dateutil.tz import gettz
 from tzlocal import get_localzone_name
 
 from gcsa._services.base_service import BaseService
-from gcsa.free_busy import FreeBusy, FreeBusyQueryError
+from gcsa.free_busy import FreeBusy, FreeBusyQueryError, BusyIndex, TimeSlot
+from gcsa.person import Person
 from gcsa.serializers.free_busy_serializer import FreeBusySerializer
-from gcsa.util.date_time_util import to_localized_iso
+from gcsa.util.date_time_util import to_localized_iso, ensure_localisation
 
 
 class FreeBusyService(BaseService):
+    #: Maximum number of calendars for which free/busy information is provided in a single query
+    MAX_CALENDARS_PER_QUERY = 50
+
     def get_free_busy(
             self,
             resource_ids: Optional[Union[str, List[str]]] = None,
@@ -57,15 +63,243 @@ class FreeBusyService(BaseService):
         time_min = time_min or datetime.now()
         time_max = time_max or time_min + relativedelta(weeks=2)
 
-        time_min = to_localized_iso(time_min, timezone)
-        time_max = to_localized_iso(time_max, timezone)
-
         if resource_ids is None:
             resource_ids = [self.default_calendar]
         elif not isinstance(resource_ids, (list, tuple, set)):
             resource_ids = [resource_ids]
 
-        body = {
+        body = self._get_query_body(resource_ids, to_localized_iso(time_min, timezone),
+                                    to_localized_iso(time_max, timezone), timezone,
+                                    group_expansion_max, calendar_expansion_max)
+
+        # Query is sent with POST, but doesn't modify anything
+        free_busy_json = self._execute(self.service.freebusy().query(body=body), idempotent=True)
+        free_busy = FreeBusySerializer.to_object(free_busy_json)
+        if not ignore_errors and (free_busy.groups_errors or free_busy.calendars_errors):
+            raise FreeBusyQueryError(groups_errors=free_busy.groups_errors,
+                                     calendars_errors=free_busy.calendars_errors)
+
+        return free_busy
+
+    def find_free_slots(
+            self,
+            attendees: Iterable[Union[str, Person]],
+            duration: Union[timedelta, relativedelta],
+            *,
+            time_min: Optional[Union[date, datetime, BeautifulDate]] = None,
+            time_max: Optional[Union[date, datetime, BeautifulDate]] = None,
+            working_hours: Optional[Tuple[time, time]] = None,
+            working_days: Optional[Iterable[int]] = None,
+            step: Union[timedelta, relativedelta] = timedelta(minutes=15),
+            max_results: Optional[int] = 10,
+            timezone: str = get_localzone_name(),
+            concurrency: int = 4,
+            ignore_errors: bool = False
+    ) -> List[TimeSlot]:
+        """Finds time slots of the given duration when the attendees are free.
+
+        Unlike :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_free_busy`, works for any number of attendees:
+        calendars and groups are queried in shards of :py:attr:`MAX_CALENDARS_PER_QUERY` concurrently.
+        Members of the groups that didn't fit into the query of the group are queried in the following shards.
+        Each calendar is queried (and counted as an attendee) only once, even if it is a member of multiple groups.
+
+        Slots are ranked by the number of conflicting attendees (calendars that are busy during the slot),
+        then by the start. If there are enough slots when everyone is free, only those are returned.
+
+        .. code-block:: python
+
+            slots = gc.find_free_slots(
+                attendees=['all-hands@company.com', 'ceo@company.com'],
+                duration=1 * hours,
+                time_min=D.today(),
+                time_max=D.today() + 7 * days,
+                working_hours=(time(9), time(17)),
+                working_days=[0, 1, 2, 3, 4]
+            )
+            for start, end, conflicts in slots:
+                print(start, end, len(conflicts))
+
+        :param attendees:
+                Identifiers of calendars and/or groups (e.g. email addresses) or
+                :py:class:`~gcsa.attendee.Attendee` objects.
+        :param duration:
+                Duration of the slot.
+        :param time_min:
+                The start of the interval for the search. Default is now.
+        :param time_max:
+                The end of the interval for the search. Default is two weeks after `time_min`.
+        :param working_hours:
+                Tuple of the start and end time of the day (in the `timezone`) that slots have to fit in.
+                Default is the whole day.
+        :param working_days:
+                Days of the week when slots can start (0 is Monday, 6 is Sunday). Default is any day.
+        :param step:
+                Distance between starts of the candidate slots. Default is 15 minutes.
+        :param max_results:
+                Maximum number of returned slots. None to return all the candidate slots.
+        :param timezone:
+                Timezone formatted as an IANA Time Zone Database name, e.g. "Europe/Zurich". By default,
+                the computers local timezone is used if it is configured. UTC is used otherwise.
+        :param concurrency:
+                Maximum number of concurrent queries.
+        :param ignore_errors:
+                Whether errors related to calendars and/or groups should be ignored (such attendees are
+                considered free). If `False` :py:class:`~gcsa.free_busy.FreeBusyQueryError` is raised in case
+                of query related errors. Default is `False`.
+
+        :return:
+                List of :py:class:`~gcsa.free_busy.TimeSlot` objects.
+        """
+        if concurrency < 1:
+            raise ValueError(f'"concurrency" must be a positive int. {concurrency} was provided.')
+
+        def ensure_datetime(d):
+            if not isinstance(d, datetime):
+                d = datetime.combine(d, time())
+            return ensure_localisation(d, timezone)
+
+        range_start: datetime = ensure_datetime(time_min or datetime.now())
+        range_end: datetime = ensure_datetime(time_max or range_start + relativedelta(weeks=2))
+        if range_start + duration <= range_start or range_start + step <= range_start:
+            raise ValueError('"duration" and "step" must be positive.')
+
+        resource_ids = list(dict.fromkeys(cast(str, a.email) if isinstance(a, Person) else a for a in attendees))
+        index, calendar_ids, groups_errors, calendars_errors = self._query_busy_index(
+            resource_ids, range_start, range_end, timezone, concurrency
+        )
+        if not ignore_errors and (groups_errors or calendars_errors):
+            raise FreeBusyQueryError(groups_errors=groups_errors, calendars_errors=calendars_errors)
+
+        # Busy time of all the attendees merged, to find slots when everyone is free without checking each attendee
+        merged = BusyIndex(timezone=timezone)
+        merged.add_busy('', index.busy_ranges(calendar_ids, range_start, range_end))
+
+        free_slots = []
+        busy_slots = []
+        for start in self._get_slot_starts(range_start, range_end, duration, step, working_hours, working_days,
+                                           timezone):
+            end = start + duration
+            if merged.busy_seconds('', start, end) == 0:
+                free_slots.append(TimeSlot(start, end, ()))
+                if max_results is not None and len(free_slots) >= max_results:
+                    return free_slots
+            else:
+                busy_slots.append((start, end))
+
+        slots = free_slots + sorted(
+            (
+                TimeSlot(start, end, tuple(c for c in calendar_ids if index.busy_seconds(c, start, end)))
+                for start, end in busy_slots
+            ),
+            key=lambda slot: len(slot.conflicts)
+        )
+        return slots[:max_results] if max_results is not None else slots
+
+    def _query_busy_index(
+            self,
+            resource_ids: List[str],
+            time_min: datetime,
+            time_max: datetime,
+            timezone: str,
+            concurrency: int
+    ) -> Tuple[BusyIndex, List[str], Dict, Dict]:
+        """Queries free/busy information of any number of calendars and groups in shards.
+
+        :return:
+                Index of the busy time, identifiers of all the calendars (groups replaced by their members,
+                without duplicates), groups errors and calendars errors.
+        """
+        time_min_iso = to_localized_iso(time_min, timezone)
+        time_max_iso = to_localized_iso(time_max, timezone)
+
+        def query(shard):
+            body = self._get_query_body(shard, time_min_iso, time_max_iso, timezone,
+                                        group_expansion_max=100, calendar_expansion_max=self.MAX_CALENDARS_PER_QUERY)
+            return self._execute(self.service.freebusy().query(body=body), idempotent=True)
+
+        index = BusyIndex(timezone=timezone)
+        calendar_ids: Dict[str, None] = {}  # ordered set
+        groups_errors = {}
+        calendars_errors = {}
+        retried = set()
+        pending = resource_ids
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while pending:
+                shards = [pending[i:i + self.MAX_CALENDARS_PER_QUERY]
+                          for i in range(0, len(pending), self.MAX_CALENDARS_PER_QUERY)]
+                for response in executor.map(query, shards):
+                    for group_id, group in response.get('groups', {}).items():
+                        if group.get('errors'):
+                            groups_errors[group_id] = group['errors']
+                        calendar_ids.update(dict.fromkeys(group.get('calendars', ())))
+
+                    for calendar_id, calendar in response.get('calendars', {}).items():
+                        errors = calendar.get('errors')
+                        if errors and all(e.get('reason') == 'tooManyCalendarsRequested' for e in errors):
+                            # Didn't fit into the query, will be queried again in the following shards
+                            calendar_ids[calendar_id] = None
+                        elif errors:
+                            calendars_errors[calendar_id] = errors
+                        elif calendar_id not in index:
+                            calendar_ids[calendar_id] = None
+                            index.add_busy(calendar_id, map(FreeBusySerializer._make_time_range, calendar['busy']))
+
+                # Members of the groups that weren't returned with the group and calendars that didn't fit
+                # into the query are queried (once) in the following shards
+                pending = [c for c in calendar_ids
+                           if c not in index and c not in calendars_errors and c not in retried]
+                retried.update(pending)
+
+        for calendar_id in calendar_ids:
+            if calendar_id not in index and calendar_id not in calendars_errors:
+                calendars_errors[calendar_id] = [{'domain': 'global', 'reason': 'tooManyCalendarsRequested'}]
+        calendar_ids = {c: None for c in calendar_ids if c not in calendars_errors}
+        return index, list(calendar_ids), groups_errors, calendars_errors
+
+    @staticmethod
+    def _get_slot_starts(
+            time_min: datetime,
+            time_max: datetime,
+            duration: Union[timedelta, relativedelta],
+            step: Union[timedelta, relativedelta],
+            working_hours: Optional[Tuple[time, time]],
+            working_days: Optional[Iterable[int]],
+            timezone: str
+    ) -> Iterator[datetime]:
+        """Generates starts of the candidate slots within the range, working hours and working days."""
+        tz = gettz(timezone)
+        working_days = set(working_days) if working_days is not None else None
+
+        if working_hours is None:
+            start = time_min
+            while start + duration <= time_max:
+                if working_days is None or start.astimezone(tz).weekday() in working_days:
+                    yield start
+                start += step
+            return
+
+        day = time_min.astimezone(tz).date()
+        last_day = time_max.astimezone(tz).date()
+        while day <= last_day:
+            if working_days is None or day.weekday() in working_days:
+                start = datetime.combine(day, working_hours[0], tzinfo=tz)
+                day_end = datetime.combine(day, working_hours[1], tzinfo=tz)
+                while start + duration <= day_end and start + duration <= time_max:
+                    if start >= time_min:
+                        yield start
+                    start += step
+            day += timedelta(days=1)
+
+    @staticmethod
+    def _get_query_body(
+            resource_ids: Iterable[str],
+            time_min: str,
+            time_max: str,
+            timezone: str,
+            group_expansion_max: Optional[int],
+            calendar_expansion_max: Optional[int]
+    ) -> dict:
+        return {
             "timeMin": time_min,
             "timeMax": time_max,
             "timeZone": timezone,
@@ -77,11 +311,3 @@ class FreeBusyService(BaseService):
                 } for r_id in resource_ids
             ]
         }
-
-        free_busy_json = self.service.freebusy().query(body=body).execute()
-        free_busy = FreeBusySerializer.to_object(free_busy_json)
-        if not ignore_errors and (free_busy.groups_errors or free_busy.calendars_errors):
-            raise FreeBusyQueryError(groups_errors=free_busy.groups_errors,
-                                     calendars_errors=free_busy.calendars_errors)
-
-        return free_busy
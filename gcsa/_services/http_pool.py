@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager
+from typing import List, Iterator
+
+import google_auth_httplib2
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import Request
+from googleapiclient.http import build_http
+
+
+class HttpPool:
+    """Pool of authorized HTTP transports.
+
+    `httplib2.Http` is not thread-safe, so each request checks out a transport from the pool for the time
+    of its execution. Transports share the credentials, which are refreshed under the lock, so that
+    concurrent requests don't refresh the token multiple times.
+    """
+
+    def __init__(self, credentials: Credentials, size: int = 10):
+        """
+        :param credentials:
+                Credentials shared by all the transports.
+        :param size:
+                Maximum number of transports, i.e. maximum number of concurrent requests.
+                Threads that request a transport when all of them are in use wait until one is returned.
+        """
+        if size < 1:
+            raise ValueError(f'"size" must be a positive int. {size} was provided.')
+        self.credentials = credentials
+        self.size = size
+        self._available: List = []
+        self._created = 0
+        self._condition = threading.Condition()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def created(self) -> int:
+        """Number of transports created so far."""
+        return self._created
+
+    @contextmanager
+    def checkout(self) -> Iterator:
+        """Context manager that provides a transport for exclusive use by the current thread."""
+        self._ensure_refreshed()
+        http = self._acquire()
+        try:
+            yield http
+        finally:
+            self._release(http)
+
+    def _acquire(self):
+        with self._condition:
+            while not self._available and self._created >= self.size:
+                self._condition.wait()
+            if self._available:
+                return self._available.pop()
+            self._created += 1
+        try:
+            return google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+        except BaseException:
+            # Frees the slot, so that the waiting threads can create the transport instead
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, http):
+        with self._condition:
+            self._available.append(http)
+            self._condition.notify()
+
+    def _ensure_refreshed(self):
+        """Refreshes expired credentials once for all the waiting threads."""
+        if self.credentials.valid:
+            return
+        with self._refresh_lock:
+            if not self.credentials.valid and self.credentials.expired:
+                self.credentials.refresh(Request())
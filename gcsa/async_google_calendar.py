@@ -0,0 +1,178 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, Callable
+
+from google.oauth2.credentials import Credentials
+
+from .cache import EventCache
+from .rate_limit import RateLimiter
+from .google_calendar import GoogleCalendar
+from .retry import RetryPolicy
+
+
+def _async_method(name: str) -> Callable:
+    """Creates coroutine method that calls `GoogleCalendar` method with the given name in a worker thread."""
+
+    async def method(self, *args, **kwargs):
+        return await self._run(lambda calendar: getattr(calendar, name)(*args, **kwargs))
+
+    method.__name__ = name
+    method.__qualname__ = 'AsyncGoogleCalendar.' + name
+    method.__doc__ = getattr(GoogleCalendar, name).__doc__
+    return method
+
+
+def _async_iterator_method(name: str) -> Callable:
+    """Creates method that returns async iterator over the results of the `GoogleCalendar` listing method
+    with the given name. Items are retrieved in a worker thread in chunks."""
+
+    async def method(self, *args, **kwargs):
+        items = getattr(self.calendar, name)(*args, **kwargs)
+        while True:
+            chunk = await self._run(lambda _: list(islice(items, self.chunk_size)))
+            for item in chunk:
+                yield item
+            if len(chunk) < self.chunk_size:
+                break
+
+    method.__name__ = name
+    method.__qualname__ = 'AsyncGoogleCalendar.' + name
+    method.__doc__ = getattr(GoogleCalendar, name).__doc__
+    return method
+
+
+class AsyncGoogleCalendar:
+    """Asynchronous version of :py:class:`~gcsa.google_calendar.GoogleCalendar`.
+
+    Has the same methods as :py:class:`~gcsa.google_calendar.GoogleCalendar`, but they are coroutines and listing
+    methods (e.g. `get_events`) return async iterators:
+
+    .. code-block:: python
+
+        async with AsyncGoogleCalendar() as gc:
+            event = await gc.get_event('<event_id>')
+            async for event in gc.get_events():
+                print(event)
+
+    Requests are sent from a pool of worker threads that share a single
+    :py:class:`~gcsa.google_calendar.GoogleCalendar` object and its pool of HTTP connections, so the event loop is
+    never blocked and up to `max_workers` requests are sent concurrently.
+    """
+
+    def __init__(
+            self,
+            default_calendar: str = 'primary',
+            *,
+            credentials: Optional[Credentials] = None,
+            credentials_path: Optional[str] = None,
+            token_path: Optional[str] = None,
+            save_token: bool = True,
+            read_only: bool = False,
+            authentication_flow_host: str = 'localhost',
+            authentication_flow_port: int = 8080,
+            authentication_flow_bind_addr: Optional[str] = None,
+            open_browser: Optional[bool] = None,
+            event_cache: Optional[EventCache] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            max_workers: int = 10,
+            chunk_size: int = 100
+    ):
+        """
+        Authentication is done on creation (same as for :py:class:`~gcsa.google_calendar.GoogleCalendar`).
+        See :py:class:`~gcsa.google_calendar.GoogleCalendar` for the description of the common arguments.
+
+        :param max_workers:
+                Maximum number of concurrent requests (worker threads and HTTP connections).
+        :param chunk_size:
+                Number of items that listing methods retrieve from the worker thread at once.
+        """
+        self.calendar = GoogleCalendar(
+            default_calendar=default_calendar,
+            credentials=credentials,
+            credentials_path=credentials_path,
+            token_path=token_path,
+            save_token=save_token,
+            read_only=read_only,
+            authentication_flow_host=authentication_flow_host,
+            authentication_flow_port=authentication_flow_port,
+            authentication_flow_bind_addr=authentication_flow_bind_addr,
+            open_browser=open_browser,
+            event_cache=event_cache,
+            http_pool_size=max_workers,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter
+        )
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='gcsa')
+
+    @property
+    def default_calendar(self) -> str:
+        return self.calendar.default_calendar
+
+    @property
+    def credentials(self):
+        return self.calendar.credentials
+
+    async def _run(self, fn: Callable):
+        """Calls `fn` with the `GoogleCalendar` object in the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: fn(self.calendar))
+
+    def close(self):
+        """Shuts down worker threads."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Events
+    get_events = _async_iterator_method('get_events')
+    get_events_parallel = _async_iterator_method('get_events_parallel')
+    get_events_frame = _async_method('get_events_frame')
+    get_instances = _async_iterator_method('get_instances')
+    sync_events = _async_iterator_method('sync_events')
+    get_event = _async_method('get_event')
+    add_event = _async_method('add_event')
+    add_quick_event = _async_method('add_quick_event')
+    update_event = _async_method('update_event')
+    import_event = _async_method('import_event')
+    bulk_import = _async_method('bulk_import')
+    move_event = _async_method('move_event')
+    delete_event = _async_method('delete_event')
+
+    # Calendars
+    get_calendar = _async_method('get_calendar')
+    add_calendar = _async_method('add_calendar')
+    update_calendar = _async_method('update_calendar')
+    delete_calendar = _async_method('delete_calendar')
+    clear_calendar = _async_method('clear_calendar')
+
+    # Calendar list
+    get_calendar_list = _async_iterator_method('get_calendar_list')
+    get_calendar_list_entry = _async_method('get_calendar_list_entry')
+    add_calendar_list_entry = _async_method('add_calendar_list_entry')
+    update_calendar_list_entry = _async_method('update_calendar_list_entry')
+    delete_calendar_list_entry = _async_method('delete_calendar_list_entry')
+
+    # Colors
+    list_event_colors = _async_method('list_event_colors')
+    list_calendar_colors = _async_method('list_calendar_colors')
+
+    # ACL
+    get_acl_rules = _async_iterator_method('get_acl_rules')
+    get_acl_rule = _async_method('get_acl_rule')
+    add_acl_rule = _async_method('add_acl_rule')
+    update_acl_rule = _async_method('update_acl_rule')
+    delete_acl_rule = _async_method('delete_acl_rule')
+
+    # Free/busy
+    get_free_busy = _async_method('get_free_busy')
+    find_free_slots = _async_method('find_free_slots')
+
+    # Settings
+    get_settings = _async_method('get_settings')
@@ -2,6 +2,8 @@ from typing import Optional
 
 
 class Attachment:
+    __slots__ = ('unsupported_mime_type', 'file_url', 'title', 'mime_type', 'icon_link', 'file_id')
+
     _SUPPORTED_MIME_TYPES = {
         "application/vnd.google-apps.audio",
         "application/vnd.google-apps.document",  # Google Docs
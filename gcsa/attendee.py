@@ -18,6 +18,8 @@ class ResponseStatus:
 
 
 class Attendee(Person):
+    __slots__ = ('comment', 'optional', 'is_resource', 'additional_guests', 'response_status')
+
     def __init__(
             self,
             email: str,
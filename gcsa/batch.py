@@ -0,0 +1,153 @@
+from copy import copy
+from functools import partial
+from typing import Callable, List, Optional, Any
+
+
+class BatchRequest:
+    """Groups multiple requests into batch HTTP requests.
+
+    Use :py:meth:`~gcsa.google_calendar.GoogleCalendar.batch` to create a batch request.
+    All the calls made on the batch object are collected and sent in groups of up to `batch_size` requests
+    when the context exits (or when :py:meth:`~gcsa.batch.BatchRequest.execute` is called).
+
+    .. code-block:: python
+
+        with gc.batch() as batch:
+            for event in events:
+                batch.add_event(event)
+
+        for result in batch.results:
+            print(result)
+    """
+
+    MAX_BATCH_SIZE = 50
+
+    _BATCHABLE_METHODS = {
+        # Events
+        'get_event',
+        'add_event',
+        'add_quick_event',
+        'update_event',
+        'import_event',
+        'move_event',
+        'delete_event',
+        # Calendars
+        'get_calendar',
+        'add_calendar',
+        'update_calendar',
+        'delete_calendar',
+        # Calendar list
+        'get_calendar_list_entry',
+        'add_calendar_list_entry',
+        'update_calendar_list_entry',
+        'delete_calendar_list_entry',
+        # ACL
+        'get_acl_rule',
+        'add_acl_rule',
+        'update_acl_rule',
+        'delete_acl_rule',
+    }
+
+    def __init__(self, calendar, batch_size: int = MAX_BATCH_SIZE):
+        """
+        :param calendar:
+                :py:class:`~gcsa.google_calendar.GoogleCalendar` instance that requests are made for.
+        :param batch_size:
+                Maximum number of requests in a single batch HTTP request. Google Calendar API allows up to 50 calls
+                in a single batch request.
+        """
+        if not 1 <= batch_size <= self.MAX_BATCH_SIZE:
+            raise ValueError(f'"batch_size" must be in range 1-{self.MAX_BATCH_SIZE}. {batch_size} was provided.')
+
+        self.batch_size = batch_size
+        self.results: List[Any] = []
+        self._requests: List = []
+
+        self._calendar = copy(calendar)
+        self._calendar._batch = self
+
+    def __getattr__(self, name):
+        if name in self._BATCHABLE_METHODS:
+            return getattr(self._calendar, name)
+        raise AttributeError(f'{name!r} can not be used in a batch request.')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self):
+        return len(self._requests)
+
+    def add(self, request, callback: Optional[Callable] = None, idempotent: bool = True):
+        """Adds API request to the batch.
+
+        :param request:
+                Request object (e.g. ``gc.service.events().get(...)``).
+        :param callback:
+                Function that converts the response of the request to the result.
+        :param idempotent:
+                Whether the request can be safely retried after the server error.
+        """
+        self._requests.append((len(self.results), request, callback, idempotent))
+        self.results.append(None)
+
+    def execute(self):
+        """Sends collected requests in groups of up to `batch_size` requests.
+
+        Results are stored in `results` in the order the requests were added. Each result is the same object
+        as the corresponding method of :py:class:`~gcsa.google_calendar.GoogleCalendar` would return,
+        or an exception (e.g. :py:class:`googleapiclient.errors.HttpError`) if the request has failed.
+
+        Requests that failed with retryable errors (see :py:class:`~gcsa.retry.RetryPolicy`) are sent again
+        in the following batches.
+        """
+        requests, self._requests = self._requests, []
+        retry_policy = self._calendar.retry_policy
+        callbacks = {}
+
+        def handle_response(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                self.results[index] = exception
+            else:
+                callback = callbacks[index]
+                self.results[index] = callback(response) if callback else response
+
+        attempt = 1
+        while requests:
+            for i in range(0, len(requests), self.batch_size):
+                chunk = requests[i:i + self.batch_size]
+                batch = self._calendar.service.new_batch_http_request(callback=handle_response)
+                for index, request, callback, _ in chunk:
+                    callbacks[index] = callback
+                    batch.add(request, request_id=str(index))
+
+                # Whole batch is only retried if it was rejected because of the rate limits
+                retry_policy.execute(partial(self._execute_batch, batch, len(chunk)), idempotent=False)
+
+            requests = [
+                (index, request, callback, idempotent)
+                for index, request, callback, idempotent in requests
+                if isinstance(self.results[index], Exception)
+                and retry_policy.is_retryable(self.results[index], idempotent)
+            ]
+            if requests and attempt < retry_policy.max_attempts:
+                retry_policy.record_retries(len(requests))
+                retry_policy.wait(attempt)
+                attempt += 1
+            else:
+                retry_policy.record_failures(len(requests))
+                break
+
+        return self.results
+
+    def _execute_batch(self, batch, requests_count: int):
+        # Each request of the batch counts towards the quotas
+        if self._calendar.rate_limiter is not None:
+            for _ in range(requests_count):
+                self._calendar.rate_limiter.acquire()
+        with self._calendar._http_pool.checkout() as http:
+            batch.execute(http=http)
@@ -0,0 +1,124 @@
+"""Checkpoint, result and ids of the resumable bulk import (see
+:py:meth:`~gcsa.google_calendar.GoogleCalendar.bulk_import`)."""
+import json
+import os
+from base64 import b32encode
+from hashlib import sha1
+from typing import Dict, Optional, Set
+
+# Standard base32 alphabet to base32hex ("0-9a-v"), the alphabet of the event ids
+_BASE32HEX = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ234567', '0123456789abcdefghijklmnopqrstuv')
+
+# Fields that are assigned by the server and don't identify the event
+_VOLATILE_FIELDS = ('id', 'etag', 'htmlLink', 'created', 'updated', 'sequence')
+
+
+def generate_event_id(event_json: dict) -> str:
+    """Returns deterministic event id (32 base32hex characters) for the event resource without id.
+
+    Id is derived from the "iCalUID" (and "originalStartTime" of the modified instances) of the event if it has one
+    or from its contents otherwise, so the same event always gets the same id, and its repeated import is detected
+    as a duplicate.
+
+    :param event_json:
+            Event resource (e.g. from :py:meth:`~gcsa.serializers.event_serializer.EventSerializer.to_json`).
+    """
+    if event_json.get('iCalUID'):
+        key = 'iCalUID:' + event_json['iCalUID']
+        if event_json.get('originalStartTime'):
+            # Modified instances of the recurring event share its iCalUID
+            key += ':' + json.dumps(event_json['originalStartTime'], sort_keys=True, separators=(',', ':'))
+    else:
+        contents = {k: v for k, v in event_json.items() if k not in _VOLATILE_FIELDS}
+        key = json.dumps(contents, sort_keys=True, separators=(',', ':'), default=str)
+    digest = sha1(key.encode('utf-8')).digest()
+    return b32encode(digest).decode('ascii').translate(_BASE32HEX)
+
+
+class ImportCheckpoint:
+    def __init__(self, path: str):
+        """Append-only file with ids of the successfully imported events (one per line).
+
+        Ids that are already in the file are loaded on creation, so a restarted import can skip them.
+        Incomplete last line (if the previous run was interrupted while writing it) is removed.
+
+        :param path:
+                Path to the checkpoint file. Created if doesn't exist.
+        """
+        self.path = path
+        self._event_ids: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, 'rb+') as f:
+                complete_size = 0
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    self._event_ids.add(line[:-1].decode('utf-8'))
+                    complete_size += len(line)
+                # Drop the incomplete line
+                f.truncate(complete_size)
+        self._file = open(path, 'a', encoding='utf-8', newline='\n')
+
+    def add(self, event_id: str):
+        """Records the event as imported. Line is flushed right away, so it survives the crash of the process."""
+        if event_id not in self._event_ids:
+            self._event_ids.add(event_id)
+            self._file.write(event_id + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._event_ids
+
+    def __len__(self):
+        return len(self._event_ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return "<ImportCheckpoint path='{}', {} events>".format(self.path, len(self))
+
+
+class BulkImportResult:
+    def __init__(
+            self,
+            imported: int = 0,
+            duplicates: int = 0,
+            skipped: int = 0,
+            failed: Optional[Dict[str, Exception]] = None
+    ):
+        """Summary of the :py:meth:`~gcsa.google_calendar.GoogleCalendar.bulk_import`.
+
+        :param imported:
+                Number of events imported by this run.
+        :param duplicates:
+                Number of events that already existed in the calendar (409 response). Counted as succeeded.
+        :param skipped:
+                Number of events skipped because the checkpoint recorded them as succeeded in the previous runs.
+        :param failed:
+                Errors of the events that failed to import by event id. These events are not recorded
+                in the checkpoint and are retried by the next run.
+        """
+        self.imported = imported
+        self.duplicates = duplicates
+        self.skipped = skipped
+        self.failed = failed or {}
+
+    @property
+    def succeeded(self) -> int:
+        """Number of events imported by this run or found already existing."""
+        return self.imported + self.duplicates
+
+    def __str__(self):
+        return 'imported={}, duplicates={}, skipped={}, failed={}'.format(
+            self.imported, self.duplicates, self.skipped, len(self.failed)
+        )
+
+    def __repr__(self):
+        return '<BulkImportResult {}>'.format(self.__str__())
@@ -0,0 +1,138 @@
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+
+class EventCache(ABC):
+    """Base class of the event caches.
+
+    Cache stores raw event resources (as returned by the API, including their `etag`)
+    keyed by calendar id and event id. Returned resources are only read (events are created from them),
+    so caches don't need to copy them. See :py:class:`~gcsa.cache.LRUEventCache`
+    and :py:class:`~gcsa.cache.SQLiteEventCache`.
+    """
+
+    @abstractmethod
+    def get(self, calendar_id: str, event_id: str) -> Optional[dict]:
+        """Returns cached event resource or None if the event is not cached."""
+        pass
+
+    @abstractmethod
+    def set(self, calendar_id: str, event_id: str, event_json: dict):
+        """Stores event resource in the cache."""
+        pass
+
+    @abstractmethod
+    def delete(self, calendar_id: str, event_id: str):
+        """Removes event from the cache (if present)."""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Removes all the events from the cache."""
+        pass
+
+
+class LRUEventCache(EventCache):
+    def __init__(
+            self,
+            max_size: int = 1000
+    ):
+        """In-memory cache that keeps up to `max_size` least recently used events.
+
+        :param max_size:
+                Maximum number of cached events.
+        """
+        if max_size < 1:
+            raise ValueError(f'"max_size" must be positive. {max_size} was provided.')
+        self.max_size = max_size
+        self._events: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, calendar_id, event_id):
+        key = (calendar_id, event_id)
+        with self._lock:
+            if key not in self._events:
+                return None
+            self._events.move_to_end(key)
+            return self._events[key]
+
+    def set(self, calendar_id, event_id, event_json):
+        key = (calendar_id, event_id)
+        with self._lock:
+            self._events[key] = event_json
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_size:
+                self._events.popitem(last=False)
+
+    def delete(self, calendar_id, event_id):
+        with self._lock:
+            self._events.pop((calendar_id, event_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+    def __len__(self):
+        return len(self._events)
+
+
+class SQLiteEventCache(EventCache):
+    def __init__(
+            self,
+            path: str
+    ):
+        """On-disk cache that stores events in the SQLite database.
+
+        :param path:
+                Path to the database file. Created if it doesn't exist.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS events ('
+                'calendar_id TEXT NOT NULL, '
+                'event_id TEXT NOT NULL, '
+                'resource TEXT NOT NULL, '
+                'PRIMARY KEY (calendar_id, event_id))'
+            )
+
+    def get(self, calendar_id, event_id):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT resource FROM events WHERE calendar_id = ? AND event_id = ?',
+                (calendar_id, event_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, calendar_id, event_id, event_json):
+        serialized = json.dumps(event_json)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO events (calendar_id, event_id, resource) VALUES (?, ?, ?)',
+                (calendar_id, event_id, serialized)
+            )
+
+    def delete(self, calendar_id, event_id):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM events WHERE calendar_id = ? AND event_id = ?',
+                (calendar_id, event_id)
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM events')
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM events').fetchone()[0]
@@ -98,6 +98,8 @@ class EntryPoint:
 
     ENTRY_POINT_TYPES = (VIDEO, PHONE, SIP, MORE)
 
+    __slots__ = ('entry_point_type', 'uri', 'label', 'pin', 'access_code', 'meeting_code', 'passcode', 'password')
+
     def __init__(
             self,
             entry_point_type: str,
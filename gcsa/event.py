@@ -1,6 +1,6 @@
 from functools import total_ordering
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Dict, Callable, Any
 
 from beautiful_date import BeautifulDate
 from tzlocal import get_localzone_name
@@ -45,6 +45,14 @@ class Transparency:
 
 @total_ordering
 class Event(Resource):
+    # Events are often loaded in large numbers, slots make them considerably smaller than __dict__-based objects
+    __slots__ = (
+        'timezone', 'start', 'end', 'created', 'updated', 'event_id', 'summary', 'description', 'location',
+        'recurrence', 'color_id', 'visibility', 'attendees', 'attachments', 'conference_solution', 'reminders',
+        'default_reminders', 'recurring_event_id', 'guests_can_invite_others', 'guests_can_modify',
+        'guests_can_see_other_guests', 'transparency', 'creator', 'organizer', 'other'
+    )
+
     def __init__(
             self,
             summary: Optional[str],
@@ -344,3 +352,73 @@ class Event(Resource):
                 and self.guests_can_see_other_guests == other.guests_can_see_other_guests
                 and self.other == other.other
         )
+
+
+class _LazyAttribute:
+    """Attribute of the :py:class:`~gcsa.event.LazyEvent` that is decoded on first access.
+
+    Decoded value is stored in the slot of the :py:class:`~gcsa.event.Event`. Whether the attribute is still
+    to be decoded is kept as a bit (`mask`) of the event's `_pending`.
+    """
+
+    _count = 0
+
+    def __init__(self):
+        self.mask = 1 << _LazyAttribute._count
+        _LazyAttribute._count += 1
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = next(base.__dict__[name] for base in owner.__mro__[1:] if name in base.__dict__)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._pending & self.mask:
+            self.slot.__set__(obj, obj._decoders[self.name](obj._json))
+            obj._decoded(self.mask)
+        return self.slot.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+        obj._decoded(self.mask)
+
+
+class LazyEvent(Event):
+    """Event received from the API, which decodes its attendees, attachments, reminders, conference solution,
+    creator and organizer on first access. Otherwise, behaves the same as :py:class:`~gcsa.event.Event`.
+
+    Returned by listing methods with ``lazy=True``
+    (e.g. :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events`).
+    """
+
+    __slots__ = ('_json', '_pending')
+
+    # Functions that decode the lazy attributes from the event resource (by attribute name).
+    # Shared by all the events, set by the :py:class:`~gcsa.serializers.event_serializer.EventSerializer`.
+    _decoders: Dict[str, Callable[[dict], Any]] = {}
+
+    attendees = _LazyAttribute()
+    attachments = _LazyAttribute()
+    reminders = _LazyAttribute()
+    conference_solution = _LazyAttribute()
+    creator = _LazyAttribute()
+    organizer = _LazyAttribute()
+
+    def __init__(self, *args, _json: dict, **kwargs):
+        """
+        :param _json:
+                Event resource the lazy attributes are decoded from.
+        """
+        self._json: Optional[dict] = None
+        self._pending = 0
+        super().__init__(*args, **kwargs)
+        # Set after Event.__init__, which assigns empty values to the lazy attributes
+        self._json = _json
+        self._pending = (1 << _LazyAttribute._count) - 1
+
+    def _decoded(self, mask: int):
+        """Marks the attribute as decoded (or set). Releases the resource when all the attributes are decoded."""
+        self._pending &= ~mask
+        if not self._pending:
+            self._json = None
@@ -0,0 +1,333 @@
+"""Local expansion of the recurring events into instances (without requests to the API)."""
+from collections import defaultdict
+from copy import copy
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from heapq import merge
+from typing import Iterable, Iterator, Optional, Union, Dict, List, Tuple
+
+from beautiful_date import BeautifulDate
+from dateutil.relativedelta import relativedelta
+from dateutil.rrule import rrule, rruleset, FREQNAMES, weekdays
+from dateutil.tz import gettz, tzutc
+
+from .event import Event
+from .recurrence import Recurrence, RecurrenceRule, RecurrenceDates
+from .util.date_time_util import parse_datetime
+
+_UTC = tzutc()
+_WEEK_DAYS = dict(zip(('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU'), weekdays))
+# Periods of the rules with fixed length (in the local time)
+_PERIODS = {
+    'WEEKLY': timedelta(weeks=1),
+    'DAILY': timedelta(days=1),
+    'HOURLY': timedelta(hours=1),
+    'MINUTELY': timedelta(minutes=1),
+    'SECONDLY': timedelta(seconds=1),
+}
+
+
+def expand_event(
+        event: Event,
+        time_min: Union[date, datetime, BeautifulDate],
+        time_max: Union[date, datetime, BeautifulDate],
+        overrides: Optional[Iterable[Event]] = None
+) -> Iterator[Event]:
+    """Lazily generates instances of the recurring `event` that overlap the time range from `time_min`
+    to `time_max`, like :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_instances` does, but locally.
+
+    Recurrence (RRULE, EXRULE, RDATE and EXDATE lines) is interpreted in the timezone of the event,
+    so that instances keep their local time over the DST changes. Instances are yielded in the order
+    of their original start times. Event without recurrence is yielded as it is if it overlaps the time range.
+
+    :param event:
+            Recurring event (e.g. from :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events`
+            without `single_events`).
+    :param time_min:
+            Staring date/datetime. Naive datetimes are interpreted in the timezone of the event.
+    :param time_max:
+            Ending date/datetime. Naive datetimes are interpreted in the timezone of the event.
+    :param overrides:
+            Modified or cancelled instances of the event (ones with `recurring_event_id` set to the id of the
+            `event` and "originalStartTime" field), e.g. from
+            :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events` without `single_events`.
+            They replace (or remove, if cancelled) the instances with the corresponding original start.
+
+    :return:
+            Iterator of the instances as `Event` objects. Instances have ids and "originalStartTime" fields
+            in the same format as the instances returned by the API.
+    """
+    tz = gettz(event.timezone)
+    start = _to_datetime(event.start, tz)
+    end = _to_datetime(event.end, tz) if event.end is not None else start
+    window_min = _to_datetime(time_min, tz)
+    window_max = _to_datetime(time_max, tz)
+
+    if not event.recurrence:
+        if start < window_max and end > window_min:
+            yield event
+        return
+
+    duration = end - start
+    recurrence = tuple(event.recurrence)
+    occurrences = _get_rule_set(recurrence, start, event.timezone, window_min - duration)
+
+    overrides_by_start: Dict[float, Event] = {}
+    for override in overrides or ():
+        original_start = _get_original_start(override, tz)
+        if original_start is not None:
+            overrides_by_start[original_start.timestamp()] = override
+
+    def expand_window():
+        # Instance overlaps the window if its start is after window_min - duration and before window_max
+        for occurrence in occurrences.xafter(window_min - duration, inc=False):
+            if occurrence >= window_max:
+                break
+            yield occurrence, overrides_by_start.pop(occurrence.timestamp(), None)
+
+    def moved_into_window():
+        # Overrides moved into the window from the original start outside of it
+        moved = []
+        all_occurrences = None
+        for timestamp, override in list(overrides_by_start.items()):
+            original_start = datetime.fromtimestamp(timestamp, tz)
+            if window_min - duration < original_start < window_max or _is_cancelled(override):
+                continue
+            if all_occurrences is None:
+                # Original start can be before the start of the iteration of `occurrences`
+                all_occurrences = _get_rule_set(recurrence, start, event.timezone)
+            if all_occurrences.after(original_start, inc=True) == original_start:
+                moved.append((original_start, override))
+        return sorted(moved, key=lambda o: o[0])
+
+    all_day = not isinstance(event.start, datetime)
+    instances = merge(expand_window(), moved_into_window(), key=lambda o: o[0])
+    for occurrence, override in instances:
+        if override is None:
+            yield _make_instance(event, occurrence, duration, all_day)
+        elif not _is_cancelled(override) and _overlaps(override, window_min, window_max):
+            yield override
+
+
+def expand_events(
+        events: Iterable[Event],
+        time_min: Union[date, datetime, BeautifulDate],
+        time_max: Union[date, datetime, BeautifulDate]
+) -> Iterator[Event]:
+    """Expands recurring events into instances that overlap the time range from `time_min` to `time_max`.
+
+    Modified and cancelled instances among the `events` are applied to their recurring events.
+    Single events that overlap the time range are returned as they are.
+    Instances are ordered by start within each recurring event, but not across the events.
+
+    .. code-block:: python
+
+        events = gc.get_events(time_min, time_max)  # without single_events
+        instances = list(expand_events(events, time_min, time_max))
+
+    :param events:
+            Events as returned by :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events`
+            without `single_events`.
+    :param time_min:
+            Staring date/datetime. Naive datetimes are interpreted in the timezone of each event.
+    :param time_max:
+            Ending date/datetime. Naive datetimes are interpreted in the timezone of each event.
+
+    :return:
+            Iterator of `Event` objects.
+    """
+    events_list: List[Event] = []
+    overrides: Dict[str, List[Event]] = defaultdict(list)
+    for event in events:
+        if event.recurring_event_id is not None:
+            overrides[event.recurring_event_id].append(event)
+        else:
+            events_list.append(event)
+
+    for event in events_list:
+        yield from expand_event(event, time_min, time_max, overrides.pop(event.id, None))
+
+    # Instances of the recurring events that are not in the `events`
+    for orphan_overrides in overrides.values():
+        for override in orphan_overrides:
+            tz = gettz(override.timezone)
+            if not _is_cancelled(override) and _overlaps(override, _to_datetime(time_min, tz),
+                                                         _to_datetime(time_max, tz)):
+                yield override
+
+
+def _to_datetime(d: Union[date, datetime], tz) -> datetime:
+    """Converts date to midnight and naive datetime to datetime in the `tz`."""
+    if isinstance(d, datetime):
+        return d.replace(tzinfo=tz) if d.tzinfo is None else d.astimezone(tz)
+    return datetime.combine(d, time(), tzinfo=tz)
+
+
+def _overlaps(event: Event, window_min: datetime, window_max: datetime) -> bool:
+    tz = gettz(event.timezone)
+    start = _to_datetime(event.start, tz)
+    end = _to_datetime(event.end, tz) if event.end is not None else start
+    return start < window_max and end > window_min
+
+
+def _is_cancelled(event: Event) -> bool:
+    return event.other.get('status') == 'cancelled'
+
+
+def _get_original_start(override: Event, tz) -> Optional[datetime]:
+    original_start = override.other.get('originalStartTime')
+    if not original_start:
+        return None
+    if 'date' in original_start:
+        return _to_datetime(parse_datetime(original_start['date']).date(), tz)
+    return _to_datetime(parse_datetime(original_start['dateTime']), tz)
+
+
+def _make_instance(event: Event, start: datetime, duration: timedelta, all_day: bool) -> Event:
+    instance = copy(event)
+    if all_day:
+        instance.start = start.date()
+        instance.end = (start + duration).date()
+        suffix = start.strftime('%Y%m%d')
+        original_start_time = {'date': instance.start.isoformat()}
+    else:
+        instance.start = start
+        instance.end = start + duration
+        suffix = start.astimezone(_UTC).strftime('%Y%m%dT%H%M%SZ')
+        original_start_time = {'dateTime': start.isoformat(), 'timeZone': event.timezone}
+
+    instance.event_id = '{}_{}'.format(event.event_id, suffix) if event.event_id else None
+    instance.recurring_event_id = event.event_id
+    instance.recurrence = []
+    instance.attendees = event.attendees.copy()
+    instance.attachments = event.attachments.copy()
+    instance.reminders = event.reminders.copy()
+    instance.other = {**event.other, 'originalStartTime': original_start_time}
+    return instance
+
+
+def _get_rule_set(
+        recurrence: Tuple[str, ...],
+        start: datetime,
+        timezone: str,
+        time_min: Optional[datetime] = None
+) -> rruleset:
+    """Returns (cached) rule set from RRULE, EXRULE, RDATE and EXDATE lines of the event with the given start
+    in the `timezone` of the event.
+
+    If `time_min` is given, iteration of the rules without COUNT starts shortly before `time_min` instead of
+    the start of the event, so the rule set can only be used for the occurrences after `time_min`.
+    """
+    lines = [_parse_line(line) for line in recurrence]
+    skipped_periods = tuple(
+        _get_skipped_periods(line, start, time_min) if isinstance(line, RecurrenceRule) and time_min else 0
+        for line in lines
+    )
+    return _build_rule_set(recurrence, start, timezone, skipped_periods)
+
+
+@lru_cache(maxsize=1024)
+def _parse_line(line: str) -> Union[RecurrenceRule, RecurrenceDates]:
+    return Recurrence.parse(line)
+
+
+@lru_cache(maxsize=1024)
+def _build_rule_set(
+        recurrence: Tuple[str, ...],
+        start: datetime,
+        timezone: str,
+        skipped_periods: Tuple[int, ...]
+) -> rruleset:
+    """Builds rule set with the iteration of each rule moved by its number of `skipped_periods`."""
+    tz = gettz(timezone)
+    rule_set = rruleset()
+    # Start is always the first instance (RFC 5545), even if it doesn't match the rule
+    rule_set.rdate(start)
+    for line, skipped in zip(recurrence, skipped_periods):
+        parsed = _parse_line(line)
+        if isinstance(parsed, RecurrenceRule):
+            rule = _get_rule(parsed, start, tz, skipped)
+            if parsed.name == 'RRULE':
+                rule_set.rrule(rule)
+            else:
+                rule_set.exrule(rule)
+        else:
+            for dt in _get_datetimes(parsed, start, tz):
+                if parsed.name == 'RDATE':
+                    rule_set.rdate(dt)
+                else:
+                    rule_set.exdate(dt)
+    return rule_set
+
+
+def _get_skipped_periods(parsed: RecurrenceRule, start: datetime, time_min: datetime) -> int:
+    """Returns number of whole periods (FREQ times INTERVAL) of the rule that can be skipped from the `start`,
+    keeping at least one period before `time_min`. Rules with COUNT have to be iterated from the start."""
+    if parsed.count is not None or time_min <= start:
+        return 0
+    interval = parsed.interval or 1
+    if parsed.freq == 'YEARLY':
+        periods = (time_min.year - start.year) // interval
+    elif parsed.freq == 'MONTHLY':
+        periods = ((time_min.year - start.year) * 12 + time_min.month - start.month) // interval
+    else:
+        # Wall time difference, as the rules are iterated in the local time
+        periods = (time_min.replace(tzinfo=None) - start.replace(tzinfo=None)) // (_PERIODS[parsed.freq] * interval)
+    return max(0, periods - 1)
+
+
+def _get_rule(parsed: RecurrenceRule, start: datetime, tz, skipped_periods: int = 0) -> rrule:
+    # dateutil requires timezone-aware UNTIL for timezone-aware start
+    until = _get_datetime(parsed.until, None, start, tz) if parsed.until is not None else None
+    interval = parsed.interval or 1
+    dtstart = start
+    by_month = parsed.by_month or None
+    by_month_day = parsed.by_month_day or None
+    if skipped_periods:
+        if parsed.freq in ('YEARLY', 'MONTHLY'):
+            unit = 'years' if parsed.freq == 'YEARLY' else 'months'
+            dtstart = start + relativedelta(**{unit: interval * skipped_periods})
+            # dateutil derives the day (and month) from the DTSTART if no day is specified.
+            # Derived from the original start, as the moved one can be clamped to the end of a shorter month
+            if not (parsed.by_week or parsed.by_year_day or parsed.by_month_day or parsed.by_week_day):
+                by_month_day = (start.day,)
+                if parsed.freq == 'YEARLY' and not by_month:
+                    by_month = (start.month,)
+        else:
+            dtstart = start + _PERIODS[parsed.freq] * interval * skipped_periods
+    return rrule(
+        FREQNAMES.index(parsed.freq),
+        dtstart=dtstart,
+        interval=interval,
+        wkst=_WEEK_DAYS[parsed.week_start.short] if parsed.week_start is not None else None,
+        count=parsed.count,
+        until=until,
+        bysetpos=parsed.by_set_pos or None,
+        bymonth=by_month,
+        bymonthday=by_month_day,
+        byyearday=parsed.by_year_day or None,
+        byweekno=parsed.by_week or None,
+        byweekday=[_WEEK_DAYS[d.short](d.n) if d.n else _WEEK_DAYS[d.short] for d in parsed.by_week_day] or None,
+        byhour=parsed.by_hour or None,
+        byminute=parsed.by_minute or None,
+        bysecond=parsed.by_second or None
+    )
+
+
+def _get_datetimes(parsed: RecurrenceDates, start: datetime, tz) -> List[datetime]:
+    """Returns datetimes of RDATE/EXDATE in the timezone of the event."""
+    values = parsed.values
+    if parsed.value_type == 'PERIOD':
+        # Instance starts at the start of the period
+        values = tuple(period_start for period_start, _ in values)
+    return [_get_datetime(value, parsed.timezone, start, tz) for value in values]
+
+
+def _get_datetime(value: Union[date, datetime], timezone: Optional[str], start: datetime, tz) -> datetime:
+    """Converts parsed date or datetime to datetime in the timezone of the event. Dates get the time of the `start`,
+    naive datetimes are interpreted in the `timezone` if specified or in the timezone of the event otherwise."""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, start.timetz())
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=gettz(timezone) if timezone else tz)
+    return value.astimezone(tz)
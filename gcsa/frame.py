@@ -0,0 +1,373 @@
+import operator
+from array import array
+from collections import Counter
+from datetime import datetime, date, time
+from heapq import heappush, heappop
+from itertools import compress, repeat
+from typing import Callable, Iterable, List, Optional, Union, Dict, Tuple, Any
+
+from beautiful_date import BeautifulDate
+from dateutil.tz import gettz
+from tzlocal import get_localzone_name
+
+from .util.date_time_util import parse_datetime, ensure_localisation
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+
+class _Interned:
+    """Column of repeated values (e.g. calendar ids) stored as codes of the distinct values. None has code -1."""
+
+    def __init__(self) -> None:
+        self.codes = array('l')
+        self.values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+
+    def code(self, value) -> int:
+        """Returns code of the `value` or -2 if the value is not present in the column."""
+        if value is None:
+            return -1
+        return self._index.get(value, -2)
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def take(self, indices: Iterable[int]) -> '_Interned':
+        column = _Interned()
+        column.values = self.values
+        column._index = self._index
+        column.codes = array('l', (self.codes[i] for i in indices))
+        return column
+
+    def decode(self) -> List[Any]:
+        values = self.values + [None]
+        return [values[c] for c in self.codes]
+
+    def __getitem__(self, i):
+        code = self.codes[i]
+        return None if code == -1 else self.values[code]
+
+
+class EventFrame:
+    """Columnar representation of the events for the bulk analysis.
+
+    Events are stored in arrays (one per column) instead of :py:class:`~gcsa.event.Event` objects:
+
+    * id - event id
+    * summary - title of the event
+    * start, end - start and end as UNIX timestamps (seconds). All-day events start and end at midnight
+      in the `timezone` of the frame.
+    * all_day - whether the event is an all-day event
+    * calendar - id of the calendar the event was listed from
+    * organizer - email of the organizer
+    * status - status of the event ("confirmed", "tentative" or "cancelled")
+    * attendees - number of attendees
+
+    Calendar, organizer and status are interned, i.e. each distinct value is stored once.
+
+    Filters and sorting return new frames that share the interned values with the original one.
+    """
+
+    #: Fields of the event resource that are stored in the frame (for the partial response)
+    FIELDS = ('id', 'summary', 'start', 'end', 'status', 'organizer(email)', 'attendees(email)')
+
+    COLUMNS = ('id', 'summary', 'start', 'end', 'all_day', 'calendar', 'organizer', 'status', 'attendees')
+
+    def __init__(self, timezone: str = get_localzone_name()):
+        """
+        :param timezone:
+                Timezone used for the dates of all-day events and for naive datetimes in the filters.
+        """
+        self.timezone = timezone
+        self._tz = gettz(timezone)
+        self.id: List[Optional[str]] = []
+        self.summary: List[Optional[str]] = []
+        self.start = array('q')
+        self.end = array('q')
+        self.all_day = array('b')
+        self.calendar = _Interned()
+        self.organizer = _Interned()
+        self.status = _Interned()
+        self.attendees = array('l')
+
+    @classmethod
+    def from_json(
+            cls,
+            events_json: Iterable[dict],
+            calendar_id: Optional[str] = None,
+            timezone: str = get_localzone_name()
+    ) -> 'EventFrame':
+        """Creates frame from the event resources (e.g. ``gc.get_events(raw=True)``).
+
+        :param events_json:
+                Iterable of the event resources as returned by the API. Consumed one by one, so listing
+                results can be streamed into the frame without keeping all the resources in memory.
+        :param calendar_id:
+                Calendar identifier the events were listed from.
+        :param timezone:
+                Timezone used for the dates of all-day events and for naive datetimes in the filters.
+        """
+        frame = cls(timezone=timezone)
+        frame.extend(events_json, calendar_id)
+        return frame
+
+    def extend(self, events_json: Iterable[dict], calendar_id: Optional[str] = None):
+        """Adds event resources to the frame. Events without start (e.g. cancelled instances of the
+        recurring events) are skipped.
+
+        :param events_json:
+                Iterable of the event resources as returned by the API.
+        :param calendar_id:
+                Calendar identifier the events were listed from.
+        """
+        for event_json in events_json:
+            start = event_json.get('start')
+            if start is None:
+                continue
+            end = event_json.get('end', start)
+            self.id.append(event_json.get('id'))
+            self.summary.append(event_json.get('summary'))
+            self.start.append(self._get_timestamp(start))
+            self.end.append(self._get_timestamp(end))
+            self.all_day.append('date' in start)
+            self.calendar.append(calendar_id)
+            self.organizer.append(event_json.get('organizer', {}).get('email'))
+            self.status.append(event_json.get('status'))
+            self.attendees.append(len(event_json.get('attendees', ())))
+
+    def take(self, indices: Iterable[int]) -> 'EventFrame':
+        """Returns new frame with the rows at the given `indices` (in the given order)."""
+        indices = list(indices)
+        frame = EventFrame(timezone=self.timezone)
+        frame.id = [self.id[i] for i in indices]
+        frame.summary = [self.summary[i] for i in indices]
+        frame.start = array('q', (self.start[i] for i in indices))
+        frame.end = array('q', (self.end[i] for i in indices))
+        frame.all_day = array('b', (self.all_day[i] for i in indices))
+        frame.calendar = self.calendar.take(indices)
+        frame.organizer = self.organizer.take(indices)
+        frame.status = self.status.take(indices)
+        frame.attendees = array('l', (self.attendees[i] for i in indices))
+        return frame
+
+    def filter(
+            self,
+            *,
+            time_min: Optional[Union[date, datetime, BeautifulDate, int]] = None,
+            time_max: Optional[Union[date, datetime, BeautifulDate, int]] = None,
+            calendar_id: Optional[str] = None,
+            organizer: Optional[str] = None,
+            status: Optional[str] = None,
+            all_day: Optional[bool] = None,
+            min_attendees: Optional[int] = None,
+            max_attendees: Optional[int] = None
+    ) -> 'EventFrame':
+        """Returns new frame with the events that match all the given conditions.
+
+        :param time_min:
+                Lower bound (exclusive) for the event's end. Date/datetime or UNIX timestamp.
+        :param time_max:
+                Upper bound (exclusive) for the event's start. Date/datetime or UNIX timestamp.
+        :param calendar_id:
+                Calendar identifier.
+        :param organizer:
+                Email of the organizer.
+        :param status:
+                Status of the event.
+        :param all_day:
+                Whether the event is an all-day event.
+        :param min_attendees:
+                Minimum number of attendees.
+        :param max_attendees:
+                Maximum number of attendees.
+        """
+        # Conditions as (column, comparison, value), each is evaluated for the whole column at once
+        conditions: List[Tuple[array, Callable[[Any, Any], Any], int]] = []
+        if time_min is not None:
+            conditions.append((self.end, operator.gt, self._to_timestamp(time_min)))
+        if time_max is not None:
+            conditions.append((self.start, operator.lt, self._to_timestamp(time_max)))
+        for column, value in ((self.calendar, calendar_id), (self.organizer, organizer), (self.status, status)):
+            if value is not None:
+                conditions.append((column.codes, operator.eq, column.code(value)))
+        if all_day is not None:
+            conditions.append((self.all_day, operator.eq, int(all_day)))
+        if min_attendees is not None:
+            conditions.append((self.attendees, operator.ge, min_attendees))
+        if max_attendees is not None:
+            conditions.append((self.attendees, operator.le, max_attendees))
+        return self.take(self._select(conditions))
+
+    def _select(self, conditions: List[Tuple[array, Callable[[Any, Any], Any], int]]) -> List[int]:
+        """Returns indices of the rows that match all the `conditions`. Uses NumPy if it is installed."""
+        if not conditions or not len(self):
+            return list(range(len(self)))
+
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for column, compare, value in conditions:
+                mask &= compare(np.frombuffer(column, dtype=np.dtype(column.typecode)), value)
+            return np.flatnonzero(mask).tolist()
+
+        matches: Iterable = repeat(True)
+        for column, compare, value in conditions:
+            matches = map(operator.and_, matches, map(compare, column, repeat(value)))
+        return list(compress(range(len(self)), matches))
+
+    def overlapping(
+            self,
+            time_min: Union[date, datetime, BeautifulDate, int],
+            time_max: Union[date, datetime, BeautifulDate, int]
+    ) -> 'EventFrame':
+        """Returns new frame with the events that overlap the time range from `time_min` to `time_max`."""
+        return self.filter(time_min=time_min, time_max=time_max)
+
+    def overlaps(self) -> List[Tuple[int, int]]:
+        """Returns pairs of indices of the overlapping events. Events that only touch (one ends when the other
+        starts) don't overlap."""
+        pairs: List[Tuple[int, int]] = []
+        active: List[Tuple[int, int]] = []  # heap of (end, index) of the events that started so far
+        for i in sorted(range(len(self)), key=self.start.__getitem__):
+            start = self.start[i]
+            while active and active[0][0] <= start:
+                heappop(active)
+            pairs.extend((j, i) for _, j in active)
+            heappush(active, (self.end[i], i))
+        return pairs
+
+    def sort(self, by: str = 'start', reverse: bool = False) -> 'EventFrame':
+        """Returns new frame sorted by the given column.
+
+        :param by:
+                Name of the column. See :py:attr:`~gcsa.frame.EventFrame.COLUMNS`.
+        :param reverse:
+                Whether to sort in descending order.
+        """
+        column = self._get_column(by)
+        if isinstance(column, _Interned) or by in ('id', 'summary'):
+            values = column.decode() if isinstance(column, _Interned) else column
+            # None values go last
+            indices = sorted(range(len(self)), key=lambda i: (values[i] is None, values[i] or ''), reverse=reverse)
+        else:
+            indices = sorted(range(len(self)), key=column.__getitem__, reverse=reverse)
+        return self.take(indices)
+
+    def count_by(self, by: str) -> Counter:
+        """Returns number of events by the values of the given column (e.g. "calendar" or "organizer")."""
+        column = self._get_column(by)
+        if isinstance(column, _Interned):
+            values = column.values + [None]
+            return Counter({values[code]: n for code, n in Counter(column.codes).items()})
+        return Counter(column)
+
+    def duration(self) -> int:
+        """Returns total duration of the events in seconds."""
+        return sum(self.end) - sum(self.start)
+
+    def row(self, i: int) -> dict:
+        """Returns the i-th event as a dictionary with the values of all the columns."""
+        return {name: self._get_column(name)[i] for name in self.COLUMNS}
+
+    def to_dict(self) -> Dict[str, list]:
+        """Returns columns as lists of values."""
+        return {
+            name: column.decode() if isinstance(column, _Interned) else list(column)
+            for name, column in ((name, self._get_column(name)) for name in self.COLUMNS)
+        }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns columns as NumPy arrays. Requires `numpy`."""
+        if np is None:
+            raise ImportError('EventFrame.to_numpy requires "numpy". Install it with "pip install numpy".')
+
+        columns = {}
+        for name in self.COLUMNS:
+            column = self._get_column(name)
+            if isinstance(column, _Interned):
+                values = np.array(column.values + [None], dtype=object)
+                columns[name] = values[np.frombuffer(column.codes, dtype=np.dtype(column.codes.typecode))]
+            elif isinstance(column, array):
+                columns[name] = np.frombuffer(column, dtype=np.dtype(column.typecode)).copy()
+            else:
+                columns[name] = np.array(column, dtype=object)
+        columns['all_day'] = columns['all_day'].astype(bool)
+        return columns
+
+    def to_pandas(self):
+        """Returns `pandas.DataFrame` with the events. Start and end are converted to UTC datetimes and
+        interned columns to categoricals. Requires `pandas`."""
+        try:
+            import pandas as pd  # type: ignore
+        except ImportError:
+            raise ImportError('EventFrame.to_pandas requires "pandas". Install it with "pip install pandas".')
+
+        data = {}
+        for name in self.COLUMNS:
+            column = self._get_column(name)
+            if isinstance(column, _Interned):
+                data[name] = pd.Categorical.from_codes(list(column.codes), categories=column.values)
+            elif name in ('start', 'end'):
+                data[name] = pd.to_datetime(list(column), unit='s', utc=True)
+            elif name == 'all_day':
+                data[name] = [bool(v) for v in column]
+            else:
+                data[name] = list(column)
+        return pd.DataFrame(data)
+
+    def to_arrow(self):
+        """Returns `pyarrow.Table` with the events. Start and end are converted to UTC timestamps and
+        interned columns are dictionary-encoded. Requires `pyarrow`."""
+        try:
+            import pyarrow as pa  # type: ignore
+        except ImportError:
+            raise ImportError('EventFrame.to_arrow requires "pyarrow". Install it with "pip install pyarrow".')
+
+        data = {}
+        for name in self.COLUMNS:
+            column = self._get_column(name)
+            if isinstance(column, _Interned):
+                data[name] = pa.array(column.decode()).dictionary_encode()
+            elif name in ('start', 'end'):
+                data[name] = pa.array(column, pa.int64()).cast(pa.timestamp('s', tz='UTC'))
+            elif name == 'all_day':
+                data[name] = pa.array(column, pa.int8()).cast(pa.bool_())
+            else:
+                data[name] = pa.array(column)
+        return pa.table(data)
+
+    def _get_column(self, name: str):
+        if name not in self.COLUMNS:
+            raise ValueError('Unknown column "{}". Available columns: {}.'.format(name, ', '.join(self.COLUMNS)))
+        return getattr(self, name)
+
+    def _get_timestamp(self, time_json: dict) -> int:
+        if 'date' in time_json:
+            d = parse_datetime(time_json['date']).date()
+            return int(datetime.combine(d, time(), tzinfo=self._tz).timestamp())
+        return int(parse_datetime(time_json['dateTime']).timestamp())
+
+    def _to_timestamp(self, value: Union[date, datetime, BeautifulDate, int]) -> int:
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, datetime):
+            return int(ensure_localisation(value, self.timezone).timestamp())
+        return int(datetime.combine(value, time(), tzinfo=self._tz).timestamp())
+
+    def __len__(self):
+        return len(self.id)
+
+    def __str__(self):
+        return '{} events'.format(len(self))
+
+    def __repr__(self):
+        return '<EventFrame {}>'.format(self.__str__())
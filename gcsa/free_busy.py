@@ -1,9 +1,29 @@
 import json
+import re
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, date, time, timedelta
+from heapq import merge
+from typing import Dict, List, Optional, Iterable, Union, Tuple
+
+from beautiful_date import BeautifulDate
+from dateutil.tz import gettz, tzutc
+from tzlocal import get_localzone_name
+
+from .attendee import Attendee, ResponseStatus
+from .event import Event, Transparency
+from .util.date_time_util import parse_datetime, ensure_localisation
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
 
 TimeRange = namedtuple('TimeRange', ('start', 'end'))
+TimeSlot = namedtuple('TimeSlot', ('start', 'end', 'conflicts'))
+TimeSlot.__doc__ = """Candidate time slot found by :py:meth:`~gcsa.google_calendar.GoogleCalendar.find_free_slots`.
+`conflicts` is a tuple of identifiers of the calendars that are busy during the slot (empty if everyone is free)."""
 
 
 class FreeBusy:
@@ -63,6 +83,109 @@ class FreeBusy:
         self.groups_errors = groups_errors or {}
         self.calendars_errors = calendars_errors or {}
 
+    def union(self, calendar_ids: Optional[Iterable[str]] = None) -> List[TimeRange]:
+        """Returns time ranges when at least one of the calendars is busy.
+
+        :param calendar_ids:
+                Calendar identifiers. Default is all calendars in `calendars`.
+        """
+        return self._to_time_ranges(self._union(calendar_ids))
+
+    def intersection(self, calendar_ids: Optional[Iterable[str]] = None) -> List[TimeRange]:
+        """Returns time ranges when all the calendars are busy.
+
+        :param calendar_ids:
+                Calendar identifiers. Default is all calendars in `calendars`.
+                Calendars without busy time (that are not in `calendars`) are never busy.
+        """
+        calendar_ids = self._get_calendar_ids(calendar_ids)
+        if not calendar_ids:
+            return []
+        intervals = [self._get_intervals(calendar_id) for calendar_id in calendar_ids]
+        return self._to_time_ranges(_intersection(intervals))
+
+    def free_within(
+            self,
+            time_min: Optional[datetime] = None,
+            time_max: Optional[datetime] = None,
+            calendar_ids: Optional[Iterable[str]] = None,
+            min_duration: Optional[timedelta] = None
+    ) -> List[TimeRange]:
+        """Returns time ranges within the window when all the calendars are free.
+
+        :param time_min:
+                The start of the window. Default is `time_min` of the free/busy information.
+        :param time_max:
+                The end of the window. Default is `time_max` of the free/busy information.
+        :param calendar_ids:
+                Calendar identifiers. Default is all calendars in `calendars`.
+        :param min_duration:
+                Minimal duration of the returned time ranges. Shorter gaps are skipped.
+        """
+        window_min = self._to_timestamp(time_min or self.time_min)
+        window_max = self._to_timestamp(time_max or self.time_max)
+        min_seconds = int(min_duration.total_seconds()) if min_duration else 1
+        return self._to_time_ranges(_complement(self._union(calendar_ids), window_min, window_max, min_seconds))
+
+    def occupancy_ratio(
+            self,
+            bucket: Union[str, timedelta] = '1h',
+            calendar_ids: Optional[Iterable[str]] = None
+    ) -> Dict[datetime, float]:
+        """Returns the share of busy time of the calendars in each bucket between `time_min` and `time_max`
+        (e.g. utilisation of the rooms per hour). For multiple calendars, the ratio is busy time of all
+        the calendars divided by the total time of all the calendars.
+
+        :param bucket:
+                Length of the bucket as timedelta or string like "15m", "1h", "1d" or "1w".
+                Buckets start at `time_min` and have fixed length (the last one may be shorter).
+        :param calendar_ids:
+                Calendar identifiers. Default is all calendars in `calendars`.
+                Note that calendars without busy time are not in `calendars`, include them in `calendar_ids`
+                to count them in.
+
+        :return:
+                Dictionary that maps start of the bucket to the busy ratio from 0 to 1.
+        """
+        width = _get_bucket_seconds(bucket)
+        window_min = self._to_timestamp(self.time_min)
+        window_max = self._to_timestamp(self.time_max)
+        calendar_ids = self._get_calendar_ids(calendar_ids)
+
+        n_buckets = max(0, -(-(window_max - window_min) // width))
+        busy = _busy_per_bucket([self._get_intervals(c) for c in calendar_ids], window_min, window_max, width)
+        ratios = {}
+        for i in range(n_buckets):
+            bucket_start = window_min + i * width
+            total = (min(bucket_start + width, window_max) - bucket_start) * len(calendar_ids)
+            ratios[self._to_datetime(bucket_start)] = busy[i] / total if total else 0.0
+        return ratios
+
+    def _union(self, calendar_ids):
+        return _union([self._get_intervals(calendar_id) for calendar_id in self._get_calendar_ids(calendar_ids)])
+
+    def _get_calendar_ids(self, calendar_ids) -> List[str]:
+        return list(self.calendars) if calendar_ids is None else list(calendar_ids)
+
+    def _get_intervals(self, calendar_id: str):
+        """Busy time of the calendar as sorted merged intervals (arrays of starts and ends timestamps)."""
+        time_ranges = self.calendars.get(calendar_id, ())
+        return _normalize([self._to_timestamp(start) for start, _ in time_ranges],
+                          [self._to_timestamp(end) for _, end in time_ranges])
+
+    @staticmethod
+    def _to_timestamp(dt: datetime) -> int:
+        return int(dt.timestamp())
+
+    def _to_datetime(self, timestamp: int) -> datetime:
+        # In the timezone of the time_min (local time if naive)
+        return datetime.fromtimestamp(timestamp, self.time_min.tzinfo)
+
+    def _to_time_ranges(self, intervals) -> List[TimeRange]:
+        starts, ends = intervals
+        return [TimeRange(self._to_datetime(int(start)), self._to_datetime(int(end)))
+                for start, end in zip(starts, ends)]
+
     def __iter__(self):
         """
         :returns:
@@ -86,6 +209,509 @@ class FreeBusy:
         return self.__str__()
 
 
+class _BusyBlocks:
+    """Sorted non-overlapping busy blocks of a calendar as UNIX timestamps (seconds).
+    `busy_before[i]` is the total duration of the blocks before the i-th block."""
+
+    __slots__ = ('starts', 'ends', 'busy_before')
+
+    def __init__(self, blocks: Iterable[Tuple[int, int]]):
+        self.starts = array('q')
+        self.ends = array('q')
+        self.busy_before = array('q', [0])
+        for start, end in _coalesce(blocks):
+            self.starts.append(start)
+            self.ends.append(end)
+            self.busy_before.append(self.busy_before[-1] + end - start)
+
+    def is_busy(self, t: int) -> bool:
+        i = bisect_right(self.starts, t)
+        return i > 0 and t < self.ends[i - 1]
+
+    def slice(self, time_min: int, time_max: int) -> Iterable[Tuple[int, int]]:
+        """Blocks overlapping the range clipped to the range."""
+        first = bisect_right(self.ends, time_min)
+        last = bisect_left(self.starts, time_max)
+        for i in range(first, last):
+            yield max(self.starts[i], time_min), min(self.ends[i], time_max)
+
+    def busy_seconds(self, time_min: int, time_max: int) -> int:
+        first = bisect_right(self.ends, time_min)
+        last = bisect_left(self.starts, time_max)
+        if first >= last:
+            return 0
+        busy = self.busy_before[last] - self.busy_before[first]
+        # Clip the first and the last block to the range
+        busy -= max(0, time_min - self.starts[first])
+        busy -= max(0, self.ends[last - 1] - time_max)
+        return busy
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+
+class BusyIndex:
+    """Local free/busy information computed from the events, without requests to the API.
+
+    Busy time of each calendar is stored as sorted merged busy blocks, so that point and range queries take
+    O(log n) time. Cancelled events, transparent events (shown as "Available") and events declined
+    by the owner of the calendar don't make the calendar busy, same as for
+    :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_free_busy`.
+
+    .. code-block:: python
+
+        index = BusyIndex()
+        for calendar_id in calendar_ids:
+            events = gc.get_events(time_min, time_max, single_events=True, calendar_id=calendar_id,
+                                   fields=BusyIndex.FIELDS, raw=True)
+            index.extend(events, calendar_id)
+
+        index.is_busy('primary', (24 / Mar / 2023)[14:00])
+        free_busy = index.to_free_busy(time_min, time_max)
+    """
+
+    #: Fields of the event resource that are needed for the index (for the partial response)
+    FIELDS = ('id', 'start', 'end', 'status', 'transparency', 'attendees(self,responseStatus)')
+
+    def __init__(self, timezone: str = get_localzone_name()):
+        """
+        :param timezone:
+                Timezone used for the dates of all-day events and for naive datetimes in the queries.
+        """
+        self.timezone = timezone
+        self._tz = gettz(timezone)
+        self._calendars: Dict[str, _BusyBlocks] = {}
+
+    @classmethod
+    def from_events(
+            cls,
+            events: Iterable[Union[Event, dict]],
+            calendar_id: str = 'primary',
+            timezone: str = get_localzone_name()
+    ) -> 'BusyIndex':
+        """Creates index from the events of one calendar.
+
+        :param events:
+                :py:class:`~gcsa.event.Event` objects or event resources (e.g. ``gc.get_events(raw=True)``).
+                Recurring events have to be expanded into instances (e.g. with `single_events=True`).
+        :param calendar_id:
+                Calendar identifier the events were listed from.
+        :param timezone:
+                Timezone used for the dates of all-day events and for naive datetimes in the queries.
+        """
+        index = cls(timezone=timezone)
+        index.extend(events, calendar_id)
+        return index
+
+    @classmethod
+    def from_free_busy(cls, free_busy: FreeBusy, timezone: str = get_localzone_name()) -> 'BusyIndex':
+        """Creates index from the :py:class:`~gcsa.free_busy.FreeBusy` object (e.g. from
+        :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_free_busy`), so that it can be queried
+        locally many times.
+
+        :param free_busy:
+                Free/busy information.
+        :param timezone:
+                Timezone used for naive datetimes in the queries.
+        """
+        index = cls(timezone=timezone)
+        for calendar_id, time_ranges in free_busy.calendars.items():
+            index.add_busy(calendar_id, time_ranges)
+        return index
+
+    @property
+    def calendar_ids(self) -> List[str]:
+        return list(self._calendars)
+
+    def extend(self, events: Iterable[Union[Event, dict]], calendar_id: str = 'primary'):
+        """Adds busy time of the events to the calendar.
+
+        :param events:
+                :py:class:`~gcsa.event.Event` objects or event resources (e.g. ``gc.get_events(raw=True)``).
+                Recurring events have to be expanded into instances (e.g. with `single_events=True`).
+        :param calendar_id:
+                Calendar identifier the events were listed from.
+        """
+        blocks = []
+        for event in events:
+            block = self._get_event_block(event) if isinstance(event, Event) else self._get_event_json_block(event)
+            if block is not None:
+                blocks.append(block)
+        self._add_blocks(calendar_id, blocks)
+
+    def add_busy(self, calendar_id: str, time_ranges: Iterable[Tuple[Union[date, datetime], Union[date, datetime]]]):
+        """Adds busy time ranges to the calendar.
+
+        :param calendar_id:
+                Calendar identifier.
+        :param time_ranges:
+                :py:class:`~gcsa.free_busy.TimeRange` objects or tuples of start and end.
+        """
+        self._add_blocks(calendar_id, [(self._to_timestamp(start), self._to_timestamp(end))
+                                       for start, end in time_ranges])
+
+    def is_busy(self, calendar_id: str, t: Union[date, datetime, BeautifulDate, int]) -> bool:
+        """Whether the calendar is busy at the given time.
+
+        :param calendar_id:
+                Calendar identifier.
+        :param t:
+                Date/datetime or UNIX timestamp.
+        """
+        blocks = self._calendars.get(calendar_id)
+        return blocks is not None and blocks.is_busy(self._to_timestamp(t))
+
+    def busy_calendars(self, t: Union[date, datetime, BeautifulDate, int]) -> List[str]:
+        """Returns identifiers of the calendars that are busy at the given time.
+
+        :param t:
+                Date/datetime or UNIX timestamp.
+        """
+        t = self._to_timestamp(t)
+        return [calendar_id for calendar_id, blocks in self._calendars.items() if blocks.is_busy(t)]
+
+    def busy_ranges(
+            self,
+            calendar_ids: Optional[Union[str, Iterable[str]]] = None,
+            time_min: Optional[Union[date, datetime, BeautifulDate, int]] = None,
+            time_max: Optional[Union[date, datetime, BeautifulDate, int]] = None,
+    ) -> List[TimeRange]:
+        """Returns busy time ranges of the calendar(s) clipped to the given range. Busy time of multiple calendars
+        is merged, i.e. the result contains time ranges when at least one of the calendars is busy.
+
+        :param calendar_ids:
+                Calendar identifier or identifiers. Default is all calendars in the index.
+        :param time_min:
+                Start of the range. Default is no limit.
+        :param time_max:
+                End of the range. Default is no limit.
+
+        :return:
+                List of :py:class:`~gcsa.free_busy.TimeRange` objects with timezone-aware datetimes in UTC.
+        """
+        return [self._to_time_range(start, end)
+                for start, end in self._merged_blocks(calendar_ids, time_min, time_max)]
+
+    def busy_seconds(
+            self,
+            calendar_id: str,
+            time_min: Union[date, datetime, BeautifulDate, int],
+            time_max: Union[date, datetime, BeautifulDate, int]
+    ) -> int:
+        """Returns busy time of the calendar within the given range in seconds.
+
+        :param calendar_id:
+                Calendar identifier.
+        :param time_min:
+                Start of the range.
+        :param time_max:
+                End of the range.
+        """
+        blocks = self._calendars.get(calendar_id)
+        if blocks is None:
+            return 0
+        return blocks.busy_seconds(self._to_timestamp(time_min), self._to_timestamp(time_max))
+
+    def busy_minutes_per_day(
+            self,
+            calendar_id: str,
+            time_min: Union[date, BeautifulDate],
+            time_max: Union[date, BeautifulDate]
+    ) -> Dict[date, int]:
+        """Returns busy time of the calendar per day (in the `timezone` of the index) in minutes.
+
+        :param calendar_id:
+                Calendar identifier.
+        :param time_min:
+                First day.
+        :param time_max:
+                Day after the last day.
+
+        :return:
+                Dictionary that maps date to busy minutes (rounded down).
+        """
+        if isinstance(time_min, datetime):
+            time_min = time_min.date()
+        if isinstance(time_max, datetime):
+            time_max = time_max.date()
+
+        busy_per_day = {}
+        day = time_min
+        while day < time_max:
+            next_day = day + timedelta(days=1)
+            busy_per_day[day] = self.busy_seconds(calendar_id, day, next_day) // 60
+            day = next_day
+        return busy_per_day
+
+    def to_free_busy(
+            self,
+            time_min: Union[date, datetime, BeautifulDate],
+            time_max: Union[date, datetime, BeautifulDate],
+            calendar_ids: Optional[Iterable[str]] = None
+    ) -> FreeBusy:
+        """Returns :py:class:`~gcsa.free_busy.FreeBusy` object in the same form as
+        :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_free_busy` does.
+
+        :param time_min:
+                The start of the interval.
+        :param time_max:
+                The end of the interval.
+        :param calendar_ids:
+                Calendar identifiers. Default is all calendars in the index.
+                Calendars that are not in the index are reported in `calendars_errors` as "notFound".
+        """
+        calendar_ids = self.calendar_ids if calendar_ids is None else list(calendar_ids)
+        calendars = {}
+        calendars_errors = {}
+        for calendar_id in calendar_ids:
+            if calendar_id not in self._calendars:
+                calendars_errors[calendar_id] = [{'domain': 'global', 'reason': 'notFound'}]
+                continue
+            busy = self.busy_ranges(calendar_id, time_min, time_max)
+            if busy:
+                calendars[calendar_id] = busy
+
+        return FreeBusy(
+            time_min=self._to_datetime(self._to_timestamp(time_min)),
+            time_max=self._to_datetime(self._to_timestamp(time_max)),
+            groups={},
+            calendars=calendars,
+            calendars_errors=calendars_errors
+        )
+
+    def _merged_blocks(self, calendar_ids, time_min, time_max) -> Iterable[Tuple[int, int]]:
+        if calendar_ids is None:
+            calendar_ids = self.calendar_ids
+        elif isinstance(calendar_ids, str):
+            calendar_ids = [calendar_ids]
+        time_min = self._to_timestamp(time_min) if time_min is not None else _MIN_TIMESTAMP
+        time_max = self._to_timestamp(time_max) if time_max is not None else _MAX_TIMESTAMP
+
+        slices = [self._calendars[c].slice(time_min, time_max) for c in calendar_ids if c in self._calendars]
+        if len(slices) == 1:
+            return slices[0]
+        return _coalesce(merge(*slices))
+
+    def _add_blocks(self, calendar_id: str, blocks: List[Tuple[int, int]]):
+        existing = self._calendars.get(calendar_id)
+        if existing is not None:
+            blocks.extend(existing)
+        blocks.sort()
+        self._calendars[calendar_id] = _BusyBlocks(blocks)
+
+    def _get_event_json_block(self, event_json: dict) -> Optional[Tuple[int, int]]:
+        start = event_json.get('start')
+        if (
+                start is None
+                or event_json.get('status') == 'cancelled'
+                or event_json.get('transparency') == Transparency.TRANSPARENT
+                or any(a.get('self') and a.get('responseStatus') == ResponseStatus.DECLINED
+                       for a in event_json.get('attendees', ()))
+        ):
+            return None
+        end = event_json.get('end', start)
+        return self._get_timestamp(start), self._get_timestamp(end)
+
+    def _get_event_block(self, event: Event) -> Optional[Tuple[int, int]]:
+        if (
+                event.start is None
+                or event.other.get('status') == 'cancelled'
+                or event.transparency == Transparency.TRANSPARENT
+                or any(isinstance(a, Attendee) and a.is_self and a.response_status == ResponseStatus.DECLINED
+                       for a in event.attendees)
+        ):
+            return None
+        end = event.end if event.end is not None else event.start
+        return self._to_timestamp(event.start), self._to_timestamp(end)
+
+    def _get_timestamp(self, time_json: dict) -> int:
+        if 'date' in time_json:
+            d = parse_datetime(time_json['date']).date()
+            return int(datetime.combine(d, time(), tzinfo=self._tz).timestamp())
+        return int(parse_datetime(time_json['dateTime']).timestamp())
+
+    def _to_timestamp(self, value: Union[date, datetime, BeautifulDate, int]) -> int:
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, datetime):
+            return int(ensure_localisation(value, self.timezone).timestamp())
+        return int(datetime.combine(value, time(), tzinfo=self._tz).timestamp())
+
+    @staticmethod
+    def _to_datetime(timestamp: int) -> datetime:
+        return datetime.fromtimestamp(timestamp, _UTC)
+
+    def _to_time_range(self, start: int, end: int) -> TimeRange:
+        return TimeRange(self._to_datetime(start), self._to_datetime(end))
+
+    def __contains__(self, calendar_id):
+        return calendar_id in self._calendars
+
+    def __len__(self):
+        return len(self._calendars)
+
+    def __str__(self):
+        return '<BusyIndex {} calendars>'.format(len(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+_UTC = tzutc()
+_MIN_TIMESTAMP = -2 ** 62
+_MAX_TIMESTAMP = 2 ** 62
+
+
+def _coalesce(blocks: Iterable[Tuple[int, int]]) -> Iterable[Tuple[int, int]]:
+    """Merges overlapping and touching blocks sorted by start."""
+    started = False
+    current_start = current_end = 0
+    for start, end in blocks:
+        if end <= start:
+            continue
+        if started and start <= current_end:
+            current_end = max(current_end, end)
+            continue
+        if started:
+            yield current_start, current_end
+        current_start, current_end, started = start, end, True
+    if started:
+        yield current_start, current_end
+
+
+# Interval sets are pairs of sorted arrays of int64 timestamps (starts and ends) of non-overlapping intervals.
+# NumPy arrays are used if NumPy is installed, `array` otherwise.
+
+def _normalize(starts, ends):
+    """Sorts and merges the intervals."""
+    if np is None:
+        merged = list(_coalesce(sorted(zip(starts, ends))))
+        return array('q', (s for s, _ in merged)), array('q', (e for _, e in merged))
+
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    non_empty = ends > starts
+    starts, ends = starts[non_empty], ends[non_empty]
+    if len(starts) == 0:
+        return starts, ends
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    # Interval starts a new block if it starts after all the previous ones ended
+    previous_end = np.maximum.accumulate(ends)
+    new_block = np.empty(len(starts), dtype=bool)
+    new_block[0] = True
+    new_block[1:] = starts[1:] > previous_end[:-1]
+    block_starts = np.flatnonzero(new_block)
+    return starts[block_starts], np.maximum.reduceat(ends, block_starts)
+
+
+def _union(intervals):
+    if np is None:
+        return _normalize([s for starts, _ in intervals for s in starts], [e for _, ends in intervals for e in ends])
+    if not intervals:
+        return _normalize([], [])
+    return _normalize(np.concatenate([starts for starts, _ in intervals]),
+                      np.concatenate([ends for _, ends in intervals]))
+
+
+def _intersection(intervals):
+    """Intervals when all the interval sets overlap. Sweep over the starts (+1) and ends (-1) of the intervals
+    with ends first for the same time, so that touching intervals don't overlap."""
+    k = len(intervals)
+    if np is None:
+        points = sorted([(s, 1) for starts, _ in intervals for s in starts] +
+                        [(e, -1) for _, ends in intervals for e in ends])
+        result_starts, result_ends = array('q'), array('q')
+        count = 0
+        for i, (t, delta) in enumerate(points):
+            count += delta
+            if count == k and points[i + 1][0] > t:
+                result_starts.append(t)
+                result_ends.append(points[i + 1][0])
+        return result_starts, result_ends
+
+    times = np.concatenate([starts for starts, _ in intervals] + [ends for _, ends in intervals])
+    deltas = np.concatenate([np.ones(len(starts), dtype=np.int64) for starts, _ in intervals] +
+                            [-np.ones(len(ends), dtype=np.int64) for _, ends in intervals])
+    order = np.lexsort((deltas, times))
+    times = times[order]
+    counts = np.cumsum(deltas[order])
+    all_busy = np.flatnonzero(counts[:-1] == k)
+    starts, ends = times[all_busy], times[all_busy + 1]
+    non_empty = ends > starts
+    return starts[non_empty], ends[non_empty]
+
+
+def _complement(intervals, window_min, window_max, min_duration=1):
+    """Gaps between the intervals within the window that are at least `min_duration` long."""
+    starts, ends = intervals
+    if np is None:
+        free_starts, free_ends = array('q'), array('q')
+        for free_start, free_end in zip([window_min] + list(ends), list(starts) + [window_max]):
+            free_start, free_end = max(free_start, window_min), min(free_end, window_max)
+            if free_end - free_start >= min_duration:
+                free_starts.append(free_start)
+                free_ends.append(free_end)
+        return free_starts, free_ends
+
+    free_starts = np.maximum(np.concatenate(([window_min], ends)), window_min)
+    free_ends = np.minimum(np.concatenate((starts, [window_max])), window_max)
+    long_enough = free_ends - free_starts >= min_duration
+    return free_starts[long_enough], free_ends[long_enough]
+
+
+def _busy_per_bucket(intervals, window_min, window_max, width):
+    """Total busy seconds of all the interval sets in each fixed-width bucket starting at `window_min`."""
+    n_buckets = max(0, -(-(window_max - window_min) // width))
+    if np is None:
+        busy = [0] * n_buckets
+        for starts, ends in intervals:
+            for start, end in zip(starts, ends):
+                start, end = max(start, window_min), min(end, window_max)
+                while start < end:
+                    i = (start - window_min) // width
+                    bucket_end = min(window_min + (i + 1) * width, end)
+                    busy[i] += bucket_end - start
+                    start = bucket_end
+        return busy
+
+    edges = np.minimum(window_min + np.arange(n_buckets + 1, dtype=np.int64) * width, window_max)
+    busy = np.zeros(n_buckets, dtype=np.int64)
+    for starts, ends in intervals:
+        if len(starts) == 0:
+            continue
+        durations = ends - starts
+        busy_before = np.concatenate(([0], np.cumsum(durations)))
+        # Busy time before each edge: complete intervals that started before the edge,
+        # minus the part of the last of them after the edge
+        started = np.searchsorted(starts, edges, side='right')
+        last = np.maximum(started - 1, 0)
+        overlap = np.clip(ends[last] - edges, 0, None)
+        cumulative = np.where(started > 0, busy_before[started] - overlap, 0)
+        busy += np.diff(cumulative)
+    return busy.tolist()
+
+
+_BUCKET_RE = re.compile(r'(\d+)\s*(s|m|min|h|d|w)')
+_BUCKET_UNITS = {'s': 1, 'm': 60, 'min': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def _get_bucket_seconds(bucket: Union[str, timedelta]) -> int:
+    if isinstance(bucket, timedelta):
+        seconds = int(bucket.total_seconds())
+    else:
+        match = _BUCKET_RE.fullmatch(bucket.strip())
+        if match is None:
+            raise ValueError('Invalid bucket "{}". Use e.g. "15m", "1h" or "1d".'.format(bucket))
+        seconds = int(match.group(1)) * _BUCKET_UNITS[match.group(2)]
+    if seconds <= 0:
+        raise ValueError('Bucket must be positive.')
+    return seconds
+
+
 class FreeBusyQueryError(Exception):
     def __init__(self, groups_errors, calendars_errors):
         message = '\n'
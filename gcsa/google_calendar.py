@@ -2,6 +2,9 @@ from typing import Optional
 
 from google.oauth2.credentials import Credentials
 
+from .cache import EventCache
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 from ._services.acl_service import ACLService
 from ._services.events_service import EventsService, SendUpdatesMode  # noqa: F401
 from ._services.calendars_service import CalendarsService
@@ -34,7 +37,11 @@ class GoogleCalendar(
             authentication_flow_host: str = 'localhost',
             authentication_flow_port: int = 8080,
             authentication_flow_bind_addr: Optional[str] = None,
-            open_browser: Optional[bool] = None
+            open_browser: Optional[bool] = None,
+            event_cache: Optional[EventCache] = None,
+            http_pool_size: int = 10,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None
     ):
         """
         Specify ``credentials`` to use in requests or ``credentials_path`` and ``token_path`` to get credentials from.
@@ -76,6 +83,20 @@ class GoogleCalendar(
                     - `True`: try opening the URL in the browser,
                       raise `webbrowser.Error` if runnable browser can not be located
                     - `False`: do not open URL in the browser.
+        :param event_cache:
+                Cache of the events (:py:class:`~gcsa.cache.LRUEventCache` or
+                :py:class:`~gcsa.cache.SQLiteEventCache`). If specified, events are stored in the cache and
+                :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_event` only downloads the event if it was
+                modified since it was cached. Default: no cache
+        :param http_pool_size:
+                Maximum number of HTTP connections (and concurrent requests). `GoogleCalendar` object can be shared
+                between threads, each request uses its own connection from the pool. Default: 10
+        :param retry_policy:
+                Policy for retrying requests that failed because of the rate limits or server errors.
+                Default: no retries. Use ``RetryPolicy()`` to retry up to 5 attempts.
+        :param rate_limiter:
+                Rate limiter (e.g. :py:class:`~gcsa.rate_limit.TokenBucket`) that throttles every request before
+                it is sent. Default: no rate limiting.
         """
         super().__init__(
             default_calendar=default_calendar,
@@ -87,5 +108,9 @@ class GoogleCalendar(
             authentication_flow_host=authentication_flow_host,
             authentication_flow_port=authentication_flow_port,
             authentication_flow_bind_addr=authentication_flow_bind_addr,
-            open_browser=open_browser
+            open_browser=open_browser,
+            event_cache=event_cache,
+            http_pool_size=http_pool_size,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter
         )
@@ -0,0 +1,793 @@
+"""Streaming export and import of events in iCalendar (RFC 5545) format."""
+import calendar
+import logging
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from io import StringIO
+from mmap import mmap
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+from dateutil.tz import gettz, tzical, tzstr, tzutc
+from tzlocal import get_localzone_name
+from tzlocal.windows_tz import win_tz
+
+from .attachment import Attachment
+from .attendee import Attendee, ResponseStatus
+from .bulk_import import generate_event_id
+from .event import Event, Transparency, Visibility
+from .person import Person
+from .reminders import EmailReminder, PopupReminder, Reminder
+from .serializers.event_serializer import EventSerializer
+from .util.date_time_util import parse_datetime
+
+log = logging.getLogger(__name__)
+
+try:
+    # Conversions with zoneinfo are an order of magnitude faster than with dateutil
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None  # type: ignore
+
+PRODUCT_ID = '-//gcsa//Google Calendar Simple API//EN'
+
+_CRLF = '\r\n'
+# Maximum length of the line in octets (without CRLF)
+_MAX_LINE_LENGTH = 75
+_UTC = tzutc()
+_UTC_TIMEZONES = ('UTC', 'Etc/UTC', 'GMT', 'Etc/GMT', 'Z')
+_TZID_RE = re.compile(r';TZID=("?)([^;:"]+)\1[;:]')
+
+_PARTICIPATION_STATUSES = {
+    ResponseStatus.NEEDS_ACTION: 'NEEDS-ACTION',
+    ResponseStatus.DECLINED: 'DECLINED',
+    ResponseStatus.TENTATIVE: 'TENTATIVE',
+    ResponseStatus.ACCEPTED: 'ACCEPTED',
+}
+_CLASSES = {
+    Visibility.PUBLIC: 'PUBLIC',
+    Visibility.PRIVATE: 'PRIVATE',
+    'confidential': 'CONFIDENTIAL',
+}
+_RESPONSE_STATUSES = {v: k for k, v in _PARTICIPATION_STATUSES.items()}
+_VISIBILITIES = {v: k for k, v in _CLASSES.items()}
+_STATUSES = ('CONFIRMED', 'TENTATIVE', 'CANCELLED')
+_RECURRENCE_PROPERTIES = ('RRULE', 'EXRULE', 'RDATE', 'EXDATE')
+
+_DURATION_RE = re.compile(r'([+-]?)P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+_ESCAPED_RE = re.compile(r'\\([\\;,nN])')
+_UNESCAPED = {'\\': '\\', ';': ';', ',': ',', 'n': '\n', 'N': '\n'}
+
+# Limits of the reminders in Google Calendar
+_MAX_REMINDERS = 5
+_MAX_REMINDER_MINUTES = 4 * 7 * 24 * 60
+
+
+def write_ics(
+        events: Iterable[Event],
+        file: IO[str],
+        *,
+        calendar_name: Optional[str] = None,
+        product_id: str = PRODUCT_ID
+) -> int:
+    """Writes `events` to the `file` as iCalendar (RFC 5545) VCALENDAR with a VEVENT per event.
+
+    Events are consumed lazily and each one is written as soon as it is formatted, so the memory doesn't depend on
+    the number of events. Recurrence lines (RRULE, EXRULE, RDATE and EXDATE) are written as they are in
+    `Event.recurrence`, instances of the recurring events (e.g. from
+    :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_instances`) get RECURRENCE-ID. Times are written in the
+    timezone of the event with VTIMEZONE definitions of the used timezones at the end of the calendar.
+
+    .. code-block:: python
+
+        with open('calendar.ics', 'w', encoding='utf-8', newline='') as f:
+            write_ics(gc.get_events(time_min, time_max, lazy=True), f)
+
+    :param events:
+            Iterable of `Event` objects, e.g. from :py:meth:`~gcsa.google_calendar.GoogleCalendar.get_events`.
+    :param file:
+            Text file object opened for writing. Lines are terminated with CRLF as required by the RFC, so the file
+            should be opened with ``newline=''`` to avoid their translation.
+    :param calendar_name:
+            Name of the calendar (X-WR-CALNAME property).
+    :param product_id:
+            Identifier of the product that created the calendar (PRODID property).
+
+    :return:
+            Number of written events.
+
+    :raises:
+            ValueError if an event has no start (e.g. from the partial response without "start").
+    """
+    header = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:' + product_id, 'CALSCALE:GREGORIAN']
+    if calendar_name is not None:
+        header.append('X-WR-CALNAME:' + _escape(calendar_name))
+    file.write(''.join(_fold(line) + _CRLF for line in header))
+
+    writer = _EventWriter()
+    count = 0
+    for event in events:
+        file.write(writer.format_event(event))
+        count += 1
+
+    for tzid, year in writer.timezones.items():
+        file.write(_format_timezone(tzid, year))
+    file.write('END:VCALENDAR' + _CRLF)
+    return count
+
+
+class _EventWriter:
+    """Formats events to VEVENT components and collects timezones used by them."""
+
+    def __init__(self) -> None:
+        # Year of the first use by timezone id
+        self.timezones: Dict[str, int] = {}
+        self._tzinfos: Dict[str, Optional[tzinfo]] = {}
+        self._dtstamp = _format_utc(datetime.now(_UTC))
+
+    def format_event(self, event: Event) -> str:
+        if event.start is None:
+            raise ValueError('Event "{}" has no start, which is required in iCalendar.'.format(event.event_id))
+
+        lines = ['BEGIN:VEVENT']
+        add = lines.append
+
+        ical_uid = event.other.get('iCalUID')
+        if ical_uid is None:
+            ical_uid = '{}@google.com'.format(event.event_id) if event.event_id else _generate_uid(event)
+        add('UID:' + ical_uid)
+        add('DTSTAMP:' + (_format_utc(event.updated) if event.updated is not None else self._dtstamp))
+
+        timezone = event.timezone
+        add('DTSTART' + self._format_date_time(event.start, timezone))
+        if event.end is not None:
+            add('DTEND' + self._format_date_time(event.end, timezone))
+        original_start = event.other.get('originalStartTime')
+        if original_start and event.recurring_event_id is not None:
+            if 'date' in original_start:
+                add('RECURRENCE-ID' + self._format_date_time(parse_datetime(original_start['date']).date(), timezone))
+            else:
+                add('RECURRENCE-ID' + self._format_date_time(parse_datetime(original_start['dateTime']), timezone))
+
+        for line in event.recurrence:
+            add(line)
+            if ';TZID=' in line:
+                self._add_timezone(line, event.start)
+
+        if event.summary:
+            add('SUMMARY:' + _escape(event.summary))
+        if event.description:
+            add('DESCRIPTION:' + _escape(event.description))
+        if event.location:
+            add('LOCATION:' + _escape(event.location))
+
+        status = event.other.get('status')
+        if status:
+            add('STATUS:' + status.upper())
+        if event.transparency:
+            add('TRANSP:' + event.transparency.upper())
+        if event.visibility in _CLASSES:
+            add('CLASS:' + _CLASSES[event.visibility])
+        sequence = event.other.get('sequence')
+        if sequence is not None:
+            add('SEQUENCE:{}'.format(sequence))
+        if event.created is not None:
+            add('CREATED:' + _format_utc(event.created))
+        if event.updated is not None:
+            add('LAST-MODIFIED:' + _format_utc(event.updated))
+
+        organizer = event.organizer
+        if organizer is not None and organizer.email:
+            add('ORGANIZER' + _format_cn(organizer.display_name) + ':mailto:' + organizer.email)
+        for attendee in event.attendees:
+            if not isinstance(attendee, Attendee) or not attendee.email:
+                continue
+            parameters = _format_cn(attendee.display_name)
+            if attendee.is_resource:
+                parameters += ';CUTYPE=RESOURCE'
+            parameters += ';ROLE=OPT-PARTICIPANT' if attendee.optional else ';ROLE=REQ-PARTICIPANT'
+            if attendee.response_status in _PARTICIPATION_STATUSES:
+                parameters += ';PARTSTAT=' + _PARTICIPATION_STATUSES[attendee.response_status]
+            if attendee.additional_guests:
+                parameters += ';X-NUM-GUESTS={}'.format(attendee.additional_guests)
+            add('ATTENDEE' + parameters + ':mailto:' + attendee.email)
+
+        for attachment in event.attachments:
+            if attachment.mime_type:
+                add('ATTACH;FMTTYPE=' + attachment.mime_type + ':' + attachment.file_url)
+            else:
+                add('ATTACH:' + attachment.file_url)
+
+        if not event.default_reminders:
+            for reminder in event.reminders:
+                minutes_before_start = cast(int, reminder.convert_to_relative(event.start).minutes_before_start)
+                lines.extend(_format_alarm(event, minutes_before_start, reminder.method == 'email'))
+
+        add('END:VEVENT')
+        return ''.join(_fold(line) + _CRLF for line in lines)
+
+    def _format_date_time(self, d: Union[date, datetime], timezone: Optional[str]) -> str:
+        """Formats parameters and value of the DTSTART-like property (starting with ";" or ":")."""
+        if not isinstance(d, datetime):
+            return ';VALUE=DATE:{:04d}{:02d}{:02d}'.format(d.year, d.month, d.day)
+        if d.tzinfo is None:
+            # Floating time
+            return ':' + _format_local(d)
+        if timezone is None or timezone in _UTC_TIMEZONES:
+            return ':' + _format_utc(d)
+
+        if timezone not in self._tzinfos:
+            self._tzinfos[timezone] = _get_tzinfo(timezone)
+        tz = self._tzinfos[timezone]
+        if tz is None:
+            # Unknown timezone
+            return ':' + _format_utc(d)
+        self.timezones.setdefault(timezone, d.year)
+        return ';TZID=' + timezone + ':' + _format_local(d.astimezone(tz))
+
+    def _add_timezone(self, line: str, start: Union[date, datetime]):
+        match = _TZID_RE.search(line)
+        if match is not None and match.group(2) not in _UTC_TIMEZONES and _get_tzinfo(match.group(2)) is not None:
+            self.timezones.setdefault(match.group(2), start.year)
+
+
+def read_ics(
+        file: Union[IO[str], IO[bytes], mmap],
+        *,
+        timezone: str = get_localzone_name(),
+        strict: bool = False
+) -> Iterator[Event]:
+    """Lazily parses VEVENT components of the iCalendar (RFC 5545) `file` into `Event` objects.
+
+    The file is read line by line and only the lines of the current event are kept in memory, so files of any size
+    can be imported. Events can be passed right to the
+    :py:meth:`~gcsa.google_calendar.GoogleCalendar.bulk_import` that parses the file while the previous events
+    are being submitted:
+
+    .. code-block:: python
+
+        with open('calendar.ics', 'rb') as f:
+            result = gc.bulk_import(read_ics(f), checkpoint_path='import.checkpoint')
+
+    UID goes to the "iCalUID" field, RECURRENCE-ID of the modified instances to the "originalStartTime" field
+    (both in `Event.other`). Recurrence lines (RRULE, EXRULE, RDATE and EXDATE) are kept as they are.
+    Attendees, organizer, attachments (by URL) and alarms (as reminders between 0 and 4 weeks before the start)
+    are converted as well. Other properties are ignored.
+
+    TZID can be an IANA timezone name (also as a suffix, e.g. "/mozilla.org/20050126_1/Europe/Prague") or
+    a Windows timezone name (e.g. "Pacific Standard Time" used by Outlook). Other timezones are taken from
+    the VTIMEZONE components that precede the event, if any, and times are converted to the default `timezone`
+    (RDATE and EXDATE values to UTC).
+
+    :param file:
+            Text or binary file object (e.g. `open('calendar.ics', 'rb')`) or `mmap` of the file.
+    :param timezone:
+            Timezone of the events with floating times (without TZID or UTC designator) and with unknown TZID.
+            Default: the computers local timezone.
+    :param strict:
+            Whether to raise `ValueError` for the invalid VEVENT component (e.g. without DTSTART).
+            By default, invalid components are skipped with a warning and the rest of the file is read.
+
+    :return:
+            Iterator of `Event` objects.
+    """
+    reader = _EventReader(timezone)
+    lines: Optional[List[str]] = None
+    component = None
+    for line in _unfold(file):
+        if lines is None:
+            if line[:6].upper() == 'BEGIN:':
+                component = line[6:].strip().upper()
+                if component in ('VEVENT', 'VTIMEZONE'):
+                    lines = []
+            continue
+        if line[:4].upper() == 'END:' and line[4:].strip().upper() == component:
+            if component == 'VEVENT':
+                try:
+                    event = reader.to_event(lines)
+                except ValueError as e:
+                    if strict:
+                        raise
+                    log.warning('Skipping invalid VEVENT: %s', e)
+                else:
+                    yield event
+            else:
+                reader.add_timezone(lines)
+            lines = None
+        else:
+            lines.append(line)
+
+
+class _EventReader:
+    """Converts lines of VEVENT components to events and keeps timezones defined by VTIMEZONE components."""
+
+    def __init__(self, timezone: str) -> None:
+        self.timezone = timezone
+        self._default_tzinfo = _get_tzinfo(timezone) or _UTC
+        # Lines of the VTIMEZONE components by TZID
+        self._vtimezones: Dict[str, List[str]] = {}
+        # (IANA name or None, tzinfo) by TZID
+        self._timezones: Dict[str, Tuple[Optional[str], tzinfo]] = {}
+
+    def add_timezone(self, lines: List[str]):
+        for line in lines:
+            name, _, value = _parse_content_line(line)
+            if name == 'TZID':
+                self._vtimezones[value] = lines
+                self._timezones.pop(value, None)
+                return
+
+    def to_event(self, lines: List[str]) -> Event:
+        properties: Dict[str, Tuple[Dict[str, str], str]] = {}
+        attendees = []
+        attachments = []
+        recurrence = []
+        alarms: List[Dict[str, Tuple[Dict[str, str], str]]] = []
+        alarm: Optional[Dict[str, Tuple[Dict[str, str], str]]] = None
+
+        for line in lines:
+            name, parameters, value = _parse_content_line(line)
+            if alarm is not None:
+                if name == 'END':
+                    alarms.append(alarm)
+                    alarm = None
+                else:
+                    alarm[name] = (parameters, value)
+            elif name == 'BEGIN':
+                if value.upper() == 'VALARM':
+                    alarm = {}
+            elif name == 'ATTENDEE':
+                attendees.append(_to_attendee(parameters, value))
+            elif name == 'ATTACH':
+                if parameters.get('VALUE') != 'BINARY':
+                    attachments.append(Attachment(
+                        value,
+                        title=parameters.get('X-FILENAME') or parameters.get('FILENAME'),
+                        mime_type=parameters.get('FMTTYPE')
+                    ))
+            elif name in _RECURRENCE_PROPERTIES:
+                recurrence.append(self._to_recurrence_line(line, name, parameters))
+            elif name not in properties:
+                properties[name] = (parameters, value)
+
+        if 'DTSTART' not in properties:
+            raise ValueError('Event {} has no DTSTART.'.format(properties.get('UID', ({}, ''))[1]))
+        start, timezone = self._to_date_time(*properties['DTSTART'])
+        if 'DTEND' in properties:
+            end, _ = self._to_date_time(*properties['DTEND'])
+        elif 'DURATION' in properties:
+            end = start + _parse_duration(properties['DURATION'][1])
+        elif isinstance(start, datetime):
+            # Event without duration ends when it starts (RFC 5545 section 3.6.1)
+            end = start
+        else:
+            end = start + timedelta(days=1)
+
+        other: Dict[str, Any] = {}
+        if 'UID' in properties:
+            other['iCalUID'] = properties['UID'][1]
+        if 'RECURRENCE-ID' in properties:
+            original_start, original_timezone = self._to_date_time(*properties['RECURRENCE-ID'])
+            if isinstance(original_start, datetime):
+                other['originalStartTime'] = {'dateTime': original_start.isoformat(), 'timeZone': original_timezone}
+            else:
+                other['originalStartTime'] = {'date': original_start.isoformat()}
+        if 'STATUS' in properties and properties['STATUS'][1].upper() in _STATUSES:
+            other['status'] = properties['STATUS'][1].lower()
+        if 'SEQUENCE' in properties:
+            other['sequence'] = int(properties['SEQUENCE'][1])
+
+        organizer = None
+        if 'ORGANIZER' in properties:
+            parameters, value = properties['ORGANIZER']
+            organizer = Person(_get_email(value), display_name=parameters.get('CN'))
+
+        transparency = properties.get('TRANSP', ({}, ''))[1].lower() or None
+        visibility = properties.get('CLASS', ({}, ''))[1].upper()
+        return Event(
+            _unescape(properties['SUMMARY'][1]) if 'SUMMARY' in properties else None,
+            start=start,
+            end=end,
+            timezone=timezone,
+            description=_unescape(properties['DESCRIPTION'][1]) if 'DESCRIPTION' in properties else None,
+            location=_unescape(properties['LOCATION'][1]) if 'LOCATION' in properties else None,
+            recurrence=recurrence,
+            visibility=_VISIBILITIES.get(visibility, Visibility.DEFAULT),
+            attendees=attendees,
+            attachments=attachments,
+            reminders=self._to_reminders(alarms, start, end),
+            transparency=transparency if transparency in (Transparency.OPAQUE, Transparency.TRANSPARENT) else None,
+            _organizer=organizer,
+            _created=self._to_utc(properties.get('CREATED')),
+            _updated=self._to_utc(properties.get('LAST-MODIFIED')),
+            **other
+        )
+
+    def _to_date_time(self, parameters: Dict[str, str], value: str) -> Tuple[Union[date, datetime], str]:
+        """Returns date/datetime of the DTSTART-like property and IANA name of its timezone."""
+        try:
+            if parameters.get('VALUE') == 'DATE' or len(value) == 8:
+                return date(int(value[:4]), int(value[4:6]), int(value[6:8])), self.timezone
+            dt = datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                          int(value[9:11]), int(value[11:13]), int(value[13:15]))
+        except ValueError:
+            raise ValueError('Invalid date or date-time "{}".'.format(value))
+        if value.endswith('Z'):
+            return dt.replace(tzinfo=_UTC), 'UTC'
+        if 'TZID' in parameters:
+            timezone, tz = self._get_timezone(parameters['TZID'])
+            if timezone is None:
+                # Timezone without IANA name (e.g. from VTIMEZONE) is converted to the default one
+                return dt.replace(tzinfo=tz).astimezone(self._default_tzinfo), self.timezone
+            return dt.replace(tzinfo=tz), timezone
+        # Floating time
+        return dt.replace(tzinfo=self._default_tzinfo), self.timezone
+
+    def _to_utc(self, date_time_property: Optional[Tuple[Dict[str, str], str]]) -> Optional[datetime]:
+        if date_time_property is None:
+            return None
+        dt, _ = self._to_date_time(*date_time_property)
+        return dt if isinstance(dt, datetime) else None
+
+    def _get_timezone(self, tzid: str) -> Tuple[Optional[str], tzinfo]:
+        """Returns IANA name (or None if it is unknown) and tzinfo of the TZID."""
+        timezone = self._timezones.get(tzid)
+        if timezone is not None:
+            return timezone
+
+        # IANA name (possibly with a prefix), or Windows name
+        parts = tzid.strip('/').split('/')
+        candidates = ['/'.join(parts[i:]) for i in range(max(len(parts) - 3, 0), len(parts))]
+        if tzid in win_tz:
+            candidates.insert(0, win_tz[tzid])
+        for name in candidates:
+            tz = _get_tzinfo(name) if name else None
+            if tz is not None:
+                timezone = (name, tz)
+                break
+        else:
+            tz = None
+            if tzid in self._vtimezones:
+                tz = tzical(StringIO('\r\n'.join(
+                    ['BEGIN:VTIMEZONE'] + self._vtimezones[tzid] + ['END:VTIMEZONE']
+                ))).get(tzid)
+            timezone = (None, tz or self._default_tzinfo)
+
+        self._timezones[tzid] = timezone
+        return timezone
+
+    def _to_recurrence_line(self, line: str, name: str, parameters: Dict[str, str]) -> str:
+        """Returns recurrence line with the IANA timezone name in TZID, if it is known,
+        or with the times converted to UTC otherwise."""
+        if name in ('RDATE', 'EXDATE') and 'TZID' in parameters:
+            timezone, tz = self._get_timezone(parameters['TZID'])
+            if timezone != parameters['TZID']:
+                _, _, value = line.rpartition(':')
+                other_parameters = ''.join(';{}={}'.format(k, v) for k, v in parameters.items() if k != 'TZID')
+                if timezone is not None:
+                    return '{};TZID={}{}:{}'.format(name, timezone, other_parameters, value)
+                # PERIOD values are converted at both ends (if the end is not a duration)
+                values = ','.join(
+                    '/'.join(_to_utc_value(v, tz) for v in period.split('/'))
+                    for period in value.split(',')
+                )
+                return '{}{}:{}'.format(name, other_parameters, values)
+        if line[:len(name)] != name:
+            return name + line[len(name):]
+        return line
+
+    def _to_reminders(
+            self,
+            alarms: List[Dict[str, Tuple[Dict[str, str], str]]],
+            start: Union[date, datetime],
+            end: Union[date, datetime]
+    ) -> List[Reminder]:
+        reminders: List[Reminder] = []
+        for alarm in alarms:
+            if 'TRIGGER' not in alarm:
+                continue
+            parameters, value = alarm['TRIGGER']
+            if parameters.get('VALUE') == 'DATE-TIME':
+                trigger, _ = self._to_date_time(parameters, value)
+                start_datetime = _to_datetime(start, self._default_tzinfo)
+                minutes_before_start = int((start_datetime - _to_datetime(trigger, _UTC)).total_seconds()) // 60
+            else:
+                offset = _parse_duration(value)
+                if parameters.get('RELATED') == 'END':
+                    offset += _to_datetime(end, _UTC) - _to_datetime(start, _UTC)
+                minutes_before_start = -int(offset.total_seconds()) // 60
+
+            # Range of the reminders supported by Google Calendar
+            if not 0 <= minutes_before_start <= _MAX_REMINDER_MINUTES:
+                continue
+            action = alarm.get('ACTION', ({}, 'DISPLAY'))[1].upper()
+            reminder: Reminder
+            if action == 'EMAIL':
+                reminder = EmailReminder(minutes_before_start)
+            else:
+                reminder = PopupReminder(minutes_before_start)
+            # Constructors replace 0 with the default value
+            reminder.minutes_before_start = minutes_before_start
+            if reminder not in reminders:
+                reminders.append(reminder)
+        return reminders[:_MAX_REMINDERS]
+
+
+def _format_alarm(event: Event, minutes_before_start: int, email: bool) -> List[str]:
+    trigger = 'TRIGGER:-PT{}M'.format(minutes_before_start) if minutes_before_start >= 0 \
+        else 'TRIGGER:PT{}M'.format(-minutes_before_start)
+    description = 'DESCRIPTION:' + _escape(event.summary or 'This is an event reminder')
+    if not email:
+        return ['BEGIN:VALARM', 'ACTION:DISPLAY', trigger, description, 'END:VALARM']
+    lines = ['BEGIN:VALARM', 'ACTION:EMAIL', trigger, description, 'SUMMARY:Alarm notification']
+    if event.organizer is not None and event.organizer.email:
+        lines.append('ATTENDEE:mailto:' + event.organizer.email)
+    lines.append('END:VALARM')
+    return lines
+
+
+def _format_timezone(tzid: str, year: int) -> str:
+    """Formats VTIMEZONE component with the rules of the timezone in the given `year` (as observed since 1970)."""
+    # Only known timezones are collected
+    tz = cast(tzinfo, _get_tzinfo(tzid))
+    transitions = _get_transitions(tz, year)
+    lines = ['BEGIN:VTIMEZONE', 'TZID:' + tzid]
+    if not transitions:
+        offset = cast(timedelta, tz.utcoffset(datetime(year, 1, 1)))
+        lines += [
+            'BEGIN:STANDARD',
+            'DTSTART:19700101T000000',
+            'TZOFFSETFROM:' + _format_offset(offset),
+            'TZOFFSETTO:' + _format_offset(offset),
+        ]
+        name = tz.tzname(datetime(year, 1, 1))
+        if name:
+            lines.append('TZNAME:' + name)
+        lines.append('END:STANDARD')
+    for moment, offset_from, offset_to in transitions:
+        component = 'DAYLIGHT' if moment.astimezone(tz).dst() else 'STANDARD'
+        # Start of the observance in the local time before the transition
+        local = (moment + offset_from).replace(tzinfo=None)
+        days_in_month = calendar.monthrange(local.year, local.month)[1]
+        week = -1 if local.day + 7 > days_in_month else (local.day - 1) // 7 + 1
+        week_day = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')[local.weekday()]
+        lines += [
+            'BEGIN:' + component,
+            'DTSTART:' + _format_local(_nth_week_day(1970, local.month, local.weekday(), week, local)),
+            'RRULE:FREQ=YEARLY;BYMONTH={};BYDAY={}{}'.format(local.month, week, week_day),
+            'TZOFFSETFROM:' + _format_offset(offset_from),
+            'TZOFFSETTO:' + _format_offset(offset_to),
+        ]
+        name = moment.astimezone(tz).tzname()
+        if name:
+            lines.append('TZNAME:' + name)
+        lines.append('END:' + component)
+    lines.append('END:VTIMEZONE')
+    return ''.join(_fold(line) + _CRLF for line in lines)
+
+
+def _get_transitions(tz, year: int) -> list:
+    """Returns (UTC moment, offset before, offset after) of the offset changes of the `tz` in the `year`."""
+    transitions = []
+    day = datetime(year, 1, 1, tzinfo=_UTC)
+    offset = day.astimezone(tz).utcoffset()
+    for _ in range(366):
+        next_day = day + timedelta(days=1)
+        next_offset = next_day.astimezone(tz).utcoffset()
+        if next_offset != offset:
+            # Bisect the minute of the change
+            low, high = 0, 24 * 60
+            while high - low > 1:
+                middle = (low + high) // 2
+                if (day + timedelta(minutes=middle)).astimezone(tz).utcoffset() == offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append((day + timedelta(minutes=high), offset, next_offset))
+        day, offset = next_day, next_offset
+    return transitions
+
+
+def _nth_week_day(year: int, month: int, week_day: int, n: int, local_time: datetime) -> datetime:
+    """Returns `n`-th (or last if -1) `week_day` of the month with the time of the `local_time`."""
+    first_week_day, days_in_month = calendar.monthrange(year, month)
+    if n > 0:
+        day = 1 + (week_day - first_week_day) % 7 + (n - 1) * 7
+    else:
+        last_week_day = (first_week_day + days_in_month - 1) % 7
+        day = days_in_month - (last_week_day - week_day) % 7
+    return local_time.replace(year=year, month=month, day=day)
+
+
+def _get_tzinfo(tzid: str) -> Optional[tzinfo]:
+    """Returns tzinfo of the IANA timezone or None if it is unknown."""
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(tzid)
+        except (KeyError, ValueError):
+            # Not found (e.g. without system timezone database), try dateutil's bundled one
+            pass
+    tz = gettz(tzid)
+    # gettz also parses POSIX TZ strings (e.g. "X1"), which are not timezone names
+    return None if isinstance(tz, tzstr) else tz
+
+
+def _generate_uid(event: Event) -> str:
+    return '{}@gcsa'.format(generate_event_id(EventSerializer.to_json(event)))
+
+
+def _unfold(file):
+    """Yields unfolded content lines of the file (RFC 5545 section 3.1). Lines of binary files are decoded
+    as UTF-8 after unfolding, so the characters split between the folded lines are decoded correctly."""
+    readline = file.readline
+    first = readline()
+    binary = isinstance(first, bytes)
+    line_break = b'\r\n' if binary else '\r\n'
+    whitespace = (b' ', b'\t') if binary else (' ', '\t')
+
+    current = None
+    line = first
+    while line:
+        line = line.rstrip(line_break)
+        if line[:1] in whitespace and current is not None:
+            current += line[1:]
+        else:
+            if current:
+                yield current.decode('utf-8', errors='replace') if binary else current
+            current = line
+        line = readline()
+    if current:
+        yield current.decode('utf-8', errors='replace') if binary else current
+
+
+def _parse_content_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Returns upper-case name, parameters (with upper-case names) and value of the content line."""
+    colon = line.find(':')
+    semicolon = line.find(';')
+    if colon == -1:
+        raise ValueError('Invalid content line "{}".'.format(line))
+    if semicolon == -1 or semicolon > colon:
+        return line[:colon].upper(), {}, line[colon + 1:]
+
+    parameters = {}
+    i = semicolon
+    try:
+        while line[i] == ';':
+            equals = line.index('=', i)
+            key = line[i + 1:equals].upper()
+            i = equals + 1
+            if line[i] == '"':
+                end = line.index('"', i + 1)
+                parameters[key] = line[i + 1:end]
+                i = end + 1
+            else:
+                end = i
+                while line[end] not in ';:':
+                    end += 1
+                parameters[key] = line[i:end]
+                i = end
+    except (ValueError, IndexError):
+        raise ValueError('Invalid content line "{}".'.format(line))
+    if line[i] != ':':
+        raise ValueError('Invalid content line "{}".'.format(line))
+    return line[:semicolon].upper(), parameters, line[i + 1:]
+
+
+def _to_attendee(parameters: Dict[str, str], value: str) -> Attendee:
+    additional_guests = parameters.get('X-NUM-GUESTS')
+    return Attendee(
+        _get_email(value),
+        display_name=parameters.get('CN'),
+        optional=parameters.get('ROLE') in ('OPT-PARTICIPANT', 'NON-PARTICIPANT') or None,
+        is_resource=parameters.get('CUTYPE') in ('RESOURCE', 'ROOM') or None,
+        additional_guests=int(additional_guests) if additional_guests else None,
+        _response_status=_RESPONSE_STATUSES.get(parameters.get('PARTSTAT', ''))
+    )
+
+
+def _get_email(value: str) -> str:
+    return value[7:] if value[:7].lower() == 'mailto:' else value
+
+
+def _to_datetime(d: Union[date, datetime], tz: tzinfo) -> datetime:
+    """Converts date to midnight in the `tz`."""
+    if isinstance(d, datetime):
+        return d
+    return datetime(d.year, d.month, d.day, tzinfo=tz)
+
+
+def _to_utc_value(value: str, tz: tzinfo) -> str:
+    """Converts local DATE-TIME value in the `tz` to UTC. Other values (dates, UTC times, durations) are kept."""
+    if len(value) != 15 or value[8:9] != 'T':
+        return value
+    try:
+        dt = datetime(int(value[:4]), int(value[4:6]), int(value[6:8]),
+                      int(value[9:11]), int(value[11:13]), int(value[13:15]), tzinfo=tz)
+    except ValueError:
+        raise ValueError('Invalid date-time "{}".'.format(value))
+    return _format_utc(dt)
+
+
+def _parse_duration(value: str) -> timedelta:
+    """Parses DURATION value (RFC 5545 section 3.3.6), e.g. "-PT15M"."""
+    match = _DURATION_RE.fullmatch(value.strip())
+    if match is None:
+        raise ValueError('Invalid duration "{}".'.format(value))
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0),
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0)
+    )
+    return -duration if sign == '-' else duration
+
+
+def _unescape(text: str) -> str:
+    """Unescapes TEXT value (RFC 5545 section 3.3.11)."""
+    if '\\' not in text:
+        return text
+    return _ESCAPED_RE.sub(lambda m: _UNESCAPED[m.group(1)], text)
+
+
+def _format_utc(dt: datetime) -> str:
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(_UTC)
+    return _format_local(dt) + 'Z'
+
+
+def _format_local(dt: datetime) -> str:
+    return '{:04d}{:02d}{:02d}T{:02d}{:02d}{:02d}'.format(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def _format_offset(offset: timedelta) -> str:
+    seconds = int(offset.total_seconds())
+    sign = '-' if seconds < 0 else '+'
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    if seconds:
+        return '{}{:02d}{:02d}{:02d}'.format(sign, hours, minutes, seconds)
+    return '{}{:02d}{:02d}'.format(sign, hours, minutes)
+
+
+def _format_cn(name: Optional[str]) -> str:
+    """Formats CN (common name) parameter."""
+    if not name:
+        return ''
+    name = name.replace('"', "'")
+    if any(c in name for c in ';:,'):
+        return ';CN="' + name + '"'
+    return ';CN=' + name
+
+
+def _escape(text: str) -> str:
+    """Escapes TEXT value (RFC 5545 section 3.3.11)."""
+    return (
+        text.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line: str) -> str:
+    """Folds the line into parts of at most 75 octets (RFC 5545 section 3.1) without splitting UTF-8 characters."""
+    if len(line) <= _MAX_LINE_LENGTH // 4:
+        return line
+    encoded = line.encode('utf-8')
+    if len(encoded) <= _MAX_LINE_LENGTH:
+        return line
+
+    parts = []
+    start, limit = 0, _MAX_LINE_LENGTH
+    while len(encoded) - start > limit:
+        end = start + limit
+        # Continuation bytes of UTF-8 are 10xxxxxx
+        while encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end])
+        # Continuation lines start with a space
+        start, limit = end, _MAX_LINE_LENGTH - 1
+    parts.append(encoded[start:])
+    return (_CRLF + ' ').join(part.decode('utf-8') for part in parts)
@@ -2,6 +2,8 @@ from typing import Optional
 
 
 class Person:
+    __slots__ = ('email', 'display_name', 'id_', 'is_self')
+
     def __init__(
             self,
             email: Optional[str] = None,
@@ -0,0 +1,154 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class RateLimiter(ABC):
+    """Base class of the rate limiters.
+
+    Rate limiter is called before each request is sent and blocks until the request is allowed.
+    See :py:class:`~gcsa.rate_limit.TokenBucket`, :py:class:`~gcsa.rate_limit.FileTokenBucket`
+    and :py:class:`~gcsa.rate_limit.CombinedRateLimiter`.
+    """
+
+    @abstractmethod
+    def acquire(self, tokens: int = 1):
+        """Blocks until `tokens` requests are allowed to be sent."""
+        pass
+
+
+class _BaseTokenBucket(RateLimiter):
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError(f'"rate" must be positive. {rate} was provided.')
+        if capacity < 1:
+            raise ValueError(f'"capacity" must be at least 1. {capacity} was provided.')
+        self.rate = rate
+        self.capacity = capacity
+
+    def acquire(self, tokens: int = 1):
+        if tokens > self.capacity:
+            raise ValueError(f'Can not acquire {tokens} tokens from the bucket with capacity {self.capacity}.')
+        while True:
+            wait = self._take(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    @abstractmethod
+    def _take(self, tokens: int) -> float:
+        """Takes `tokens` from the bucket if there is enough of them and returns 0.
+        Otherwise, returns the time to wait until there are enough tokens."""
+        pass
+
+    def _refill(self, available: float, updated: float, now: float) -> Tuple[float, float]:
+        return min(self.capacity, available + (now - updated) * self.rate), now
+
+
+class TokenBucket(_BaseTokenBucket):
+    def __init__(
+            self,
+            rate: float,
+            capacity: float = 1
+    ):
+        """Token bucket shared by the threads of the process.
+
+        Allows bursts of up to `capacity` requests and on average `rate` requests per second.
+
+        :param rate:
+                Number of requests per second.
+        :param capacity:
+                Maximum number of requests that can be sent at once.
+        """
+        super().__init__(rate, capacity)
+        self._available = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens):
+        with self._lock:
+            self._available, self._updated = self._refill(self._available, self._updated, time.monotonic())
+            if self._available >= tokens:
+                self._available -= tokens
+                return 0
+            return (tokens - self._available) / self.rate
+
+
+class FileTokenBucket(_BaseTokenBucket):
+    def __init__(
+            self,
+            path: str,
+            rate: float,
+            capacity: float = 1
+    ):
+        """Token bucket shared by all the processes that use the same file.
+
+        State of the bucket is stored in the file at `path`, which is locked while the bucket is updated.
+        Only available on POSIX systems.
+
+        :param path:
+                Path to the file that stores the state of the bucket. Created if it doesn't exist.
+        :param rate:
+                Number of requests per second.
+        :param capacity:
+                Maximum number of requests that can be sent at once.
+        """
+        if fcntl is None:
+            raise RuntimeError('FileTokenBucket is only available on POSIX systems.')
+        super().__init__(rate, capacity)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _take(self, tokens):
+        with self._lock, open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                state = f.read().split()
+                now = time.time()
+                if len(state) == 2:
+                    available, updated = self._refill(float(state[0]), float(state[1]), now)
+                else:
+                    available, updated = float(self.capacity), now
+
+                wait = 0.0
+                if available >= tokens:
+                    available -= tokens
+                else:
+                    wait = (tokens - available) / self.rate
+
+                f.seek(0)
+                f.truncate()
+                f.write(f'{available} {updated}')
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class CombinedRateLimiter(RateLimiter):
+    def __init__(self, *rate_limiters: RateLimiter):
+        """Allows the request only when all the `rate_limiters` allow it.
+
+        Use it to apply multiple limits at once, e.g. per-user and per-project quotas:
+
+        .. code-block:: python
+
+            project_bucket = FileTokenBucket('/tmp/calendar_project.bucket', rate=100, capacity=100)
+            user_bucket = TokenBucket(rate=10, capacity=10)
+            gc = GoogleCalendar(rate_limiter=CombinedRateLimiter(user_bucket, project_bucket))
+
+        :param rate_limiters:
+                Rate limiters to acquire tokens from (in the given order).
+        """
+        self.rate_limiters = rate_limiters
+
+    def acquire(self, tokens: int = 1):
+        for rate_limiter in self.rate_limiters:
+            rate_limiter.acquire(tokens)
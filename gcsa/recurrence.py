@@ -1,5 +1,9 @@
+import re
 from datetime import datetime, date
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
+from dateutil.tz import tzutc
 from tzlocal import get_localzone_name
 
 from .util.date_time_util import ensure_localisation
@@ -40,6 +44,18 @@ class Duration:
 
         return res
 
+    def __repr__(self):
+        return '<Duration {}>'.format(self)
+
+    def __eq__(self, other):
+        return (
+                isinstance(other, Duration)
+                and (self.w, self.d, self.h, self.m, self.s) == (other.w, other.d, other.h, other.m, other.s)
+        )
+
+    def __hash__(self):
+        return hash((self.w, self.d, self.h, self.m, self.s))
+
 
 class _DayOfTheWeek:
     """Weekday representation. Optionally includes positive or negative integer
@@ -72,6 +88,15 @@ class _DayOfTheWeek:
         else:
             return str(self.n) + self.short
 
+    def __repr__(self):
+        return str(self)
+
+    def __eq__(self, other):
+        return isinstance(other, _DayOfTheWeek) and (self.short, self.n) == (other.short, other.n)
+
+    def __hash__(self):
+        return hash((self.short, self.n))
+
 
 SU = SUNDAY = _DayOfTheWeek('SU')
 MO = MONDAY = _DayOfTheWeek('MO')
@@ -321,6 +346,32 @@ class Recurrence:
         """
         return 'EXDATE;' + Recurrence._periods(ps, timezone)
 
+    @staticmethod
+    def parse(line):
+        """Parses RRULE/EXRULE/RDATE/EXDATE string (e.g. from :py:attr:`~gcsa.event.Event.recurrence`)
+        into :py:class:`~gcsa.recurrence.RecurrenceRule` or :py:class:`~gcsa.recurrence.RecurrenceDates` object.
+
+        Parsed objects are immutable and cached by the string, so the same string always gives the same object.
+        Converting the object to string gives the parsed string back.
+
+            >>> rule = Recurrence.parse('RRULE:FREQ=MONTHLY;COUNT=3;BYDAY=-1FR')
+            >>> rule.freq, rule.count, rule.by_week_day
+            ('MONTHLY', 3, (-1FR,))
+
+            >>> str(rule)
+            'RRULE:FREQ=MONTHLY;COUNT=3;BYDAY=-1FR'
+
+        :param line:
+                RRULE, EXRULE, RDATE or EXDATE string.
+
+        :return:
+                :py:class:`~gcsa.recurrence.RecurrenceRule` for RRULE and EXRULE strings,
+                :py:class:`~gcsa.recurrence.RecurrenceDates` for RDATE and EXDATE strings.
+        """
+        if not isinstance(line, str):
+            raise TypeError('Recurrence must be a string, not {!r}.'.format(line.__class__.__name__))
+        return _parse(line)
+
     @staticmethod
     def _times(dts, timezone=get_localzone_name()):
         """Converts datetime(s) set to RDATE format.
@@ -568,3 +619,329 @@ class Recurrence:
                 rrule += ';{}={}'.format(key, value)
 
         return rrule
+
+
+class _RecurrenceLine:
+    """Base class for the immutable parsed recurrence lines."""
+
+    __slots__ = ()
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__ if not name.startswith('_'))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{} object is immutable.'.format(self.__class__.__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError('{} object is immutable.'.format(self.__class__.__name__))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __reduce__(self):
+        # Unpickled objects are interned as well
+        return Recurrence.parse, (str(self),)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(self.__class__.__name__, str(self))
+
+
+class RecurrenceRule(_RecurrenceLine):
+    """Parsed RRULE or EXRULE string. See :py:meth:`~gcsa.recurrence.Recurrence.parse`.
+
+    All by_xxx attributes are tuples (empty if not specified) in the order they appear in the string.
+    """
+
+    __slots__ = ('name', 'freq', 'interval', 'count', 'until', 'by_second', 'by_minute', 'by_hour', 'by_week_day',
+                 'by_month_day', 'by_year_day', 'by_week', 'by_month', 'by_set_pos', 'week_start', '_keys')
+
+    name: str
+    freq: str
+    interval: Optional[int]
+    count: Optional[int]
+    until: Optional[Union[date, datetime]]
+    by_second: Tuple[int, ...]
+    by_minute: Tuple[int, ...]
+    by_hour: Tuple[int, ...]
+    by_week_day: Tuple[_DayOfTheWeek, ...]
+    by_month_day: Tuple[int, ...]
+    by_year_day: Tuple[int, ...]
+    by_week: Tuple[int, ...]
+    by_month: Tuple[int, ...]
+    by_set_pos: Tuple[int, ...]
+    week_start: Optional[_DayOfTheWeek]
+    _keys: Tuple[str, ...]
+
+    # Property of the RRULE format and corresponding attribute in the order of Recurrence.rule
+    _PROPERTIES = (
+        ('FREQ', 'freq'),
+        ('INTERVAL', 'interval'),
+        ('COUNT', 'count'),
+        ('UNTIL', 'until'),
+        ('BYSECOND', 'by_second'),
+        ('BYMINUTE', 'by_minute'),
+        ('BYHOUR', 'by_hour'),
+        ('BYDAY', 'by_week_day'),
+        ('BYMONTHDAY', 'by_month_day'),
+        ('BYYEARDAY', 'by_year_day'),
+        ('BYWEEKNO', 'by_week'),
+        ('BYMONTH', 'by_month'),
+        ('BYSETPOS', 'by_set_pos'),
+        ('WKST', 'week_start'),
+    )
+
+    def __init__(
+            self,
+            name: str = 'RRULE',
+            freq: str = DAILY,
+            interval: Optional[int] = None,
+            count: Optional[int] = None,
+            until: Optional[Union[date, datetime]] = None,
+            by_second: Tuple[int, ...] = (),
+            by_minute: Tuple[int, ...] = (),
+            by_hour: Tuple[int, ...] = (),
+            by_week_day: Tuple[_DayOfTheWeek, ...] = (),
+            by_month_day: Tuple[int, ...] = (),
+            by_year_day: Tuple[int, ...] = (),
+            by_week: Tuple[int, ...] = (),
+            by_month: Tuple[int, ...] = (),
+            by_set_pos: Tuple[int, ...] = (),
+            week_start: Optional[_DayOfTheWeek] = None,
+            _keys: Optional[Tuple[str, ...]] = None
+    ):
+        """
+        :param name:
+                "RRULE" or "EXRULE"
+        :param freq:
+                SECONDLY, MINUTELY, HOURLY, DAILY, WEEKLY, MONTHLY or YEARLY
+        :param interval:
+                How often the recurrence rule repeats or None if not specified
+        :param count:
+                Number of occurrences or None
+        :param until:
+                End of the recurrence as date, naive datetime (local time of the event)
+                or timezone-aware datetime (UTC), or None
+        :param by_second:
+                Seconds within a minute
+        :param by_minute:
+                Minutes within an hour
+        :param by_hour:
+                Hours of the day
+        :param by_week_day:
+                Days of the week (:py:obj:`~MONDAY`, :py:obj:`~FRIDAY(-1)`, etc.)
+        :param by_month_day:
+                Days of the month
+        :param by_year_day:
+                Days of the year
+        :param by_week:
+                Weeks of the year
+        :param by_month:
+                Months of the year
+        :param by_set_pos:
+                Occurrences within the set of events specified by the rule
+        :param week_start:
+                The day on which the workweek starts or None if not specified
+        """
+        if name not in ('RRULE', 'EXRULE'):
+            raise ValueError('"name" must be "RRULE" or "EXRULE". {} was provided'.format(name))
+
+        values = (name, freq, interval, count, until, tuple(by_second), tuple(by_minute), tuple(by_hour),
+                  tuple(by_week_day), tuple(by_month_day), tuple(by_year_day), tuple(by_week), tuple(by_month),
+                  tuple(by_set_pos), week_start)
+        for attribute, value in zip(self.__slots__, values):
+            object.__setattr__(self, attribute, value)
+
+        if _keys is None:
+            _keys = tuple(key for key, attribute in self._PROPERTIES if getattr(self, attribute))
+        object.__setattr__(self, '_keys', _keys)
+
+        # Same validation as for the rules created with Recurrence.rule
+        Recurrence._rule(freq, interval, count, until, by_second, by_minute, by_hour, by_week_day, by_month_day,
+                         by_year_day, by_week, by_month, by_set_pos, week_start or DEFAULT_WEEK_START)
+
+    def __str__(self):
+        properties = dict(self._PROPERTIES)
+        parts = []
+        for key in self._keys:
+            value = getattr(self, properties[key])
+            if key == 'UNTIL':
+                value = _format_date_time(value)
+            elif isinstance(value, tuple):
+                value = ','.join(map(str, value))
+            parts.append('{}={}'.format(key, value))
+        return '{}:{}'.format(self.name, ';'.join(parts))
+
+
+class RecurrenceDates(_RecurrenceLine):
+    """Parsed RDATE or EXDATE string. See :py:meth:`~gcsa.recurrence.Recurrence.parse`.
+
+    Depending on the `value_type`, `values` are dates ("DATE"), datetimes ("DATE-TIME")
+    or periods as tuples of starting datetime and ending datetime or :py:class:`~gcsa.recurrence.Duration`
+    ("PERIOD"). Naive datetimes are in the `timezone` (or in the timezone of the event if `timezone` is None),
+    timezone-aware datetimes are in UTC.
+    """
+
+    __slots__ = ('name', 'value_type', 'timezone', 'values', '_keys')
+
+    name: str
+    value_type: str
+    timezone: Optional[str]
+    values: tuple
+    _keys: Tuple[str, ...]
+
+    def __init__(
+            self,
+            name: str = 'RDATE',
+            values: tuple = (),
+            value_type: str = 'DATE-TIME',
+            timezone: Optional[str] = None,
+            _keys: Optional[Tuple[str, ...]] = None
+    ):
+        """
+        :param name:
+                "RDATE" or "EXDATE"
+        :param values:
+                Dates, datetimes or periods
+        :param value_type:
+                "DATE", "DATE-TIME" or "PERIOD"
+        :param timezone:
+                Timezone (TZID) of the naive datetimes or None if not specified
+        """
+        if name not in ('RDATE', 'EXDATE'):
+            raise ValueError('"name" must be "RDATE" or "EXDATE". {} was provided'.format(name))
+        if value_type not in ('DATE', 'DATE-TIME', 'PERIOD'):
+            raise ValueError('"value_type" must be "DATE", "DATE-TIME" or "PERIOD". {} was provided'.format(value_type))
+
+        for attribute, value in zip(self.__slots__, (name, value_type, timezone, tuple(values))):
+            object.__setattr__(self, attribute, value)
+
+        if _keys is None:
+            _keys = (('VALUE',) if value_type != 'DATE-TIME' else ()) + (('TZID',) if timezone else ())
+        object.__setattr__(self, '_keys', _keys)
+
+    def __str__(self):
+        parameters = ''.join(
+            ';VALUE={}'.format(self.value_type) if key == 'VALUE' else ';TZID={}'.format(self.timezone)
+            for key in self._keys
+        )
+        if self.value_type == 'PERIOD':
+            values = ('{}/{}'.format(_format_date_time(start), _format_date_time(end)) for start, end in self.values)
+        else:
+            values = (_format_date_time(value) for value in self.values)
+        return '{}{}:{}'.format(self.name, parameters, ','.join(values))
+
+
+_WEEK_DAYS = {day.short: day for day in (SU, MO, TU, WE, TH, FR, SA)}
+_DURATION_RE = re.compile(r'P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+_UTC = tzutc()
+
+
+@lru_cache(maxsize=4096)
+def _parse(line):
+    head, _, value = line.strip().rpartition(':')
+    name, *parameters = head.split(';')
+    name = name.upper()
+
+    if name in ('RRULE', 'EXRULE'):
+        if parameters:
+            raise ValueError('Unsupported parameters in "{}".'.format(line))
+        return _parse_rule(name, value)
+    elif name in ('RDATE', 'EXDATE'):
+        return _parse_dates(name, parameters, value)
+    else:
+        raise ValueError('Unsupported recurrence line "{}".'.format(line))
+
+
+def _parse_rule(name, value):
+    attributes = dict(RecurrenceRule._PROPERTIES)
+    kwargs = {}
+    keys = []
+    for part in value.split(';'):
+        key, _, v = part.partition('=')
+        key = key.upper()
+        if key not in attributes:
+            raise ValueError('Unsupported recurrence rule part "{}".'.format(part))
+
+        if key == 'FREQ':
+            v = v.upper()
+        elif key in ('INTERVAL', 'COUNT'):
+            v = int(v)
+        elif key == 'UNTIL':
+            v = _parse_date_time(v)
+        elif key == 'BYDAY':
+            v = tuple(_parse_week_day(d) for d in v.split(','))
+        elif key == 'WKST':
+            v = _parse_week_day(v)
+        else:
+            v = tuple(int(n) for n in v.split(','))
+
+        kwargs[attributes[key]] = v
+        keys.append(key)
+
+    return RecurrenceRule(name, _keys=tuple(keys), **kwargs)
+
+
+def _parse_dates(name, parameters, value):
+    value_type = 'DATE-TIME'
+    timezone = None
+    keys = []
+    for parameter in parameters:
+        key, _, v = parameter.partition('=')
+        key = key.upper()
+        if key == 'VALUE':
+            value_type = v.upper()
+        elif key == 'TZID':
+            # Parameter value can be quoted (RFC 5545), e.g. TZID="Europe/Prague"
+            timezone = v[1:-1] if len(v) > 1 and v[0] == v[-1] == '"' else v
+        else:
+            raise ValueError('Unsupported parameter "{}".'.format(parameter))
+        keys.append(key)
+
+    if value_type == 'PERIOD':
+        values = tuple(_parse_period(v) for v in value.split(','))
+    else:
+        values = tuple(_parse_date_time(v) for v in value.split(','))
+    return RecurrenceDates(name, values, value_type, timezone, _keys=tuple(keys))
+
+
+def _parse_week_day(value):
+    day = _WEEK_DAYS.get(value[-2:].upper())
+    if day is None:
+        raise ValueError('Unknown day of the week "{}".'.format(value))
+    n = value[:-2]
+    return day(int(n)) if n else day
+
+
+def _parse_date_time(value):
+    """Parses DATE ("20230101") or DATE-TIME ("20230101T100000" or "20230101T100000Z")."""
+    if 'T' not in value:
+        return datetime.strptime(value, '%Y%m%d').date()
+    if value.endswith('Z'):
+        return datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=_UTC)
+    return datetime.strptime(value, '%Y%m%dT%H%M%S')
+
+
+def _parse_period(value):
+    start, _, end = value.partition('/')
+    return _parse_date_time(start), _parse_duration(end) if end.startswith('P') else _parse_date_time(end)
+
+
+def _parse_duration(value):
+    match = _DURATION_RE.fullmatch(value)
+    if match is None:
+        raise ValueError('Invalid duration "{}".'.format(value))
+    w, d, h, m, s = (int(v) if v is not None else None for v in match.groups())
+    return Duration(w=w, d=d, h=h, m=m, s=s)
+
+
+def _format_date_time(value):
+    if isinstance(value, Duration):
+        return str(value)
+    if not isinstance(value, datetime):
+        return value.strftime('%Y%m%d')
+    if value.tzinfo is None:
+        return value.strftime('%Y%m%dT%H%M%S')
+    return value.astimezone(_UTC).strftime('%Y%m%dT%H%M%SZ')
@@ -5,6 +5,8 @@ from beautiful_date import BeautifulDate, days
 
 
 class Reminder:
+    __slots__ = ('method', 'minutes_before_start', 'days_before', 'at')
+
     def __init__(
             self,
             method: str,
@@ -95,6 +97,8 @@ class Reminder:
 
 
 class EmailReminder(Reminder):
+    __slots__ = ()
+
     def __init__(
             self,
             minutes_before_start: Optional[int] = None,
@@ -119,6 +123,8 @@ class EmailReminder(Reminder):
 
 
 class PopupReminder(Reminder):
+    __slots__ = ()
+
     def __init__(
             self,
             minutes_before_start: Optional[int] = None,
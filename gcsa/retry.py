@@ -0,0 +1,131 @@
+import json
+import random
+import socket
+import threading
+import time
+from typing import Callable, Set
+
+from googleapiclient.errors import HttpError
+
+
+class RetryPolicy:
+    """Defines which failed requests are retried and how long to wait before each retry.
+
+    Requests rejected because of the rate limits (429 and 403 with "rateLimitExceeded" or "userRateLimitExceeded"
+    reason) are always retried as they were not processed by the server. Server errors (5xx) and connection errors
+    are only retried for idempotent requests, i.e. requests that can't create duplicates
+    (all but inserts without client-supplied id).
+
+    Delay before the n-th retry is chosen uniformly from [0, min(max_delay, initial_delay * multiplier ** (n - 1))]
+    ("full jitter" exponential backoff).
+
+    Counters `requests`, `retries` and `failures` (requests that failed after all the attempts) can be used
+    for monitoring.
+    """
+
+    RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+    SERVER_ERROR_STATUSES = {500, 502, 503, 504}
+
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            initial_delay: float = 1.0,
+            max_delay: float = 32.0,
+            multiplier: float = 2.0
+    ):
+        """
+        :param max_attempts:
+                Maximum number of attempts (including the first one). Use 1 to disable retries.
+        :param initial_delay:
+                Maximum delay (in seconds) before the first retry.
+        :param max_delay:
+                Upper limit of the delay (in seconds).
+        :param multiplier:
+                Factor by which the maximum delay grows with each retry.
+        """
+        if max_attempts < 1:
+            raise ValueError(f'"max_attempts" must be a positive int. {max_attempts} was provided.')
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        """Whether the request that failed with the `error` can be retried."""
+        if isinstance(error, HttpError):
+            status = error.resp.status
+            if status == 429 or (status == 403 and self._get_reasons(error) & self.RATE_LIMIT_REASONS):
+                return True
+            return idempotent and status in self.SERVER_ERROR_STATUSES
+        return idempotent and isinstance(error, (ConnectionError, socket.timeout))
+
+    def get_delay(self, retry: int) -> float:
+        """Returns delay (in seconds) before the `retry`-th retry (starting from 1)."""
+        return random.uniform(0, min(self.max_delay, self.initial_delay * self.multiplier ** (retry - 1)))
+
+    def wait(self, retry: int):
+        """Sleeps before the `retry`-th retry (starting from 1)."""
+        time.sleep(self.get_delay(retry))
+
+    def execute(self, fn: Callable, idempotent: bool = True):
+        """Calls `fn` retrying it on retryable errors. Returns the result of `fn`.
+
+        :param fn:
+                Function that sends the request.
+        :param idempotent:
+                Whether the request can be safely retried after the server error.
+        """
+        self._count('requests')
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not self.is_retryable(e, idempotent):
+                    raise
+                if attempt >= self.max_attempts:
+                    self._count('failures')
+                    raise
+                self._count('retries')
+                self.wait(attempt)
+                attempt += 1
+
+    def record_retries(self, n: int = 1):
+        """Records `n` retried requests in the `retries` counter. For requests retried outside of
+        :py:meth:`execute` (e.g. requests of the batch)."""
+        self._count('retries', n)
+
+    def record_failures(self, n: int = 1):
+        """Records `n` requests that failed after all the attempts in the `failures` counter. For requests retried
+        outside of :py:meth:`execute` (e.g. requests of the batch)."""
+        self._count('failures', n)
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = self.retries = self.failures = 0
+
+    def _count(self, counter: str, n: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + n)
+
+    @staticmethod
+    def _get_reasons(error: HttpError) -> Set[str]:
+        """Returns reasons of the errors from the response body."""
+        try:
+            content = json.loads(error.content.decode('utf-8'))
+            return {e.get('reason') for e in content['error']['errors']}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return set()
+
+    def __str__(self):
+        return 'max_attempts={}, requests={}, retries={}, failures={}'.format(
+            self.max_attempts, self.requests, self.retries, self.failures
+        )
+
+    def __repr__(self):
+        return '<RetryPolicy {}>'.format(self.__str__())
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 import json
 from typing import Type
 
-import dateutil.parser
+from gcsa.util.date_time_util import parse_datetime
 
 
 def _type_to_snake_case(type_):
@@ -79,4 +79,4 @@ class BaseSerializer(ABC):
 
     @staticmethod
     def _get_datetime_from_string(s):
-        return dateutil.parser.parse(s)
+        return parse_datetime(s)
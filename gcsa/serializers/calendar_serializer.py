@@ -79,31 +79,31 @@ class CalendarListEntrySerializer(BaseSerializer):
 
     @staticmethod
     def _to_object(json_calendar):
-        conference_properties = json_calendar.pop('conferenceProperties', {})
-        allowed_conference_solution_types = conference_properties.pop('allowedConferenceSolutionTypes', None)
+        conference_properties = json_calendar.get('conferenceProperties', {})
+        allowed_conference_solution_types = conference_properties.get('allowedConferenceSolutionTypes')
 
-        reminders_json = json_calendar.pop('defaultReminders', [])
+        reminders_json = json_calendar.get('defaultReminders', [])
         default_reminders = [ReminderSerializer.to_object(r) for r in reminders_json] if reminders_json else None
 
-        notifications = json_calendar.pop('notificationSettings', {}).pop('notifications', None)
+        notifications = json_calendar.get('notificationSettings', {}).get('notifications')
         notification_types = [n['type'] for n in notifications] if notifications else None
 
         return CalendarListEntry(
-            calendar_id=json_calendar.pop('id'),
-            summary_override=json_calendar.pop('summaryOverride', None),
-            color_id=json_calendar.pop('colorId', None),
-            background_color=json_calendar.pop('backgroundColor', None),
-            foreground_color=json_calendar.pop('foregroundColor', None),
-            hidden=json_calendar.pop('hidden', False),
-            selected=json_calendar.pop('selected', False),
+            calendar_id=json_calendar.get('id'),
+            summary_override=json_calendar.get('summaryOverride'),
+            color_id=json_calendar.get('colorId'),
+            background_color=json_calendar.get('backgroundColor'),
+            foreground_color=json_calendar.get('foregroundColor'),
+            hidden=json_calendar.get('hidden', False),
+            selected=json_calendar.get('selected', False),
             default_reminders=default_reminders,
             notification_types=notification_types,
-            _summary=json_calendar.pop('summary', None),
-            _description=json_calendar.pop('description', None),
-            _location=json_calendar.pop('location', None),
-            _timezone=json_calendar.pop('timeZone', None),
+            _summary=json_calendar.get('summary'),
+            _description=json_calendar.get('description'),
+            _location=json_calendar.get('location'),
+            _timezone=json_calendar.get('timeZone'),
             _allowed_conference_solution_types=allowed_conference_solution_types,
-            _access_role=json_calendar.pop('accessRole', None),
-            _primary=json_calendar.pop('primary', False),
-            _deleted=json_calendar.pop('deleted', False)
+            _access_role=json_calendar.get('accessRole'),
+            _primary=json_calendar.get('primary', False),
+            _deleted=json_calendar.get('deleted', False)
         )
@@ -1,8 +1,9 @@
 from datetime import date, datetime
+from typing import Any, Callable, Dict, Type
 
 from tzlocal import get_localzone_name
 
-from gcsa.event import Event
+from gcsa.event import Event, LazyEvent
 from .base_serializer import BaseSerializer
 from .attachment_serializer import AttachmentSerializer
 from .attendee_serializer import AttendeeSerializer
@@ -13,7 +14,17 @@ from ..conference import ConferenceSolution, ConferenceSolutionCreateRequest
 
 
 class EventSerializer(BaseSerializer):
-    type_ = Event
+    type_: Type[Event] = Event
+
+    # Fields of the resource that are converted to the Event arguments. The rest goes to `Event.other`
+    _KNOWN_FIELDS = frozenset((
+        'summary', 'start', 'end', 'id', 'description', 'location', 'recurrence', 'colorId', 'visibility',
+        'reminders', 'attendees', 'attachments', 'conferenceData', 'creator', 'organizer', 'created', 'updated',
+        'recurringEventId', 'guestsCanInviteOthers', 'guestsCanModify', 'guestsCanSeeOtherGuests', 'transparency'
+    ))
+
+    # Functions that decode the sub-objects from the resource by the name of the Event argument
+    _SUB_OBJECTS: Dict[str, Callable[[dict], Any]]
 
     def __init__(self, event):
         super().__init__(event)
@@ -71,10 +82,16 @@ class EventSerializer(BaseSerializer):
 
     @staticmethod
     def _to_object(json_event):
+        return EventSerializer._create_event(json_event, lazy=False)
+
+    @staticmethod
+    def _create_event(json_event, lazy):
+        """Creates :py:class:`~gcsa.event.Event` from the json, or :py:class:`~gcsa.event.LazyEvent` that decodes
+        its sub-objects on first access if `lazy`. The json is not modified."""
         timezone = None
 
         start = None
-        start_data = json_event.pop('start', None)
+        start_data = json_event.get('start')
         if start_data is not None:
             if 'date' in start_data:
                 start = EventSerializer._get_datetime_from_string(start_data['date']).date()
@@ -83,76 +100,109 @@ class EventSerializer(BaseSerializer):
             timezone = start_data.get('timeZone', get_localzone_name())
 
         end = None
-        end_data = json_event.pop('end', None)
+        end_data = json_event.get('end')
         if end_data is not None:
             if 'date' in end_data:
                 end = EventSerializer._get_datetime_from_string(end_data['date']).date()
             else:
                 end = EventSerializer._get_datetime_from_string(end_data['dateTime'])
 
-        updated = json_event.pop('updated', None)
+        updated = json_event.get('updated')
         if updated:
             updated = EventSerializer._get_datetime_from_string(updated)
 
-        created = json_event.pop('created', None)
+        created = json_event.get('created')
         if created:
             created = EventSerializer._get_datetime_from_string(created)
 
-        attendees_json = json_event.pop('attendees', [])
-        attendees = [AttendeeSerializer.to_object(a) for a in attendees_json]
+        reminders_json = json_event.get('reminders', {})
 
-        reminders_json = json_event.pop('reminders', {})
-        reminders = [ReminderSerializer.to_object(r) for r in reminders_json.get('overrides', [])]
-
-        attachments_json = json_event.pop('attachments', [])
-        attachments = [AttachmentSerializer.to_object(a) for a in attachments_json]
-
-        conference_data = json_event.pop('conferenceData', None)
-        if conference_data is not None:
-            create_request = conference_data.get('createRequest', {})
-            if create_request is None or create_request.get('status', {}).get('statusCode', None) in (None, 'success'):
-                conference_solution = ConferenceSolutionSerializer.to_object(conference_data)
-            else:
-                conference_solution = ConferenceSolutionCreateRequestSerializer.to_object(conference_data)
+        if lazy:
+            event_cls = LazyEvent
+            kwargs = {'_json': json_event}
         else:
-            conference_solution = None
+            event_cls = Event
+            kwargs = {name: decode(json_event) for name, decode in EventSerializer._SUB_OBJECTS.items()}
 
-        creator_data = json_event.pop('creator', None)
-        if creator_data is not None:
-            creator = PersonSerializer.to_object(creator_data)
-        else:
-            creator = None
+        other = {k: v for k, v in json_event.items() if k not in EventSerializer._KNOWN_FIELDS}
 
-        organizer_data = json_event.pop('organizer', None)
-        if organizer_data is not None:
-            organizer = PersonSerializer.to_object(organizer_data)
-        else:
-            organizer = None
-
-        return Event(
-            json_event.pop('summary', None),
+        event = event_cls(
+            json_event.get('summary'),
             start=start,
             end=end,
             timezone=timezone,
-            event_id=json_event.pop('id', None),
-            description=json_event.pop('description', None),
-            location=json_event.pop('location', None),
-            recurrence=json_event.pop('recurrence', None),
-            color_id=json_event.pop('colorId', None),
-            visibility=json_event.pop('visibility', None),
-            attendees=attendees,
-            attachments=attachments,
-            reminders=reminders,
-            conference_solution=conference_solution,
-            default_reminders=reminders_json.pop('useDefault', False),
-            guests_can_invite_others=json_event.pop('guestsCanInviteOthers', True),
-            guests_can_modify=json_event.pop('guestsCanModify', False),
-            guests_can_see_other_guests=json_event.pop('guestsCanSeeOtherGuests', True),
-            transparency=json_event.pop('transparency', None),
-            _creator=creator,
-            _organizer=organizer,
+            event_id=json_event.get('id'),
+            description=json_event.get('description'),
+            location=json_event.get('location'),
+            # Copied, so that changes of the event's recurrence don't affect the json
+            recurrence=list(json_event.get('recurrence', [])),
+            color_id=json_event.get('colorId'),
+            visibility=json_event.get('visibility'),
+            default_reminders=reminders_json.get('useDefault', False),
+            guests_can_invite_others=json_event.get('guestsCanInviteOthers', True),
+            guests_can_modify=json_event.get('guestsCanModify', False),
+            guests_can_see_other_guests=json_event.get('guestsCanSeeOtherGuests', True),
+            transparency=json_event.get('transparency'),
             _created=created,
             _updated=updated,
-            _recurring_event_id=json_event.pop('recurringEventId', None),
-            **json_event
+            _recurring_event_id=json_event.get('recurringEventId'),
+            **kwargs,
+            **other
         )
+        if end is None:
+            # Partial response (see `fields` parameter) without the end. Not derived from the start.
+            event.end = None
+        return event
+
+    @staticmethod
+    def _get_attendees(attendees_json):
+        return [AttendeeSerializer.to_object(a) for a in attendees_json]
+
+    @staticmethod
+    def _get_reminders(reminders_json):
+        return [ReminderSerializer.to_object(r) for r in reminders_json.get('overrides', [])]
+
+    @staticmethod
+    def _get_attachments(attachments_json):
+        return [AttachmentSerializer.to_object(a) for a in attachments_json]
+
+    @staticmethod
+    def _get_conference_solution(conference_data):
+        if conference_data is None:
+            return None
+        create_request = conference_data.get('createRequest', {})
+        if create_request is None or create_request.get('status', {}).get('statusCode', None) in (None, 'success'):
+            return ConferenceSolutionSerializer.to_object(conference_data)
+        else:
+            return ConferenceSolutionCreateRequestSerializer.to_object(conference_data)
+
+    @staticmethod
+    def _get_person(person_json):
+        if person_json is None:
+            return None
+        return PersonSerializer.to_object(person_json)
+
+
+EventSerializer._SUB_OBJECTS = {
+    'attendees': lambda json_event: EventSerializer._get_attendees(json_event.get('attendees', [])),
+    'reminders': lambda json_event: EventSerializer._get_reminders(json_event.get('reminders', {})),
+    'attachments': lambda json_event: EventSerializer._get_attachments(json_event.get('attachments', [])),
+    'conference_solution': lambda json_event: EventSerializer._get_conference_solution(
+        json_event.get('conferenceData')
+    ),
+    '_creator': lambda json_event: EventSerializer._get_person(json_event.get('creator')),
+    '_organizer': lambda json_event: EventSerializer._get_person(json_event.get('organizer')),
+}
+# LazyEvent decodes the same sub-objects on first access
+LazyEvent._decoders = {name.lstrip('_'): decode for name, decode in EventSerializer._SUB_OBJECTS.items()}
+
+
+class LazyEventSerializer(EventSerializer):
+    type_ = LazyEvent
+
+    def __init__(self, lazy_event):
+        super().__init__(lazy_event)
+
+    @staticmethod
+    def _to_object(json_event):
+        return EventSerializer._create_event(json_event, lazy=True)
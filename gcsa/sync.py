@@ -0,0 +1,23 @@
+from typing import Optional
+
+
+class SyncState:
+    def __init__(
+            self,
+            sync_token: Optional[str] = None
+    ):
+        """Stores the state of the incremental synchronization of events.
+        See :py:meth:`~gcsa.google_calendar.GoogleCalendar.sync_events`.
+
+        :param sync_token:
+                Token obtained from the last page of the previous synchronization.
+                If not specified, the first synchronization is a full synchronization.
+        """
+        self.sync_token = sync_token
+        self.full_sync = sync_token is None
+
+    def __str__(self):
+        return "sync_token='{}'".format(self.sync_token)
+
+    def __repr__(self):
+        return '<SyncState {}>'.format(self.__str__())
@@ -1,5 +1,8 @@
 from datetime import datetime, date, time
-from dateutil.tz import gettz
+from functools import lru_cache
+
+import dateutil.parser
+from dateutil.tz import gettz, tzoffset, tzutc
 from tzlocal import get_localzone_name
 
 
@@ -23,3 +26,33 @@ def to_localized_iso(dt, timezone=get_localzone_name()):
     if not isinstance(dt, datetime):
         dt = datetime.combine(dt, time())
     return ensure_localisation(dt, timezone).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _get_tzinfo(offset):
+    """Returns tzinfo object for "Z" or "+HH:MM"/"-HH:MM" offset. Objects are shared between parsed datetimes."""
+    if offset == 'Z':
+        return tzutc()
+    sign = -1 if offset[0] == '-' else 1
+    return tzoffset(None, sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60))
+
+
+def parse_datetime(s):
+    """Parses RFC 3339 date or datetime string (e.g. "2023-03-24", "2023-03-24T13:22:00Z"
+    or "2023-03-24T13:22:00.123+01:00") into "datetime" object.
+
+    Uses fast `datetime.fromisoformat` and falls back to `dateutil.parser.parse` for other formats."""
+    try:
+        if s.endswith('Z'):
+            dt, offset = s[:-1], 'Z'
+        elif len(s) > 6 and s[-6] in '+-' and s[-3] == ':':
+            dt, offset = s[:-6], s[-6:]
+        else:
+            dt, offset = s, None
+
+        dt = datetime.fromisoformat(dt)
+        if offset is not None and dt.tzinfo is None:
+            dt = dt.replace(tzinfo=_get_tzinfo(offset))
+        return dt
+    except ValueError:
+        return dateutil.parser.parse(s)
@@ -1,6 +1,6 @@
 from gcsa.acl import AccessControlRule, ACLRole, ACLScopeType
 from gcsa.serializers.acl_rule_serializer import ACLRuleSerializer
-from .util import executable
+from .util import executable, apply_fields
 
 
 class MockACLRequests:
@@ -32,19 +32,19 @@ class MockACLRequests:
         return {c.id: c for c in self.test_acl_rules}
 
     @executable
-    def list(self, pageToken, **_):
+    def list(self, pageToken, fields=None, **_):
         """Emulates GoogleCalendar.service.acl().list().execute()"""
         page = pageToken or 0  # page number in this case
         page_acl_rules = self.test_acl_rules[page * self.ACL_RULES_PER_PAGE:(page + 1) * self.ACL_RULES_PER_PAGE]
         next_page = page + 1 if (page + 1) * self.ACL_RULES_PER_PAGE < len(self.test_acl_rules) else None
 
-        return {
+        return apply_fields({
             'items': [
                 ACLRuleSerializer.to_json(c)
                 for c in page_acl_rules
             ],
             'nextPageToken': next_page
-        }
+        }, fields)
 
     @executable
     def get(self, calendarId, ruleId):
@@ -0,0 +1,23 @@
+class MockBatchHttpRequest:
+    """Emulates googleapiclient.http.BatchHttpRequest"""
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.requests = []
+        self.executed = False
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id or str(len(self.requests)), request, callback))
+
+    def execute(self, http=None):
+        self.executed = True
+        for request_id, request, callback in self.requests:
+            response, exception = None, None
+            try:
+                response = request.execute()
+            except Exception as e:
+                exception = e
+
+            callback = callback or self.callback
+            if callback is not None:
+                callback(request_id, response, exception)
@@ -1,6 +1,6 @@
 from gcsa.calendar import CalendarListEntry
 from gcsa.serializers.calendar_serializer import CalendarListEntrySerializer
-from .util import executable
+from .util import executable, apply_fields
 
 
 class MockCalendarListRequests:
@@ -29,20 +29,20 @@ class MockCalendarListRequests:
         return {c.id: c for c in self.test_calendars}
 
     @executable
-    def list(self, pageToken, **_):
+    def list(self, pageToken, fields=None, **_):
         page = pageToken or 0  # page number in this case
         page_calendars = self.test_calendars[
                          page * self.CALENDAR_LIST_ENTRIES_PER_PAGE:(page + 1) * self.CALENDAR_LIST_ENTRIES_PER_PAGE
                          ]
         next_page = page + 1 if (page + 1) * self.CALENDAR_LIST_ENTRIES_PER_PAGE < len(self.test_calendars) else None
 
-        return {
+        return apply_fields({
             'items': [
                 CalendarListEntrySerializer.to_json(c)
                 for c in page_calendars
             ],
             'nextPageToken': next_page
-        }
+        }, fields)
 
     @executable
     def get(self, calendarId):
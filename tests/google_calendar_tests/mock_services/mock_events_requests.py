@@ -1,7 +1,9 @@
-from .util import executable
+from .util import executable, apply_fields
 
 import dateutil.parser
+import httplib2
 from beautiful_date import D, days, years
+from googleapiclient.errors import HttpError
 
 from gcsa.attendee import Attendee
 from gcsa.event import Event
@@ -27,6 +29,11 @@ class MockEventsRequests:
             )
             for i, attendee_name in zip(range(1, 10), ['John', 'Josh'] + [''] * 8)
         ]
+        # ids of the inserted, updated and deleted events (used for sync tokens)
+        self.changes = []
+        # whether to add etags to the returned events (used in cache tests)
+        self.etags = False
+        self.not_modified_responses = 0
 
     @property
     def test_events_by_id(self):
@@ -63,18 +70,22 @@ class MockEventsRequests:
             raise ValueError(f'Event with id {eventId} does not exist')
 
         return {
-            'items': recurring_instances,
+            'items': [self._serialize(e) for e in recurring_instances],
             'nextPageToken': None
         }
 
     @executable
-    def list(self, timeMin, timeMax, orderBy, singleEvents, pageToken, q, **_):
+    def list(self, pageToken, timeMin=None, timeMax=None, orderBy=None, singleEvents=False, q=None, syncToken=None,
+             fields=None, **_):
         """Emulates GoogleCalendar.service.events().list().execute()"""
 
-        time_min = dateutil.parser.parse(timeMin)
-        time_max = dateutil.parser.parse(timeMax)
+        time_min = dateutil.parser.parse(timeMin) if timeMin else None
+        time_max = dateutil.parser.parse(timeMax) if timeMax else None
         page = pageToken or 0  # page number in this case
 
+        if syncToken is not None:
+            return apply_fields(self._sync(syncToken, page), fields)
+
         test_events = self.test_events.copy()
 
         recurring_event = Event('Recurring event',
@@ -110,7 +121,8 @@ class MockEventsRequests:
 
         def _filter(e):
             return (
-                    (time_min <= e.start and e.end < time_max) and
+                    (time_min is None or time_min <= e.start) and
+                    (time_max is None or e.end < time_max) and
                     (
                             not q or
                             q in e.summary or
@@ -130,30 +142,64 @@ class MockEventsRequests:
         filtered_events = list(filter(_filter, test_events))
         ordered_events = sorted(filtered_events, key=_sort_key)
 
-        def serialize(event):
-            event_json = EventSerializer.to_json(event)
-            # Add readonly fields to event json
-            event_json['updated'] = event.updated.isoformat()
-            event_json['recurringEventId'] = event.recurring_event_id
-            return event_json
-        serialized_events = list(map(serialize, ordered_events))
+        serialized_events = list(map(self._serialize, ordered_events))
+        return apply_fields(self._page(serialized_events, page), fields)
+
+    def _sync(self, sync_token, page):
+        """Emulates listing with the sync token. Returns events changed since the token was issued."""
+        if not sync_token.startswith('sync_token_'):
+            raise HttpError(httplib2.Response({'status': 410}), b'Sync token is no longer valid.')
+
+        changed_ids = list(dict.fromkeys(self.changes[int(sync_token[len('sync_token_'):]):]))
+        events_by_id = self.test_events_by_id
+        serialized_events = [
+            self._serialize(events_by_id[event_id]) if event_id in events_by_id
+            else {'id': event_id, 'status': 'cancelled'}
+            for event_id in changed_ids
+        ]
+        return self._page(serialized_events, page)
 
+    def _page(self, serialized_events, page):
         current_page_events = serialized_events[page * self.EVENTS_PER_PAGE:(page + 1) * self.EVENTS_PER_PAGE]
         next_page = page + 1 if (page + 1) * self.EVENTS_PER_PAGE < len(serialized_events) else None
-        return {
+        response = {
             'items': current_page_events,
             'nextPageToken': next_page
         }
+        if next_page is None:
+            response['nextSyncToken'] = f'sync_token_{len(self.changes)}'
+        return response
+
+    @staticmethod
+    def _serialize(event):
+        event_json = EventSerializer.to_json(event)
+        # Add readonly fields to event json
+        if event.updated:
+            event_json['updated'] = event.updated.isoformat()
+        event_json['recurringEventId'] = event.recurring_event_id
+        return event_json
+
+    def _etag(self, event_id):
+        return f'"{event_id}_{self.changes.count(event_id)}"'
 
     @executable
-    def get(self, eventId, **_):
+    def get(self, eventId, _headers=None, fields=None, **_):
         """Emulates GoogleCalendar.service.events().get().execute()"""
         try:
-            return EventSerializer.to_json(self.test_events_by_id[eventId])
+            event_json = EventSerializer.to_json(self.test_events_by_id[eventId])
         except KeyError:
             # shouldn't get here in tests
             raise ValueError(f'Event with id {eventId} does not exist')
 
+        if not self.etags:
+            return apply_fields(event_json, fields)
+
+        event_json['etag'] = self._etag(eventId)
+        if _headers and _headers.get('If-None-Match') == event_json['etag']:
+            self.not_modified_responses += 1
+            raise HttpError(httplib2.Response({'status': 304}), b'')
+        return event_json
+
     @executable
     def insert(self, body, **_):
         """Emulates GoogleCalendar.service.events().insert().execute()"""
@@ -165,6 +211,7 @@ class MockEventsRequests:
             assert event.id not in self.test_events_by_id
 
         self.test_events.append(event)
+        self.changes.append(event.id)
         return EventSerializer.to_json(event)
 
     @executable
@@ -188,7 +235,11 @@ class MockEventsRequests:
         for i in range(len(self.test_events)):
             if eventId == self.test_events[i].id:
                 self.test_events[i] = updated_event
-                return EventSerializer.to_json(updated_event)
+                self.changes.append(eventId)
+                event_json = EventSerializer.to_json(updated_event)
+                if self.etags:
+                    event_json['etag'] = self._etag(eventId)
+                return event_json
 
         # shouldn't get here in tests
         raise ValueError(f'Event with id {eventId} does not exist')
@@ -196,6 +247,10 @@ class MockEventsRequests:
     @executable
     def import_(self, body, **_):
         """Emulates GoogleCalendar.service.events().import_().execute()"""
+        if 'start' not in body:
+            raise HttpError(httplib2.Response({'status': 400}), b'Missing start time.')
+        if body.get('id') in self.test_events_by_id:
+            raise HttpError(httplib2.Response({'status': 409}), b'The requested identifier already exists.')
         return self.insert(body).execute()
 
     @executable
@@ -207,3 +262,4 @@ class MockEventsRequests:
     def delete(self, eventId, **_):
         """Emulates GoogleCalendar.service.events().delete().execute()"""
         self.test_events = [e for e in self.test_events if e.id != eventId]
+        self.changes.append(eventId)
@@ -15,12 +15,22 @@ NOT_FOUND_ERROR = [
     }
 ]
 
+TOO_MANY_CALENDARS_ERROR = [
+    {
+        "domain": "global",
+        "reason": "tooManyCalendarsRequested"
+    }
+]
+
+MAX_CALENDARS = 50
+
 
 class MockFreeBusyRequests:
     """Emulates GoogleCalendar.service.freebusy()"""
 
     def __init__(self):
         now = ensure_localisation(D.now())
+        self.queries = []
         self.groups = {
             'group1': ['primary', 'calendar2'],
             'group2': ['calendar3', 'calendar4']
@@ -59,18 +69,28 @@ class MockFreeBusyRequests:
         time_max = dateutil.parser.parse(body['timeMax'])
         items = body['items']
 
+        self.queries.append(body)
+
         request_groups = [i['id'] for i in items if i['id'].startswith('group')]
-        request_calendars = {i['id'] for i in items if not i['id'].startswith('group')}
+        request_calendars = [i['id'] for i in items if not i['id'].startswith('group')]
 
         groups = {gn: g for gn, g in self.groups.items() if gn in request_groups}
-        group_calendars = set(c for g in groups.values() for c in g)
+        group_calendars = [c for g in groups.values() for c in g]
+        # Only up to calendarExpansionMax calendars (including members of the groups) are provided
+        calendar_expansion_max = min(body.get('calendarExpansionMax') or MAX_CALENDARS, MAX_CALENDARS)
+        provided_calendars = list(dict.fromkeys(request_calendars + group_calendars))
+        too_many_calendars = provided_calendars[calendar_expansion_max:]
+        provided_calendars = provided_calendars[:calendar_expansion_max]
+
         calendars = {
-            cn: self._filter_ranges(c, time_min, time_max)
-            for cn, c in self.calendars.items()
-            if cn in request_calendars | group_calendars
+            cn: self._filter_ranges(self.calendars[cn], time_min, time_max)
+            for cn in provided_calendars
+            if cn in self.calendars
         }
 
-        calendars_errors = {c: NOT_FOUND_ERROR for c in request_calendars if c not in calendars}
+        calendars_errors = {c: NOT_FOUND_ERROR for c in provided_calendars
+                            if c in request_calendars and c not in calendars}
+        calendars_errors.update({c: TOO_MANY_CALENDARS_ERROR for c in too_many_calendars})
         groups_errors = {g: NOT_FOUND_ERROR for g in request_groups if g not in groups}
 
         fb_json = FreeBusySerializer.to_json(FreeBusy(
@@ -1,4 +1,5 @@
 from .mock_acl_requests import MockACLRequests
+from .mock_batch_requests import MockBatchHttpRequest
 from .mock_calendar_list_requests import MockCalendarListRequests
 from .mock_calendars_requests import MockCalendarsRequests
 from .mock_colors_requests import MockColorsRequests
@@ -18,6 +19,7 @@ class MockService:
         self._settings = MockSettingsRequests()
         self._acl = MockACLRequests()
         self._free_busy = MockFreeBusyRequests()
+        self.batches = []
 
     def events(self):
         return self._events
@@ -39,3 +41,8 @@ class MockService:
 
     def freebusy(self):
         return self._free_busy
+
+    def new_batch_http_request(self, callback=None):
+        batch = MockBatchHttpRequest(callback=callback)
+        self.batches.append(batch)
+        return batch
@@ -24,19 +24,22 @@ class MockAuthFlow:
 
 
 def executable(fn):
-    """Decorator that stores data received from the function in object that returns that data when
-    called its `execute` method. Emulates HttpRequest from googleapiclient."""
+    """Decorator that defers the call of the function until `execute` method of the returned object is called.
+    Emulates HttpRequest from googleapiclient."""
 
     class Executable:
-        def __init__(self, data):
-            self.data = data
+        def __init__(self, args, kwargs):
+            self.args = args
+            self.kwargs = kwargs
+            self.headers = {}
 
-        def execute(self):
-            return self.data
+        def execute(self, http=None):
+            if self.headers:
+                return fn(*self.args, _headers=self.headers, **self.kwargs)
+            return fn(*self.args, **self.kwargs)
 
     def wrapper(*args, **kwargs):
-        data = fn(*args, **kwargs)
-        return Executable(data)
+        return Executable(args, kwargs)
 
     return wrapper
 
@@ -48,3 +51,34 @@ def within(dt, time_min, time_max):
 def time_range_within(tr, time_min, time_max):
     start, end = tr
     return within(start, time_min, time_max) and within(end, time_min, time_max)
+
+
+def _split_fields(fields):
+    """Splits fields by top-level commas."""
+    parts, depth, current = [], 0, ''
+    for c in fields:
+        if c == ',' and depth == 0:
+            parts.append(current)
+            current = ''
+            continue
+        depth += c == '('
+        depth -= c == ')'
+        current += c
+    return parts + [current] if current else parts
+
+
+def apply_fields(resource_json, fields):
+    """Emulates partial response. Only supports top-level fields and "items(...)" of the listings."""
+    if fields is None:
+        return resource_json
+
+    result = {}
+    for field in _split_fields(fields):
+        name, _, sub_fields = field.partition('(')
+        if name not in resource_json:
+            continue
+        if name == 'items' and sub_fields:
+            result['items'] = [apply_fields(item, sub_fields[:-1]) for item in resource_json['items']]
+        else:
+            result[name] = resource_json[name]
+    return result
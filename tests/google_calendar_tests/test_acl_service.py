@@ -7,6 +7,16 @@ class TestACLService(TestCaseWithMockedService):
         acl_rules = list(self.gc.get_acl_rules())
         self.assertEqual(len(acl_rules), 8)
 
+        prefetched_acl_rules = list(self.gc.get_acl_rules(prefetch_pages=2))
+        self.assertEqual([r.id for r in acl_rules], [r.id for r in prefetched_acl_rules])
+
+        partial_acl_rules = list(self.gc.get_acl_rules(fields=['id']))
+        self.assertEqual([r.id for r in acl_rules], [r.id for r in partial_acl_rules])
+        self.assertTrue(all(r.role is None for r in partial_acl_rules))
+
+        raw_acl_rules = list(self.gc.get_acl_rules(raw=True))
+        self.assertEqual([r.id for r in acl_rules], [r['id'] for r in raw_acl_rules])
+
     def test_get_acl_rule(self):
         acl_rule = self.gc.get_acl_rule(rule_id='user:mail2@gmail.com')
 
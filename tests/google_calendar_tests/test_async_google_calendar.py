@@ -0,0 +1,80 @@
+import asyncio
+
+from beautiful_date import D, days
+
+from gcsa.async_google_calendar import AsyncGoogleCalendar
+from gcsa.calendar import CalendarListEntry
+from gcsa.event import Event
+from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
+from tests.google_calendar_tests.mock_services.util import MockToken
+
+
+class TestAsyncGoogleCalendar(TestCaseWithMockedService):
+    def setUp(self):
+        super().setUp()
+        self.agc = AsyncGoogleCalendar(credentials=MockToken(valid=True), chunk_size=3)
+
+    def tearDown(self):
+        self.agc.close()
+        super().tearDown()
+
+    @staticmethod
+    def run_async(coroutine):
+        return asyncio.run(coroutine)
+
+    @staticmethod
+    async def collect(async_iterator):
+        return [item async for item in async_iterator]
+
+    def test_get_event(self):
+        event = self.run_async(self.agc.get_event('event_id_1'))
+        self.assertIsInstance(event, Event)
+        self.assertEqual(event.id, 'event_id_1')
+
+    def test_concurrent_requests(self):
+        async def get_events():
+            return await asyncio.gather(*(self.agc.get_event(f'event_id_{i}') for i in range(1, 10)))
+
+        events = self.run_async(get_events())
+        self.assertEqual([e.id for e in events], [f'event_id_{i}' for i in range(1, 10)])
+
+    def test_get_events(self):
+        events = self.run_async(self.collect(self.agc.get_events(time_min=D.today()[:] - 5 * days)))
+        self.assertEqual(len(events), 10)
+        self.assertTrue(all(isinstance(e, Event) for e in events))
+        self.assertEqual([e.id for e in events], [e.id for e in self.gc.get_events(time_min=D.today()[:] - 5 * days)])
+
+    def test_add_delete_event(self):
+        async def add_and_delete():
+            event = await self.agc.add_event(Event('Async event', start=D.today()[:] + 1 * days))
+            self.assertIsNotNone(event.id)
+            self.assertEqual(self.gc.get_event(event.id).summary, 'Async event')
+            await self.agc.delete_event(event)
+            return event
+
+        event = self.run_async(add_and_delete())
+        with self.assertRaises(ValueError):
+            self.gc.get_event(event.id)
+
+    def test_get_calendar_list(self):
+        entries = self.run_async(self.collect(self.agc.get_calendar_list()))
+        self.assertTrue(all(isinstance(e, CalendarListEntry) for e in entries))
+        self.assertEqual([e.id for e in entries], [e.id for e in self.gc.get_calendar_list()])
+
+    def test_errors_propagate(self):
+        with self.assertRaises(ValueError):
+            self.run_async(self.agc.get_event('non_existing_event'))
+
+    def test_context_manager(self):
+        async def use():
+            async with AsyncGoogleCalendar(credentials=MockToken(valid=True)) as agc:
+                self.assertEqual(agc.default_calendar, 'primary')
+                return await agc.get_calendar()
+
+        calendar = self.run_async(use())
+        self.assertEqual(calendar.id, 'primary')
+
+    def test_same_methods(self):
+        for name in ('get_events', 'get_event', 'add_event', 'get_calendar', 'get_calendar_list', 'get_acl_rules',
+                     'get_free_busy', 'get_settings', 'list_event_colors', 'list_calendar_colors'):
+            self.assertEqual(getattr(AsyncGoogleCalendar, name).__doc__, getattr(self.gc, name).__doc__)
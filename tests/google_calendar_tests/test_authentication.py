@@ -3,8 +3,10 @@ import webbrowser
 from os import path
 from unittest.mock import patch
 
+from googleapiclient.discovery_cache import DISCOVERY_DOC_DIR, get_static_doc
 from pyfakefs.fake_filesystem_unittest import TestCase
 
+from gcsa._services.authentication import _get_discovery_document
 from gcsa.google_calendar import GoogleCalendar
 from tests.google_calendar_tests.mock_services.util import MockToken, MockAuthFlow
 
@@ -13,6 +15,7 @@ class TestGoogleCalendarCredentials(TestCase):
 
     def setUp(self):
         self.setUpPyfakefs()
+        self.fs.add_real_file(path.join(DISCOVERY_DOC_DIR, 'calendar.v3.json'))
 
         self.credentials_dir = path.join(path.expanduser('~'), '.credentials')
         self.credentials_path = path.join(self.credentials_dir, 'credentials.json')
@@ -30,7 +33,7 @@ class TestGoogleCalendarCredentials(TestCase):
         self._add_mocks()
 
     def _add_mocks(self):
-        self.build_patcher = patch('googleapiclient.discovery.build', return_value=None).start()
+        self.build_patcher = patch('googleapiclient.discovery.build_from_document', return_value=None).start()
 
         self.from_client_secrets_file_patcher = patch(
             'google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file',
@@ -46,6 +49,19 @@ class TestGoogleCalendarCredentials(TestCase):
         self.assertTrue(gc.credentials.valid)
         self.assertFalse(gc.credentials.expired)
 
+    def test_discovery_document_cached(self):
+        _get_discovery_document.cache_clear()
+        with patch('googleapiclient.discovery_cache.get_static_doc', wraps=get_static_doc) as get_static_doc_mock:
+            GoogleCalendar(credentials=MockToken(valid=True))
+            GoogleCalendar(credentials=MockToken(valid=True))
+            self.assertEqual(get_static_doc_mock.call_count, 1)
+
+        self.assertEqual(self.build_patcher.call_count, 2)
+        discovery_document = self.build_patcher.call_args[0][0]
+        self.assertEqual(discovery_document['name'], 'calendar')
+        self.assertEqual(discovery_document['version'], 'v3')
+        self.assertIs(discovery_document, _get_discovery_document())
+
     def test_get_default_credentials_exist(self):
         self.assertEqual(
             self.credentials_path,
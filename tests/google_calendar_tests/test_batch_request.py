@@ -0,0 +1,98 @@
+from beautiful_date import D, days
+
+from gcsa.acl import AccessControlRule, ACLRole, ACLScopeType
+from gcsa.batch import BatchRequest
+from gcsa.calendar import Calendar
+from gcsa.event import Event
+from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
+
+
+class TestBatchRequest(TestCaseWithMockedService):
+    def test_batch_events(self):
+        start = D.today()[:] + 1 * days
+        events = [Event(f'Batch event {i}', start=start, event_id=f'batch_event_{i}') for i in range(5)]
+
+        with self.gc.batch() as batch:
+            for event in events:
+                self.assertIsNone(batch.add_event(event))
+            batch.delete_event('event_id_1')
+            batch.get_event('event_id_2')
+            self.assertEqual(len(batch), 7)
+            # nothing is sent until the context exits
+            self.assertNotIn('batch_event_0', self.gc.service.events().test_events_by_id)
+
+        self.assertEqual(len(batch.results), 7)
+        for event, result in zip(events, batch.results[:5]):
+            self.assertIsInstance(result, Event)
+            self.assertEqual(result.id, event.id)
+            self.assertEqual(result.summary, event.summary)
+        self.assertIsNone(batch.results[5])
+        self.assertEqual(batch.results[6].id, 'event_id_2')
+
+        self.assertEqual(self.gc.get_event('batch_event_3').summary, 'Batch event 3')
+        with self.assertRaises(ValueError):
+            self.gc.get_event('event_id_1')
+
+        # calendar object itself is not affected
+        event = self.gc.add_event(Event('Not batched', start=start))
+        self.assertIsInstance(event, Event)
+
+    def test_batch_size(self):
+        with self.gc.batch(batch_size=2) as batch:
+            for i in range(5):
+                batch.get_event(f'event_id_{i + 1}')
+
+        self.assertEqual(len(self.gc.service.batches), 3)
+        self.assertEqual([len(b.requests) for b in self.gc.service.batches], [2, 2, 1])
+        self.assertEqual([e.id for e in batch.results], [f'event_id_{i + 1}' for i in range(5)])
+
+        with self.assertRaises(ValueError):
+            self.gc.batch(batch_size=0)
+        with self.assertRaises(ValueError):
+            self.gc.batch(batch_size=BatchRequest.MAX_BATCH_SIZE + 1)
+
+    def test_batch_errors(self):
+        with self.gc.batch() as batch:
+            batch.get_event('event_id_1')
+            batch.get_event('non_existing_event')
+            batch.get_event('event_id_2')
+
+        self.assertEqual(batch.results[0].id, 'event_id_1')
+        self.assertIsInstance(batch.results[1], Exception)
+        self.assertEqual(batch.results[2].id, 'event_id_2')
+
+    def test_batch_not_executed_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            with self.gc.batch() as batch:
+                batch.get_event('event_id_1')
+                raise RuntimeError
+
+        self.assertEqual(self.gc.service.batches, [])
+        self.assertEqual(batch.results, [None])
+
+    def test_batch_other_services(self):
+        with self.gc.batch() as batch:
+            batch.get_calendar('1')
+            batch.add_calendar(Calendar('Batch calendar'))
+            batch.get_calendar_list_entry('2')
+            batch.add_acl_rule(
+                AccessControlRule(
+                    role=ACLRole.WRITER,
+                    scope_type=ACLScopeType.DOMAIN,
+                    scope_value='test.com'
+                )
+            )
+
+        calendar, new_calendar, calendar_list_entry, acl_rule = batch.results
+        self.assertEqual(calendar.id, '1')
+        self.assertEqual(new_calendar.summary, 'Batch calendar')
+        self.assertIsNotNone(new_calendar.id)
+        self.assertEqual(calendar_list_entry.id, '2')
+        self.assertEqual(acl_rule.id, 'domain:test.com')
+
+    def test_not_batchable_methods(self):
+        batch = self.gc.batch()
+        with self.assertRaises(AttributeError):
+            batch.get_events()
+        with self.assertRaises(AttributeError):
+            batch.get_free_busy()
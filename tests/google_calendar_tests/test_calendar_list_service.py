@@ -8,6 +8,22 @@ class TestCalendarListService(TestCaseWithMockedService):
         self.assertEqual(len(calendars), 8)
         self.assertTrue(any(c.id == 'primary' for c in calendars))
 
+        prefetched_calendars = list(self.gc.get_calendar_list(prefetch_pages=1))
+        self.assertEqual([c.id for c in calendars], [c.id for c in prefetched_calendars])
+
+        partial_calendars = list(self.gc.get_calendar_list(fields=['id', 'summary']))
+        self.assertEqual([c.id for c in calendars], [c.id for c in partial_calendars])
+        self.assertEqual([c.summary for c in calendars], [c.summary for c in partial_calendars])
+        self.assertTrue(all(c.description is None for c in partial_calendars))
+
+        # Resources without "id"
+        partial_calendars = list(self.gc.get_calendar_list(fields=['summary']))
+        self.assertEqual([c.summary for c in calendars], [c.summary for c in partial_calendars])
+        self.assertTrue(all(c.id is None for c in partial_calendars))
+
+        raw_calendars = list(self.gc.get_calendar_list(raw=True))
+        self.assertEqual([c.id for c in calendars], [c['id'] for c in raw_calendars])
+
     def test_get_calendar_list_entry(self):
         calendar = self.gc.get_calendar_list_entry()
         self.assertEqual(calendar.id, 'primary')
@@ -9,7 +9,7 @@ from tests.google_calendar_tests.mock_services.util import MockToken
 
 class TestCaseWithMockedService(TestCase):
     def setUp(self):
-        self.build_patcher = patch('googleapiclient.discovery.build', return_value=MockService())
+        self.build_patcher = patch('googleapiclient.discovery.build_from_document', return_value=MockService())
         self.build_patcher.start()
 
         self.gc = GoogleCalendar(credentials=MockToken(valid=True))
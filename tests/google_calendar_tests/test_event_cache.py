@@ -0,0 +1,59 @@
+from beautiful_date import D, days
+
+from gcsa.cache import LRUEventCache
+from gcsa.event import Event
+from gcsa.serializers.event_serializer import EventSerializer
+from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
+
+
+class TestEventCache(TestCaseWithMockedService):
+    def setUp(self):
+        super().setUp()
+        self.gc.event_cache = LRUEventCache()
+        self.events_requests = self.gc.service.events()
+        self.events_requests.etags = True
+
+    def test_get_event_not_modified(self):
+        event = self.gc.get_event('event_id_1')
+        self.assertEqual(self.events_requests.not_modified_responses, 0)
+        self.assertEqual(self.gc.event_cache.get('primary', 'event_id_1')['etag'], '"event_id_1_0"')
+
+        cached_event = self.gc.get_event('event_id_1')
+        self.assertEqual(self.events_requests.not_modified_responses, 1)
+        self.assertEqual(cached_event, event)
+        self.assertIsNot(cached_event, event)
+
+    def test_get_event_modified(self):
+        event = self.gc.get_event('event_id_1')
+        event.summary = 'Modified'
+        # modified by another client
+        self.events_requests.update(eventId=event.id, body=EventSerializer.to_json(event)).execute()
+
+        modified_event = self.gc.get_event('event_id_1')
+        self.assertEqual(self.events_requests.not_modified_responses, 0)
+        self.assertEqual(modified_event.summary, 'Modified')
+        self.assertEqual(self.gc.event_cache.get('primary', 'event_id_1')['summary'], 'Modified')
+
+    def test_cache_updated_on_changes(self):
+        event = self.gc.add_event(Event('Cached', start=D.today()[:] + 1 * days))
+        self.assertEqual(self.gc.event_cache.get('primary', event.id)['summary'], 'Cached')
+
+        event.summary = 'Cached updated'
+        self.gc.update_event(event)
+        self.assertEqual(self.gc.event_cache.get('primary', event.id)['summary'], 'Cached updated')
+
+        # cached version is up to date
+        self.assertEqual(self.gc.get_event(event.id).summary, 'Cached updated')
+        self.assertEqual(self.events_requests.not_modified_responses, 1)
+
+        self.gc.delete_event(event)
+        self.assertIsNone(self.gc.event_cache.get('primary', event.id))
+
+        self.gc.get_event('event_id_2')
+        self.gc.move_event('event_id_2', destination_calendar_id='other_calendar')
+        self.assertIsNone(self.gc.event_cache.get('primary', 'event_id_2'))
+        self.assertIsNotNone(self.gc.event_cache.get('other_calendar', 'event_id_2'))
+
+    def test_not_cached_with_parameters(self):
+        self.gc.get_event('event_id_1', maxAttendees=1)
+        self.assertIsNone(self.gc.event_cache.get('primary', 'event_id_1'))
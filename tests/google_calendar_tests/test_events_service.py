@@ -1,6 +1,13 @@
+import re
+from io import StringIO
+from unittest.mock import patch
+
 from beautiful_date import D, days, years, hours
 
-from gcsa.event import Event
+from gcsa.event import Event, LazyEvent
+from gcsa.ics import read_ics
+from gcsa.serializers.event_serializer import EventSerializer
+from gcsa.sync import SyncState
 from gcsa.util.date_time_util import ensure_localisation
 from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
 
@@ -93,6 +100,138 @@ class TestEventsService(TestCaseWithMockedService):
         self.assertEqual(events[0].id, min(events, key=lambda e: e.start).id)
         self.assertEqual(events[-1].id, max(events, key=lambda e: e.start).id)
 
+    def test_get_events_prefetch(self):
+        events = list(self.gc.get_events(single_events=True, order_by='startTime'))
+        prefetched_events = list(self.gc.get_events(single_events=True, order_by='startTime', prefetch_pages=2))
+        self.assertEqual(len(prefetched_events), 19)
+        self.assertEqual([e.id for e in events], [e.id for e in prefetched_events])
+
+        instances = list(self.gc.get_instances('event_id_1', prefetch_pages=1))
+        self.assertEqual(len(instances), 9)
+
+        events = self.gc.get_events(prefetch_pages=1)
+        self.assertIsInstance(next(events), Event)
+        events.close()
+
+        with self.assertRaises(ValueError):
+            # error in the background thread is raised in the consumer's thread
+            list(self.gc.get_instances('non_existing_id', prefetch_pages=1))
+
+    def test_get_events_parallel(self):
+        time_min = D.today()
+        time_max = D.today() + 12 * days
+        events = list(self.gc.get_events(time_min, time_max, single_events=True, order_by='startTime'))
+        for shards in (1, 3, 12):
+            parallel_events = list(self.gc.get_events_parallel(
+                time_min, time_max,
+                single_events=True,
+                order_by='startTime',
+                shards=shards
+            ))
+            self.assertEqual([e.id for e in parallel_events], [e.id for e in events])
+
+        events = list(self.gc.get_events(time_min, time_max, order_by='updated'))
+        parallel_events = list(self.gc.get_events_parallel(time_min, time_max, order_by='updated', shards=4))
+        self.assertEqual(len(parallel_events), len(events))
+        self.assertEqual(
+            [e.updated for e in parallel_events],
+            sorted(e.updated for e in parallel_events)
+        )
+
+        parallel_events = list(self.gc.get_events_parallel(time_min, time_max, query='John', shards=4))
+        self.assertEqual(len(parallel_events), 1)
+
+        with self.assertRaises(ValueError):
+            list(self.gc.get_events_parallel(order_by='startTime'))
+        with self.assertRaises(ValueError):
+            list(self.gc.get_events_parallel(shards=0))
+
+    def test_get_events_raw(self):
+        time_min = D.today()[:] - 5 * days
+        events = list(self.gc.get_events(time_min=time_min, single_events=True, order_by='startTime'))
+        raw_events = list(self.gc.get_events(time_min=time_min, single_events=True, order_by='startTime', raw=True))
+        self.assertTrue(all(isinstance(e, dict) for e in raw_events))
+        self.assertEqual([e['id'] for e in raw_events], [e.id for e in events])
+        self.assertEqual(raw_events[0]['summary'], events[0].summary)
+
+        raw_instances = list(self.gc.get_instances('event_id_1', raw=True))
+        self.assertEqual(len(raw_instances), 9)
+        self.assertTrue(all(isinstance(e, dict) for e in raw_instances))
+
+        raw_events = list(self.gc.sync_events(SyncState(), raw=True))
+        self.assertTrue(all(isinstance(e, dict) for e in raw_events))
+
+        time_max = D.today() + 12 * days
+        events = list(self.gc.get_events_parallel(time_min, time_max, order_by='updated'))
+        raw_events = list(self.gc.get_events_parallel(time_min, time_max, order_by='updated', raw=True))
+        self.assertEqual([e['id'] for e in raw_events], [e.id for e in events])
+
+    def test_get_events_lazy(self):
+        time_min = D.today()[:] - 5 * days
+        events = list(self.gc.get_events(time_min=time_min, single_events=True, order_by='startTime'))
+        lazy_events = list(self.gc.get_events(time_min=time_min, single_events=True, order_by='startTime', lazy=True))
+        self.assertTrue(all(isinstance(e, LazyEvent) for e in lazy_events))
+        self.assertEqual(lazy_events, events)
+        self.assertEqual([e.attendees for e in lazy_events], [e.attendees for e in events])
+
+        lazy_instances = list(self.gc.get_instances('event_id_1', lazy=True))
+        self.assertEqual(len(lazy_instances), 9)
+        self.assertTrue(all(isinstance(e, LazyEvent) for e in lazy_instances))
+
+        lazy_events = list(self.gc.sync_events(SyncState(), lazy=True))
+        self.assertTrue(all(isinstance(e, LazyEvent) for e in lazy_events))
+
+    def test_get_events_frame(self):
+        time_min = D.today()[:] - 5 * days
+        events = list(self.gc.get_events(time_min=time_min))
+        frame = self.gc.get_events_frame(time_min=time_min)
+        self.assertEqual(frame.id, [e.id for e in events])
+        self.assertEqual(list(frame.start), [int(e.start.timestamp()) for e in events])
+        self.assertEqual(list(frame.attendees), [len(e.attendees) for e in events])
+        self.assertEqual(frame.calendar.values, ['primary'])
+
+        frame = self.gc.get_events_frame(time_min=time_min, calendar_id='work')
+        self.assertEqual(frame.calendar.values, ['work'])
+
+    def test_merge_shards(self):
+        start = D.today()[:]
+        event1 = Event('Event 1', start=start, event_id='1', _updated=start + 1 * days)
+        event2 = Event('Event 2', start=start + 1 * days, end=start + 3 * days, event_id='2', _updated=start)
+        event3 = Event('Event 3', start=start + 2 * days, event_id='3', _updated=start + 2 * days)
+        boundaries = [start, start + 2 * days, start + 4 * days]
+
+        # event2 spans over two shards
+        shards = [[event1, event2], [event2, event3]]
+        merged = list(self.gc._merge_shards(shards, boundaries, order_by='startTime'))
+        self.assertEqual([e.id for e in merged], ['1', '2', '3'])
+
+        shards = [[event2, event1], [event2, event3]]
+        merged = list(self.gc._merge_shards(shards, boundaries, order_by='updated'))
+        self.assertEqual([e.id for e in merged], ['2', '1', '3'])
+
+        raw_shards = [[EventSerializer.to_json(event1), EventSerializer.to_json(event2)],
+                      [EventSerializer.to_json(event2), EventSerializer.to_json(event3)]]
+        merged = list(self.gc._merge_shards(raw_shards, boundaries, order_by=None, raw=True))
+        self.assertEqual([e['id'] for e in merged], ['1', '2', '3'])
+
+    def test_merge_shards_streams(self):
+        start = D.today()[:]
+        event1 = Event('Event 1', start=start, event_id='1')
+        event2 = Event('Event 2', start=start + 2 * days, event_id='2')
+        boundaries = [start, start + 2 * days, start + 4 * days]
+        consumed = []
+
+        def shard(events):
+            for event in events:
+                consumed.append(event.id)
+                yield event
+
+        merged = self.gc._merge_shards([shard([event1]), shard([event2])], boundaries, order_by='startTime')
+        self.assertEqual(next(merged).id, '1')
+        self.assertEqual(consumed, ['1'])
+        self.assertEqual(next(merged).id, '2')
+        self.assertEqual(consumed, ['1', '2'])
+
     def test_get_events_query(self):
         events = list(self.gc.get_events(query='test4', time_max=D.today()[:] + 2 * years))
         self.assertEqual(len(events), 2)  # test4 and test42
@@ -127,6 +266,68 @@ class TestEventsService(TestCaseWithMockedService):
         with self.assertRaises(ValueError):
             list(self.gc.get_instances(recurring_event=recurring_event_without_id))
 
+    def test_sync_events(self):
+        sync_state = SyncState()
+
+        events = list(self.gc.sync_events(sync_state))
+        self.assertTrue(sync_state.full_sync)
+        self.assertEqual(len(events), 11)
+        self.assertEqual(sync_state.sync_token, 'sync_token_0')
+
+        events = list(self.gc.sync_events(sync_state))
+        self.assertFalse(sync_state.full_sync)
+        self.assertEqual(events, [])
+
+        new_event = self.gc.add_event(Event('New event', start=D.today()[:] + 3 * days, event_id='new_event'))
+        event = self.gc.get_event('event_id_2')
+        event.summary = 'Updated summary'
+        self.gc.update_event(event)
+        self.gc.delete_event('event_id_3')
+
+        events = list(self.gc.sync_events(sync_state))
+        self.assertFalse(sync_state.full_sync)
+        self.assertEqual(sync_state.sync_token, 'sync_token_3')
+        self.assertEqual(len(events), 3)
+        events_by_id = {e.id: e for e in events}
+        self.assertEqual(events_by_id['new_event'].summary, new_event.summary)
+        self.assertEqual(events_by_id['event_id_2'].summary, 'Updated summary')
+        self.assertEqual(events_by_id['event_id_3'].other['status'], 'cancelled')
+
+        # token is not updated until all events are iterated over
+        self.gc.delete_event('event_id_4')
+        next(iter(self.gc.sync_events(sync_state)))
+        self.assertEqual(sync_state.sync_token, 'sync_token_3')
+
+    def test_sync_events_expired_token(self):
+        sync_state = SyncState(sync_token='expired_token')
+        self.assertFalse(sync_state.full_sync)
+
+        events = list(self.gc.sync_events(sync_state, single_events=True))
+        self.assertTrue(sync_state.full_sync)
+        self.assertEqual(len(events), 20)
+        self.assertEqual(sync_state.sync_token, 'sync_token_0')
+
+    def test_get_events_fields(self):
+        events = list(self.gc.get_events(time_min=D.today()[:] - 5 * days, fields=['id', 'start']))
+        self.assertEqual(len(events), 10)  # all the pages are listed
+        for event in events:
+            self.assertIsNotNone(event.id)
+            self.assertIsNotNone(event.start)
+            self.assertIsNone(event.end)
+            self.assertIsNone(event.summary)
+            self.assertIsNone(event.updated)
+
+        events = list(self.gc.get_events(time_min=D.today()[:] - 5 * days, fields='id,summary'))
+        self.assertEqual(len(events), 10)
+        self.assertTrue(all(e.summary is not None and e.start is None for e in events))
+
+    def test_get_event_fields(self):
+        event = self.gc.get_event('event_id_1', fields=['id', 'summary'])
+        self.assertEqual(event.id, 'event_id_1')
+        self.assertEqual(event.summary, 'test1')
+        self.assertIsNone(event.start)
+        self.assertEqual(event.attendees, [])
+
     def test_get_event(self):
         start = D.today()[:]
         end = start + 2 * hours
@@ -204,6 +405,92 @@ class TestEventsService(TestCaseWithMockedService):
         received_new_event = self.gc.get_event(new_event.id)
         self.assertEqual(received_new_event, new_event)
 
+    def test_bulk_import(self):
+        start = D.today()[:]
+        events = (Event(f'event_{i}', start=start + i * hours) for i in range(10))
+        result = self.gc.bulk_import(events, concurrency=3)
+        self.assertEqual(result.imported, 10)
+        self.assertEqual(result.duplicates, 0)
+        self.assertDictEqual(result.failed, {})
+
+        imported = self.gc.service.events().test_events[-10:]
+        self.assertListEqual([e.summary for e in imported], [f'event_{i}' for i in range(10)])
+        for e in imported:
+            self.assertRegex(e.id, re.compile('^[0-9a-v]{32}$'))
+            self.assertEqual(e.other['iCalUID'], e.id + '@gcsa')
+
+        # Same events get the same ids
+        events = (Event(f'event_{i}', start=start + i * hours) for i in range(10))
+        result = self.gc.bulk_import(events, concurrency=3)
+        self.assertEqual(result.imported, 0)
+        self.assertEqual(result.duplicates, 10)
+        self.assertEqual(result.succeeded, 10)
+
+        with self.assertRaises(ValueError):
+            self.gc.bulk_import([], concurrency=0)
+
+    def test_bulk_import_checkpoint(self):
+        self.setUpPyfakefs()
+        start = D.today()[:]
+        events = [Event(f'event_{i}', start=start + i * hours, event_id=f'event{i}') for i in range(5)]
+        events.insert(2, {'id': 'invalid', 'summary': 'No start'})
+
+        result = self.gc.bulk_import(events[:4], checkpoint_path='import.checkpoint')
+        self.assertEqual(result.imported, 3)
+        self.assertListEqual(list(result.failed), ['invalid'])
+        self.assertEqual(result.failed['invalid'].resp.status, 400)
+        with open('import.checkpoint') as f:
+            self.assertSetEqual(set(f.read().split()), {'event0', 'event1', 'event2'})
+
+        # Restarted import skips succeeded events and retries failed ones
+        result = self.gc.bulk_import(events, checkpoint_path='import.checkpoint')
+        self.assertEqual(result.skipped, 3)
+        self.assertEqual(result.imported, 2)
+        self.assertListEqual(list(result.failed), ['invalid'])
+        self.assertEqual(str(result), 'imported=2, duplicates=0, skipped=3, failed=1')
+
+        # Already existing events are recorded as succeeded
+        self.gc.service.events().test_events.append(Event('event_5', start=start, event_id='event5'))
+        result = self.gc.bulk_import([Event('event_5', start=start, event_id='event5')],
+                                     checkpoint_path='import.checkpoint')
+        self.assertEqual(result.duplicates, 1)
+        with open('import.checkpoint') as f:
+            self.assertEqual(len(f.read().split()), 6)
+
+    def test_bulk_import_connection_error(self):
+        events_requests = self.gc.service.events()
+        import_ = events_requests.import_
+
+        def failing_import(body, **kwargs):
+            if body['summary'] == 'event_2':
+                raise ConnectionError('Connection reset')
+            return import_(body=body, **kwargs)
+
+        start = D.today()[:]
+        events = [Event(f'event_{i}', start=start + i * hours, event_id=f'event{i}') for i in range(5)]
+        with patch.object(events_requests, 'import_', failing_import):
+            result = self.gc.bulk_import(events, concurrency=2)
+        self.assertEqual(result.imported, 4)
+        self.assertListEqual(list(result.failed), ['event2'])
+        self.assertIsInstance(result.failed['event2'], ConnectionError)
+
+    def test_bulk_import_ics(self):
+        ics = (
+            'BEGIN:VCALENDAR\r\n'
+            'BEGIN:VEVENT\r\nUID:weekly\r\nDTSTART:20230320T100000Z\r\nRRULE:FREQ=WEEKLY;COUNT=3\r\n'
+            'SUMMARY:Weekly\r\nEND:VEVENT\r\n'
+            'BEGIN:VEVENT\r\nUID:weekly\r\nRECURRENCE-ID:20230327T100000Z\r\nDTSTART:20230328T100000Z\r\n'
+            'SUMMARY:Weekly (moved)\r\nEND:VEVENT\r\n'
+            'END:VCALENDAR\r\n'
+        )
+        result = self.gc.bulk_import(read_ics(StringIO(ics)))
+        self.assertEqual(result.imported, 2)
+
+        imported = self.gc.service.events().test_events[-2:]
+        self.assertListEqual([e.summary for e in imported], ['Weekly', 'Weekly (moved)'])
+        self.assertListEqual([e.other['iCalUID'] for e in imported], ['weekly', 'weekly'])
+        self.assertNotEqual(imported[0].id, imported[1].id)
+
     def test_move_event(self):
         start = D.today()[:]
         end = start + 2 * hours
@@ -1,8 +1,9 @@
-from datetime import timedelta
+from datetime import timedelta, time
 
-from beautiful_date import D, weeks
+from beautiful_date import D, weeks, hours, minutes, Apr
 
-from gcsa.free_busy import FreeBusyQueryError
+from gcsa.attendee import Attendee
+from gcsa.free_busy import FreeBusyQueryError, TimeRange, TimeSlot
 from gcsa.util.date_time_util import ensure_localisation
 from tests.google_calendar_tests.mock_services.util import time_range_within
 from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
@@ -83,3 +84,103 @@ class TestFreeBusyService(TestCaseWithMockedService):
         self.assertIn('group-unknown', free_busy.groups_errors)
         self.assertFalse(free_busy.calendars)
         self.assertFalse(free_busy.groups)
+
+
+class TestFindFreeSlots(TestCaseWithMockedService):
+    def setUp(self):
+        super().setUp()
+        self.free_busy_requests = self.gc.service.freebusy()
+        self.day = ensure_localisation((1 / Apr / 2030)[0:00], 'UTC')  # Monday
+
+    def add_calendar(self, calendar_id, *busy):
+        self.free_busy_requests.calendars[calendar_id] = [
+            TimeRange(self.day + timedelta(hours=start), self.day + timedelta(hours=end)) for start, end in busy
+        ]
+
+    def find_free_slots(self, attendees, **kwargs):
+        return self.gc.find_free_slots(
+            attendees,
+            1 * hours,
+            time_min=1 / Apr / 2030,
+            time_max=2 / Apr / 2030,
+            working_hours=(time(9), time(12)),
+            step=30 * minutes,
+            timezone='UTC',
+            **kwargs
+        )
+
+    def test_find_free_slots(self):
+        self.add_calendar('user1@gmail.com', (9, 10))
+        self.add_calendar('user2@gmail.com', (9.5, 11))
+
+        slots = self.find_free_slots(['user1@gmail.com', Attendee('user2@gmail.com')], max_results=3)
+        self.assertListEqual(slots, [
+            TimeSlot(self.day + 11 * hours, self.day + 12 * hours, ()),
+            TimeSlot(self.day + 10 * hours, self.day + 11 * hours, ('user2@gmail.com',)),
+            TimeSlot(self.day + timedelta(hours=10.5), self.day + timedelta(hours=11.5), ('user2@gmail.com',)),
+        ])
+
+        slots = self.find_free_slots(['user1@gmail.com', 'user2@gmail.com'], max_results=None)
+        self.assertEqual(len(slots), 5)
+        self.assertTupleEqual(slots[-1].conflicts, ('user1@gmail.com', 'user2@gmail.com'))
+
+        slots = self.find_free_slots(['user1@gmail.com', 'user2@gmail.com'], max_results=1)
+        self.assertListEqual(slots, [TimeSlot(self.day + 11 * hours, self.day + 12 * hours, ())])
+
+    def test_find_free_slots_working_days(self):
+        self.add_calendar('user1@gmail.com')
+        self.assertListEqual(self.find_free_slots(['user1@gmail.com'], working_days=[5, 6]), [])
+        self.assertEqual(len(self.find_free_slots(['user1@gmail.com'], working_days=[0])), 5)
+
+    def test_find_free_slots_without_working_hours(self):
+        self.add_calendar('user1@gmail.com', (0, 23))
+        slots = self.gc.find_free_slots(['user1@gmail.com'], 1 * hours, time_min=1 / Apr / 2030,
+                                        time_max=2 / Apr / 2030, timezone='UTC', max_results=None)
+        # every 15 minutes
+        self.assertEqual(len(slots), 24 * 4 - 3)
+        self.assertEqual(slots[0], TimeSlot(self.day + 23 * hours, self.day + 24 * hours, ()))
+        self.assertTrue(all(slot.conflicts == ('user1@gmail.com',) for slot in slots[1:]))
+
+    def test_find_free_slots_sharded(self):
+        for i in range(180):
+            self.add_calendar('user{}@gmail.com'.format(i))
+        self.add_calendar('user5@gmail.com', (10, 11))
+        self.add_calendar('user150@gmail.com', (9, 10))
+        # 20 members of the group are also requested directly
+        self.free_busy_requests.groups['group-all-hands'] = ['user{}@gmail.com'.format(i) for i in range(100, 180)]
+
+        attendees = ['user{}@gmail.com'.format(i) for i in range(120)] + ['group-all-hands']
+        slots = self.find_free_slots(attendees, max_results=None)
+
+        queries = self.free_busy_requests.queries
+        self.assertTrue(all(len(q['items']) <= 50 for q in queries))
+        # 3 shards of the requested ids + members of the group that didn't fit into the query with the group
+        self.assertEqual(len(queries), 4)
+        queried_ids = [i['id'] for q in queries for i in q['items']]
+        self.assertEqual(len(queried_ids), len(set(queried_ids)))
+
+        self.assertListEqual([(slot.start.hour, slot.start.minute, slot.conflicts) for slot in slots], [
+            (11, 0, ()),
+            (9, 0, ('user150@gmail.com',)),
+            (10, 0, ('user5@gmail.com',)),
+            (10, 30, ('user5@gmail.com',)),
+            (9, 30, ('user5@gmail.com', 'user150@gmail.com')),
+        ])
+
+    def test_find_free_slots_errors(self):
+        self.add_calendar('user1@gmail.com', (9, 10))
+        with self.assertRaises(FreeBusyQueryError) as cm:
+            self.find_free_slots(['user1@gmail.com', 'unknown@gmail.com'])
+        self.assertIn('unknown@gmail.com', cm.exception.calendars_errors)
+
+        with self.assertRaises(FreeBusyQueryError) as cm:
+            self.find_free_slots(['user1@gmail.com', 'group-unknown'])
+        self.assertIn('group-unknown', cm.exception.groups_errors)
+
+        slots = self.find_free_slots(['user1@gmail.com', 'unknown@gmail.com', 'group-unknown'], ignore_errors=True)
+        self.assertListEqual([len(slot.conflicts) for slot in slots], [0, 0, 0, 1, 1])
+
+        with self.assertRaises(ValueError):
+            self.gc.find_free_slots(['user1@gmail.com'], timedelta(0))
+        with self.assertRaises(ValueError):
+            self.gc.find_free_slots(['user1@gmail.com'], 1 * hours, concurrency=0)
@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from gcsa._services.http_pool import HttpPool
+from tests.google_calendar_tests.mock_services.util import MockToken
+from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
+
+
+class CountingMockToken(MockToken):
+    def __init__(self, valid):
+        super().__init__(valid)
+        self.refreshes = 0
+
+    def refresh(self, _):
+        time.sleep(0.01)
+        self.refreshes += 1
+        super().refresh(_)
+
+
+class TestHttpPool(TestCase):
+    def test_pool_size(self):
+        pool = HttpPool(MockToken(valid=True), size=4)
+        in_use = []
+        max_in_use = [0]
+        lock = threading.Lock()
+
+        def use_transport(_):
+            with pool.checkout() as http:
+                with lock:
+                    self.assertNotIn(http, in_use)
+                    in_use.append(http)
+                    max_in_use[0] = max(max_in_use[0], len(in_use))
+                time.sleep(0.005)
+                with lock:
+                    in_use.remove(http)
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(use_transport, range(64)))
+
+        self.assertLessEqual(max_in_use[0], 4)
+        self.assertLessEqual(pool.created, 4)
+
+        with self.assertRaises(ValueError):
+            HttpPool(MockToken(valid=True), size=0)
+
+    def test_transport_reused(self):
+        pool = HttpPool(MockToken(valid=True))
+        with pool.checkout() as http:
+            pass
+        with pool.checkout() as http_2:
+            self.assertIs(http, http_2)
+        self.assertEqual(pool.created, 1)
+
+    def test_failed_creation(self):
+        pool = HttpPool(MockToken(valid=True), size=1)
+        with patch('gcsa._services.http_pool.build_http', side_effect=[OSError, object()]):
+            with self.assertRaises(OSError):
+                with pool.checkout():
+                    pass
+            self.assertEqual(pool.created, 0)
+
+            # slot of the failed transport is freed, so this doesn't block
+            with pool.checkout():
+                pass
+        self.assertEqual(pool.created, 1)
+
+    def test_locked_refresh(self):
+        credentials = CountingMockToken(valid=False)
+        pool = HttpPool(credentials, size=8)
+
+        def use_transport(_):
+            with pool.checkout():
+                pass
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(use_transport, range(8)))
+
+        self.assertEqual(credentials.refreshes, 1)
+        self.assertTrue(credentials.valid)
+
+
+class TestSharedGoogleCalendar(TestCaseWithMockedService):
+    def test_shared_between_threads(self):
+        event_ids = [f'event_id_{i % 9 + 1}' for i in range(100)]
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            events = list(executor.map(self.gc.get_event, event_ids))
+
+        self.assertEqual([e.id for e in events], event_ids)
+        self.assertLessEqual(self.gc._http_pool.created, self.gc._http_pool.size)
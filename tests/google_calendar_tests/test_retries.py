@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from beautiful_date import D, days
+from googleapiclient.errors import HttpError
+
+from gcsa.event import Event
+from gcsa.google_calendar import GoogleCalendar
+from gcsa.retry import RetryPolicy
+from tests.google_calendar_tests.mock_services.util import MockToken
+from tests.google_calendar_tests.test_case_with_mocked_service import TestCaseWithMockedService
+from tests.test_rate_limit import CountingRateLimiter
+from tests.test_retry import http_error
+
+
+class FlakyRequests:
+    """Wraps request method so that the first requests fail with the given errors."""
+
+    def __init__(self, request_method, errors):
+        self.request_method = request_method
+        self.errors = list(errors)
+
+    def __call__(self, *args, **kwargs):
+        request = self.request_method(*args, **kwargs)
+        flaky_requests = self
+
+        class FlakyRequest:
+            def execute(self, http=None):
+                if flaky_requests.errors:
+                    raise flaky_requests.errors.pop(0)
+                return request.execute()
+
+        return FlakyRequest()
+
+
+@patch('gcsa.retry.time.sleep')
+class TestRetries(TestCaseWithMockedService):
+    def setUp(self):
+        super().setUp()
+        self.gc.retry_policy = RetryPolicy()
+        self.events_requests = self.gc.service.events()
+
+    def make_flaky(self, method_name, errors):
+        method = getattr(self.events_requests, method_name)
+        patcher = patch.object(self.events_requests, method_name, FlakyRequests(method, errors))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_retries_by_default(self, sleep):
+        gc = GoogleCalendar(credentials=MockToken(valid=True))
+        self.events_requests = gc.service.events()
+        self.make_flaky('get', [http_error(503)])
+        with self.assertRaises(HttpError):
+            gc.get_event('event_id_1')
+        self.assertEqual((gc.retry_policy.retries, gc.retry_policy.failures), (0, 1))
+        sleep.assert_not_called()
+
+    def test_get_event(self, *_):
+        self.make_flaky('get', [http_error(503), http_error(429)])
+        event = self.gc.get_event('event_id_1')
+        self.assertEqual(event.id, 'event_id_1')
+        self.assertEqual(self.gc.retry_policy.retries, 2)
+
+    def test_add_event(self, *_):
+        start = D.today()[:] + 1 * days
+
+        self.make_flaky('insert', [http_error(503)])
+        with self.assertRaises(HttpError):
+            self.gc.add_event(Event('Not retried', start=start))
+
+        self.make_flaky('insert', [http_error(503), http_error(403, 'rateLimitExceeded')])
+        event = self.gc.add_event(Event('Retried', start=start, event_id='retried_event'))
+        self.assertEqual(event.id, 'retried_event')
+        self.assertEqual(self.gc.retry_policy.retries, 2)
+        self.assertEqual(self.gc.retry_policy.failures, 0)
+
+    def test_move_event(self, *_):
+        event = self.gc.get_event('event_id_1')
+        self.make_flaky('move', [http_error(503)])
+        with self.assertRaises(HttpError):
+            self.gc.move_event(event, destination_calendar_id='work')
+        self.assertEqual(self.gc.retry_policy.retries, 0)
+
+        # Rate limit errors are still retried
+        self.make_flaky('move', [http_error(429)])
+        self.gc.move_event(event, destination_calendar_id='work')
+        self.assertEqual(self.gc.retry_policy.retries, 1)
+
+    def test_list_pages(self, *_):
+        self.make_flaky('list', [http_error(500)])
+        events = list(self.gc.get_events(time_min=D.today()[:] - 5 * days))
+        self.assertEqual(len(events), 10)
+        self.assertEqual(self.gc.retry_policy.retries, 1)
+
+    def test_batch(self, sleep):
+        self.make_flaky('get', [http_error(429), http_error(404)])
+        with self.gc.batch() as batch:
+            batch.get_event('event_id_1')
+            batch.get_event('event_id_2')
+            batch.get_event('event_id_3')
+
+        self.assertIsInstance(batch.results[0], Event)
+        self.assertIsInstance(batch.results[1], HttpError)
+        self.assertIsInstance(batch.results[2], Event)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(self.gc.retry_policy.retries, 1)
+
+
+class TestRateLimiting(TestCaseWithMockedService):
+    def test_every_request_is_throttled(self):
+        self.gc.rate_limiter = rate_limiter = CountingRateLimiter()
+
+        self.gc.get_event('event_id_1')
+        self.assertEqual(rate_limiter.acquired, 1)
+
+        list(self.gc.get_events(time_min=D.today()[:] - 5 * days))  # 4 pages
+        self.assertEqual(rate_limiter.acquired, 5)
+
+        with self.gc.batch() as batch:
+            batch.get_event('event_id_1')
+            batch.get_event('event_id_2')
+        self.assertEqual(rate_limiter.acquired, 7)
@@ -0,0 +1,70 @@
+import re
+
+from pyfakefs.fake_filesystem_unittest import TestCase
+
+from gcsa.bulk_import import ImportCheckpoint, BulkImportResult, generate_event_id
+
+
+class TestGenerateEventId(TestCase):
+    def test_generate_event_id(self):
+        event_json = {'summary': 'Meeting', 'start': {'dateTime': '2023-01-02T10:00:00Z'}}
+        event_id = generate_event_id(event_json)
+        self.assertRegex(event_id, re.compile('^[0-9a-v]{32}$'))
+
+        # deterministic and independent of the key order and server-assigned fields
+        self.assertEqual(generate_event_id({'start': {'dateTime': '2023-01-02T10:00:00Z'}, 'summary': 'Meeting'}),
+                         event_id)
+        self.assertEqual(generate_event_id({**event_json, 'etag': '"123"', 'updated': '2023-01-01'}), event_id)
+        self.assertNotEqual(generate_event_id({**event_json, 'summary': 'Lunch'}), event_id)
+
+    def test_generate_event_id_ical_uid(self):
+        event_id = generate_event_id({'iCalUID': 'legacy-1@example.com', 'summary': 'Meeting'})
+        self.assertEqual(generate_event_id({'iCalUID': 'legacy-1@example.com', 'summary': 'Renamed'}), event_id)
+        self.assertNotEqual(generate_event_id({'iCalUID': 'legacy-2@example.com', 'summary': 'Meeting'}), event_id)
+
+        # modified instances of the recurring event have the same iCalUID
+        instance_id = generate_event_id({
+            'iCalUID': 'legacy-1@example.com',
+            'originalStartTime': {'dateTime': '2023-01-09T10:00:00+01:00', 'timeZone': 'Europe/Prague'}
+        })
+        self.assertNotEqual(instance_id, event_id)
+
+
+class TestImportCheckpoint(TestCase):
+    def setUp(self):
+        self.setUpPyfakefs()
+
+    def test_add(self):
+        with ImportCheckpoint('import.checkpoint') as checkpoint:
+            checkpoint.add('event1')
+            checkpoint.add('event2')
+            checkpoint.add('event1')
+            self.assertIn('event1', checkpoint)
+            self.assertNotIn('event3', checkpoint)
+            self.assertEqual(len(checkpoint), 2)
+            self.assertEqual(repr(checkpoint), "<ImportCheckpoint path='import.checkpoint', 2 events>")
+
+        with open('import.checkpoint') as f:
+            self.assertEqual(f.read(), 'event1\nevent2\n')
+
+        with ImportCheckpoint('import.checkpoint') as checkpoint:
+            self.assertEqual(len(checkpoint), 2)
+            self.assertIn('event2', checkpoint)
+
+    def test_incomplete_line(self):
+        self.fs.create_file('import.checkpoint', contents='event1\nevent2\neve')
+        with ImportCheckpoint('import.checkpoint') as checkpoint:
+            self.assertEqual(len(checkpoint), 2)
+            self.assertNotIn('eve', checkpoint)
+            checkpoint.add('event3')
+
+        with ImportCheckpoint('import.checkpoint') as checkpoint:
+            self.assertEqual(len(checkpoint), 3)
+            self.assertIn('event3', checkpoint)
+
+
+class TestBulkImportResult(TestCase):
+    def test_repr_str(self):
+        result = BulkImportResult(imported=3, duplicates=1, skipped=2, failed={'event': ValueError()})
+        self.assertEqual(result.succeeded, 4)
+        self.assertEqual(repr(result), '<BulkImportResult imported=3, duplicates=1, skipped=2, failed=1>')
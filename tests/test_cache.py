@@ -0,0 +1,69 @@
+from pyfakefs.fake_filesystem_unittest import TestCase
+
+from gcsa.cache import EventCache, LRUEventCache, SQLiteEventCache
+
+
+class TestEventCache(TestCase):
+    def test_abstract(self):
+        class IncompleteEventCache(EventCache):
+            def get(self, calendar_id, event_id):
+                return None
+
+        with self.assertRaises(TypeError):
+            IncompleteEventCache()
+
+
+class TestLRUEventCache(TestCase):
+    def test_get_set(self):
+        cache = LRUEventCache()
+        self.assertIsNone(cache.get('primary', 'event_id'))
+
+        event_json = {'id': 'event_id', 'etag': '"1"'}
+        cache.set('primary', 'event_id', event_json)
+        # stored resource is returned as is, without serialization
+        self.assertIs(cache.get('primary', 'event_id'), event_json)
+        self.assertIsNone(cache.get('other_calendar', 'event_id'))
+
+        cache.delete('primary', 'event_id')
+        self.assertIsNone(cache.get('primary', 'event_id'))
+        cache.delete('primary', 'event_id')
+
+    def test_max_size(self):
+        cache = LRUEventCache(max_size=2)
+        cache.set('primary', '1', {'id': '1'})
+        cache.set('primary', '2', {'id': '2'})
+        cache.get('primary', '1')
+        cache.set('primary', '3', {'id': '3'})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get('primary', '1'))
+        self.assertIsNone(cache.get('primary', '2'))
+        self.assertIsNotNone(cache.get('primary', '3'))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+        with self.assertRaises(ValueError):
+            LRUEventCache(max_size=0)
+
+
+class TestSQLiteEventCache(TestCase):
+    def setUp(self):
+        self.setUpPyfakefs()
+
+    def test_get_set(self):
+        cache = SQLiteEventCache(':memory:')
+        self.assertIsNone(cache.get('primary', 'event_id'))
+
+        cache.set('primary', 'event_id', {'id': 'event_id', 'etag': '"1"'})
+        cache.set('primary', 'event_id', {'id': 'event_id', 'etag': '"2"'})
+        self.assertEqual(cache.get('primary', 'event_id'), {'id': 'event_id', 'etag': '"2"'})
+        self.assertEqual(len(cache), 1)
+
+        cache.delete('primary', 'event_id')
+        self.assertIsNone(cache.get('primary', 'event_id'))
+
+        cache.set('primary', '1', {'id': '1'})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.close()
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest import TestCase
 
 from gcsa.calendar import Calendar, CalendarListEntry, NotificationType, AccessRoles
@@ -332,8 +333,10 @@ class TestCalendarListEntrySerializer(TestCase):
             }
         }
 
+        original_json = deepcopy(calendar_json)
         serializer = CalendarListEntrySerializer(calendar_json)
         c = serializer.get_object()
+        self.assertDictEqual(calendar_json, original_json)
 
         self.assertEqual(c.summary_override, 'Summary override')
         self.assertEqual(c.color_id, '1')
@@ -376,3 +379,9 @@ class TestCalendarListEntrySerializer(TestCase):
 
         self.assertEqual(c.calendar_id, 'Calendar id')
         self.assertListEqual(c.allowed_conference_solution_types, TEST_ALLOWED_CONFERENCE_SOLUTION_TYPES)
+
+        # Partial resource (e.g. requested with `fields`)
+        c = CalendarListEntrySerializer.to_object({"summary": 'Summary', "hidden": True})
+        self.assertIsNone(c.calendar_id)
+        self.assertEqual(c.summary, 'Summary')
+        self.assertTrue(c.hidden)
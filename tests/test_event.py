@@ -1,3 +1,6 @@
+import pickle
+import tracemalloc
+from copy import deepcopy
 from datetime import time
 import datetime
 from unittest import TestCase
@@ -6,10 +9,11 @@ from beautiful_date import Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sept, Oct, De
 from gcsa.attachment import Attachment
 from gcsa.attendee import Attendee, ResponseStatus
 from gcsa.conference import ConferenceSolution, EntryPoint, SolutionType, ConferenceSolutionCreateRequest
-from gcsa.event import Event, Visibility
+from gcsa.event import Event, Visibility, LazyEvent
 from gcsa.recurrence import Recurrence, DAILY, SU, SA, MONDAY, WEEKLY
+from gcsa.person import Person
 from gcsa.reminders import PopupReminder, EmailReminder
-from gcsa.serializers.event_serializer import EventSerializer
+from gcsa.serializers.event_serializer import EventSerializer, LazyEventSerializer
 from gcsa.util.date_time_util import ensure_localisation
 
 TEST_TIMEZONE = 'Pacific/Fiji'
@@ -273,6 +277,32 @@ class TestEvent(TestCase):
         self.assertTrue(e5 <= e5)
         self.assertTrue(e5 <= e6)
 
+    def test_slots(self):
+        event = Event(
+            'Breakfast',
+            start=(1 / Jan / 2019)[9:00],
+            timezone=TEST_TIMEZONE,
+            attendees=[Attendee('attendee@gmail.com', display_name='Guest')],
+            attachments=Attachment('https://file.url', mime_type='application/vnd.google-apps.document'),
+            conference_solution=ConferenceSolution(entry_points=EntryPoint(EntryPoint.VIDEO, uri='https://video.com')),
+            reminders=[PopupReminder(30), EmailReminder(60)],
+            _creator=Person('creator@gmail.com'),
+            extra_field='value'
+        )
+        objects = [
+            event, event.attendees[0], event.attachments[0], event.conference_solution.entry_points[0],
+            event.reminders[0], event.reminders[1], event.creator
+        ]
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+        self.assertEqual(event.other, {'extra_field': 'value'})
+
+        with self.assertRaises(AttributeError):
+            event.undefined_attribute = 'value'
+
+        self.assertEqual(pickle.loads(pickle.dumps(event)), event)
+        self.assertEqual(deepcopy(event), event)
+
 
 class TestEventSerializer(TestCase):
     def setUp(self):
@@ -714,6 +744,45 @@ class TestEventSerializer(TestCase):
         self.assertEqual(event.start, 20 / Jul / 2020)
         self.assertEqual(event.end, 22 / Jul / 2020)
 
+    def test_to_object_does_not_modify_json(self):
+        event_json = {
+            'id': 'event_id',
+            'summary': 'Good day',
+            'start': {'dateTime': '2019-01-01T11:22:33', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2019-01-01T12:22:33', 'timeZone': TEST_TIMEZONE},
+            'recurrence': ['RRULE:FREQ=DAILY;WKST=SU'],
+            'attendees': [{'email': 'attendee@gmail.com', 'responseStatus': ResponseStatus.ACCEPTED}],
+            'reminders': {'useDefault': False, 'overrides': [{'method': 'popup', 'minutes': 30}]},
+            'creator': {'email': 'creator@gmail.com'},
+            'extendedProperties': {'private': {'key': 'value'}},
+            'etag': '"etag"'
+        }
+        original_json = deepcopy(event_json)
+
+        event = EventSerializer.to_object(event_json)
+        self.assertDictEqual(event_json, original_json)
+        self.assertDictEqual(event.other, {'extendedProperties': {'private': {'key': 'value'}}, 'etag': '"etag"'})
+        self.assertEqual(event.attendees[0].email, 'attendee@gmail.com')
+        self.assertEqual(event.reminders, [PopupReminder(30)])
+
+        event.recurrence.append('RRULE:FREQ=WEEKLY')
+        self.assertDictEqual(event_json, original_json)
+
+        lazy_event = LazyEventSerializer.to_object(event_json)
+        self.assertEqual(lazy_event.attendees, event.attendees)
+        self.assertEqual(lazy_event.creator, event.creator)
+        self.assertDictEqual(event_json, original_json)
+
+    def test_to_object_partial(self):
+        event = EventSerializer.to_object({
+            "id": "event_id",
+            "start": {"dateTime": "2020-07-20T10:00:00+02:00"}
+        })
+        self.assertEqual(event.id, "event_id")
+        self.assertEqual(event.start, datetime.datetime(2020, 7, 20, 8, tzinfo=datetime.timezone.utc))
+        self.assertIsNone(event.end)
+        self.assertIsNone(event.summary)
+
     def test_to_object_recurring_event(self):
         event_json_str = {
             "id": 'recurring_event_id_20201107T070000Z',
@@ -798,3 +867,82 @@ class TestEventSerializer(TestCase):
         self.assertIsInstance(event.conference_solution, ConferenceSolution)
         self.assertEqual(event.conference_solution.solution_type, 'hangoutsMeet')
         self.assertEqual(event.conference_solution.entry_points[0].uri, 'https://video.com')
+
+
+class TestLazyEventSerializer(TestCase):
+    def setUp(self):
+        self.event_json = {
+            'id': 'event_id',
+            'summary': 'Good day',
+            'start': {'dateTime': '2019-01-01T11:22:33', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2019-01-01T12:22:33', 'timeZone': TEST_TIMEZONE},
+            'attendees': [
+                {'email': 'attendee@gmail.com', 'responseStatus': ResponseStatus.NEEDS_ACTION},
+            ],
+            'reminders': {
+                'useDefault': False,
+                'overrides': [{'method': 'popup', 'minutes': 30}]
+            },
+            'creator': {'email': 'creator@gmail.com'},
+            'conferenceData': {
+                'entryPoints': [{'entryPointType': 'video', 'uri': 'https://video.com'}],
+                'conferenceSolution': {'key': {'type': 'hangoutsMeet'}, 'name': 'Hangout'},
+                'conferenceId': 'conference-id'
+            }
+        }
+
+    def test_to_object(self):
+        event = LazyEventSerializer.to_object(dict(self.event_json))
+        self.assertIsInstance(event, LazyEvent)
+        self.assertEqual(event.summary, 'Good day')
+        self.assertSetEqual(
+            set(LazyEvent._decoders),
+            {'attendees', 'attachments', 'reminders', 'conference_solution', 'creator', 'organizer'}
+        )
+        self.assertIsNotNone(event._json)
+
+        attendee = Attendee('attendee@gmail.com', _response_status=ResponseStatus.NEEDS_ACTION)
+        self.assertEqual(event.attendees, [attendee])
+        self.assertFalse(event._pending & LazyEvent.attendees.mask)
+        self.assertEqual(event.reminders, [PopupReminder(30)])
+        self.assertFalse(event.default_reminders)
+        self.assertEqual(event.creator.email, 'creator@gmail.com')
+        self.assertIsNone(event.organizer)
+        self.assertEqual(event.attachments, [])
+        self.assertIsInstance(event.conference_solution, ConferenceSolution)
+        self.assertEqual(event.conference_solution.conference_id, 'conference-id')
+        # Resource is released when everything is decoded
+        self.assertEqual(event._pending, 0)
+        self.assertIsNone(event._json)
+
+    def test_decoded_once(self):
+        event = LazyEventSerializer.to_object(dict(self.event_json))
+        self.assertIs(event.attendees, event.attendees)
+
+    def test_set_before_access(self):
+        event = LazyEventSerializer.to_object(dict(self.event_json))
+        event.add_attendee('attendee2@gmail.com')
+        self.assertEqual([a.email for a in event.attendees], ['attendee@gmail.com', 'attendee2@gmail.com'])
+
+        event.reminders = []
+        self.assertFalse(event._pending & LazyEvent.reminders.mask)
+        self.assertEqual(event.reminders, [])
+
+    def test_equal_to_eager(self):
+        lazy_event = LazyEventSerializer.to_object(dict(self.event_json))
+        event = EventSerializer.to_object(dict(self.event_json))
+        self.assertEqual(lazy_event, event)
+        self.assertDictEqual(LazyEventSerializer.to_json(lazy_event), EventSerializer.to_json(event))
+
+    def test_memory(self):
+        events_json = [dict(self.event_json, id=f'event_{i}') for i in range(100)]
+
+        def measure(serializer):
+            tracemalloc.start()
+            events = [serializer.to_object(event_json) for event_json in events_json]
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del events
+            return size
+
+        self.assertLess(measure(LazyEventSerializer), measure(EventSerializer))
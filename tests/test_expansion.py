@@ -0,0 +1,272 @@
+from datetime import datetime, date, timedelta
+from unittest import TestCase
+
+from beautiful_date import Jan, Feb, Mar, Apr, May, Jul, hours
+from dateutil.rrule import rrulestr
+from dateutil.tz import gettz
+
+from gcsa.event import Event
+from gcsa.expansion import expand_event, expand_events, _get_rule_set
+from gcsa.recurrence import Recurrence, DAILY, WEEKLY, MONTHLY, MO, FR, Duration
+from gcsa.serializers.event_serializer import EventSerializer
+
+TEST_TIMEZONE = 'Europe/Prague'
+
+# Weekly meeting over the DST change (26 Mar 2023) with excluded, modified and cancelled instances
+RECURRING_EVENT_JSON = {
+    'id': 'weekly',
+    'summary': 'Weekly meeting',
+    'start': {'dateTime': '2023-03-13T10:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+    'end': {'dateTime': '2023-03-13T11:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+    'recurrence': [
+        'EXDATE;TZID=Europe/Prague:20230410T100000',
+        'RRULE:FREQ=WEEKLY;WKST=MO;UNTIL=20230424T215959Z;BYDAY=MO'
+    ],
+    'attendees': [{'email': 'attendee@gmail.com'}]
+}
+OVERRIDES_JSON = [
+    {
+        'id': 'weekly_20230320T090000Z',
+        'summary': 'Weekly meeting (moved)',
+        'start': {'dateTime': '2023-03-20T14:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-03-20T15:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'recurringEventId': 'weekly',
+        'originalStartTime': {'dateTime': '2023-03-20T10:00:00+01:00', 'timeZone': TEST_TIMEZONE}
+    },
+    {
+        'id': 'weekly_20230403T080000Z',
+        'status': 'cancelled',
+        'recurringEventId': 'weekly',
+        'originalStartTime': {'dateTime': '2023-04-03T10:00:00+02:00', 'timeZone': TEST_TIMEZONE}
+    }
+]
+# Instances of the weekly meeting as returned by the API (get_instances)
+INSTANCES_JSON = [
+    {
+        'id': 'weekly_20230313T090000Z',
+        'start': {'dateTime': '2023-03-13T10:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-03-13T11:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'originalStartTime': {'dateTime': '2023-03-13T10:00:00+01:00', 'timeZone': TEST_TIMEZONE}
+    },
+    {
+        'id': 'weekly_20230320T090000Z',
+        'start': {'dateTime': '2023-03-20T14:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-03-20T15:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        'originalStartTime': {'dateTime': '2023-03-20T10:00:00+01:00', 'timeZone': TEST_TIMEZONE}
+    },
+    {
+        'id': 'weekly_20230327T080000Z',
+        'start': {'dateTime': '2023-03-27T10:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-03-27T11:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'originalStartTime': {'dateTime': '2023-03-27T10:00:00+02:00', 'timeZone': TEST_TIMEZONE}
+    },
+    {
+        'id': 'weekly_20230417T080000Z',
+        'start': {'dateTime': '2023-04-17T10:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-04-17T11:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'originalStartTime': {'dateTime': '2023-04-17T10:00:00+02:00', 'timeZone': TEST_TIMEZONE}
+    },
+    {
+        'id': 'weekly_20230424T080000Z',
+        'start': {'dateTime': '2023-04-24T10:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'end': {'dateTime': '2023-04-24T11:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        'originalStartTime': {'dateTime': '2023-04-24T10:00:00+02:00', 'timeZone': TEST_TIMEZONE}
+    },
+]
+
+
+class TestExpandEvent(TestCase):
+    def setUp(self):
+        self.event = EventSerializer.to_object(RECURRING_EVENT_JSON)
+        self.overrides = [EventSerializer.to_object(o) for o in OVERRIDES_JSON]
+
+    def assert_instances_equal(self, instances, instances_json):
+        self.assertListEqual(
+            [(i.id, i.start, i.end, i.other['originalStartTime']['dateTime']) for i in instances],
+            [
+                (
+                    i['id'],
+                    datetime.fromisoformat(i['start']['dateTime']),
+                    datetime.fromisoformat(i['end']['dateTime']),
+                    i['originalStartTime']['dateTime']
+                )
+                for i in instances_json
+            ]
+        )
+
+    def test_expand_event(self):
+        instances = list(expand_event(self.event, 1 / Mar / 2023, 1 / May / 2023, self.overrides))
+        self.assert_instances_equal(instances, INSTANCES_JSON)
+
+        instance = instances[2]
+        self.assertEqual(instance.summary, 'Weekly meeting')
+        self.assertEqual(instance.recurring_event_id, 'weekly')
+        self.assertTrue(instance.is_recurring_instance)
+        self.assertListEqual(instance.recurrence, [])
+        self.assertEqual(instance.attendees, self.event.attendees)
+        self.assertIsNot(instance.attendees, self.event.attendees)
+        self.assertEqual(instance.start.tzinfo, gettz(TEST_TIMEZONE))
+
+        # recurring event is not modified
+        self.assertEqual(self.event, EventSerializer.to_object(RECURRING_EVENT_JSON))
+
+        self.assertEqual(instances[1].summary, 'Weekly meeting (moved)')
+
+    def test_expand_event_window(self):
+        tz = gettz(TEST_TIMEZONE)
+        # instance overlapping the start of the window is included
+        instances = expand_event(self.event, datetime(2023, 3, 27, 10, 30, tzinfo=tz), 18 / Apr / 2023)
+        self.assertListEqual([i.id for i in instances],
+                             ['weekly_20230327T080000Z', 'weekly_20230403T080000Z', 'weekly_20230417T080000Z'])
+
+        # naive datetimes are in the timezone of the event
+        instances = expand_event(self.event, datetime(2023, 3, 27, 11), datetime(2023, 4, 17, 10))
+        self.assertListEqual([i.id for i in instances], ['weekly_20230403T080000Z'])
+
+        # instance moved into the window
+        instances = expand_event(self.event, datetime(2023, 3, 20, 13), datetime(2023, 3, 20, 16),
+                                 self.overrides)
+        self.assertListEqual([i.summary for i in instances], ['Weekly meeting (moved)'])
+
+        # instance moved out of the window
+        instances = expand_event(self.event, datetime(2023, 3, 20, 9), datetime(2023, 3, 20, 12), self.overrides)
+        self.assertListEqual(list(instances), [])
+
+    def test_expand_event_moved_from_outside(self):
+        override = EventSerializer.to_object({
+            **OVERRIDES_JSON[0],
+            'start': {'dateTime': '2023-03-28T14:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2023-03-28T15:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        })
+        instances = list(expand_event(self.event, 28 / Mar / 2023, 4 / Apr / 2023, [override]))
+        self.assertListEqual([i.id for i in instances], ['weekly_20230320T090000Z', 'weekly_20230403T080000Z'])
+
+    def test_expand_not_recurring(self):
+        event = Event('Single', start=(1 / Apr / 2023)[10:00], timezone=TEST_TIMEZONE)
+        self.assertListEqual(list(expand_event(event, 1 / Apr / 2023, 2 / Apr / 2023)), [event])
+        self.assertListEqual(list(expand_event(event, 2 / Apr / 2023, 3 / Apr / 2023)), [])
+
+    def test_expand_all_day(self):
+        event = Event(
+            'Holiday',
+            start=30 / Mar / 2023,
+            timezone=TEST_TIMEZONE,
+            event_id='holiday',
+            recurrence=[
+                Recurrence.rule(freq=DAILY, until=3 / Apr / 2023),
+                Recurrence.exclude_dates(1 / Apr / 2023)
+            ]
+        )
+        instances = list(expand_event(event, 1 / Mar / 2023, 1 / May / 2023))
+        self.assertListEqual([i.start for i in instances],
+                             [date(2023, 3, 30), date(2023, 3, 31), date(2023, 4, 2), date(2023, 4, 3)])
+        self.assertListEqual([i.end for i in instances],
+                             [date(2023, 3, 31), date(2023, 4, 1), date(2023, 4, 3), date(2023, 4, 4)])
+        self.assertEqual(instances[0].id, 'holiday_20230330')
+        self.assertDictEqual(instances[0].other['originalStartTime'], {'date': '2023-03-30'})
+
+    def test_expand_gcsa_recurrence(self):
+        start = (31 / Mar / 2023)[9:00]
+        event = Event(
+            'Stand-up',
+            start=start,
+            end=start + 1 * hours,
+            timezone=TEST_TIMEZONE,
+            event_id='standup',
+            recurrence=[
+                Recurrence.rule(freq=WEEKLY, by_week_day=[MO, FR], count=4),
+                Recurrence.exclude_times((3 / Apr / 2023)[9:00], timezone=TEST_TIMEZONE),
+                Recurrence.times((5 / Apr / 2023)[13:00], timezone='UTC'),
+                Recurrence.periods([((12 / Apr / 2023)[9:00], Duration(h=2))], timezone='UTC'),
+            ]
+        )
+        instances = list(expand_event(event, 1 / Mar / 2023, 1 / May / 2023))
+        self.assertListEqual([i.id for i in instances], [
+            'standup_20230331T070000Z',
+            'standup_20230405T130000Z',
+            'standup_20230407T070000Z',
+            'standup_20230410T070000Z',
+            'standup_20230412T090000Z',
+        ])
+        # duration of the event is used for all the instances
+        self.assertTrue(all(i.end - i.start == timedelta(hours=1) for i in instances))
+
+    def test_expand_monthly_rule_beyond_window(self):
+        event = Event(
+            'Monthly review',
+            start=(6 / Mar / 2023)[15:00],
+            timezone=TEST_TIMEZONE,
+            recurrence=Recurrence.rule(freq=MONTHLY, by_week_day=MO(1))
+        )
+        instances = list(expand_event(event, 1 / Apr / 2024, 1 / Jul / 2024))
+        self.assertListEqual([i.start.date() for i in instances],
+                             [date(2024, 4, 1), date(2024, 5, 6), date(2024, 6, 3)])
+
+    def test_expand_from_near_window(self):
+        # Iteration of the rules without COUNT starts near the window, but gives the same instances
+        # as the iteration from the start (including the days derived from the start)
+        tz = gettz(TEST_TIMEZONE)
+        cases = [
+            ((31 / Jan / 2020)[10:00], 'RRULE:FREQ=MONTHLY'),
+            ((29 / Feb / 2020)[10:00], 'RRULE:FREQ=YEARLY'),
+            ((6 / Jan / 2020)[10:00], 'RRULE:FREQ=WEEKLY;INTERVAL=3;BYDAY=MO,FR'),
+            ((6 / Jan / 2020)[10:00], 'RRULE:FREQ=MONTHLY;BYDAY=MO,TU;BYSETPOS=-1'),
+            ((6 / Jan / 2020)[10:00], 'RRULE:FREQ=HOURLY;INTERVAL=7'),
+        ]
+        window_min, window_max = (1 / Jan / 2026)[:].replace(tzinfo=tz), (1 / Apr / 2028)[:].replace(tzinfo=tz)
+        for start, rule in cases:
+            start = start.replace(tzinfo=tz)
+            event = Event('Event', start=start, timezone=TEST_TIMEZONE, recurrence=[rule])
+            instances = list(expand_event(event, window_min, window_max))
+            expected = rrulestr(rule, dtstart=start).between(window_min - timedelta(hours=1), window_max)
+            self.assertTrue(instances)
+            self.assertListEqual([i.start for i in instances], expected)
+
+        # COUNT is counted from the start
+        event = Event('Event', start=(6 / Jan / 2020)[10:00], timezone=TEST_TIMEZONE,
+                      recurrence=['RRULE:FREQ=DAILY;COUNT=3'])
+        self.assertListEqual(list(expand_event(event, window_min, window_max)), [])
+
+    def test_rule_set_cached(self):
+        start = datetime(2023, 3, 13, 10, tzinfo=gettz(TEST_TIMEZONE))
+        recurrence = tuple(RECURRING_EVENT_JSON['recurrence'])
+        window_min = datetime(2023, 4, 1, tzinfo=gettz(TEST_TIMEZONE))
+        self.assertIs(_get_rule_set(recurrence, start, TEST_TIMEZONE), _get_rule_set(recurrence, start, TEST_TIMEZONE))
+        self.assertIs(_get_rule_set(recurrence, start, TEST_TIMEZONE, window_min),
+                      _get_rule_set(recurrence, start, TEST_TIMEZONE, window_min))
+
+    def test_unsupported_line(self):
+        event = Event('Event', start=1 / Apr / 2023, recurrence='UNKNOWN:FREQ=DAILY')
+        with self.assertRaises(ValueError):
+            list(expand_event(event, 1 / Apr / 2023, 2 / Apr / 2023))
+
+
+class TestExpandEvents(TestCase):
+    def test_expand_events(self):
+        single = EventSerializer.to_object({
+            'id': 'single',
+            'start': {'dateTime': '2023-03-15T12:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2023-03-15T13:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+        })
+        orphan = EventSerializer.to_object({
+            'id': 'other_20230316T110000Z',
+            'start': {'dateTime': '2023-03-16T12:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2023-03-16T13:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+            'recurringEventId': 'other',
+            'originalStartTime': {'dateTime': '2023-03-16T12:00:00+01:00', 'timeZone': TEST_TIMEZONE}
+        })
+        # as listed by get_events without single_events
+        events = [
+            EventSerializer.to_object(RECURRING_EVENT_JSON),
+            single,
+            *(EventSerializer.to_object(o) for o in OVERRIDES_JSON),
+            orphan
+        ]
+        instances = list(expand_events(events, 1 / Mar / 2023, 1 / May / 2023))
+        self.assertListEqual(
+            [i.id for i in instances],
+            [i['id'] for i in INSTANCES_JSON] + ['single', 'other_20230316T110000Z']
+        )
+
+        instances = list(expand_events(events, 16 / Mar / 2023, 21 / Mar / 2023))
+        self.assertListEqual([i.id for i in instances], ['weekly_20230320T090000Z', 'other_20230316T110000Z'])
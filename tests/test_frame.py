@@ -0,0 +1,200 @@
+from collections import Counter
+from datetime import datetime, timezone
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from beautiful_date import Jan
+
+from gcsa.frame import EventFrame
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+TEST_TIMEZONE = 'UTC'
+
+
+def timestamp(*args):
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+class TestEventFrame(TestCase):
+    def setUp(self):
+        self.events_json = [
+            {
+                'id': 'event_1',
+                'summary': 'Meeting',
+                'status': 'confirmed',
+                'start': {'dateTime': '2023-01-02T10:00:00Z'},
+                'end': {'dateTime': '2023-01-02T11:00:00Z'},
+                'organizer': {'email': 'boss@gmail.com'},
+                'attendees': [{'email': 'a@gmail.com'}, {'email': 'b@gmail.com'}]
+            },
+            {
+                'id': 'event_2',
+                'summary': 'Lunch',
+                'status': 'tentative',
+                'start': {'dateTime': '2023-01-02T12:30:00+02:00'},
+                'end': {'dateTime': '2023-01-02T14:00:00+02:00'},
+                'organizer': {'email': 'me@gmail.com'}
+            },
+            {
+                'id': 'event_3',
+                'summary': 'Holiday',
+                'status': 'confirmed',
+                'start': {'date': '2023-01-01'},
+                'end': {'date': '2023-01-03'},
+                'organizer': {'email': 'boss@gmail.com'},
+                'attendees': [{'email': 'a@gmail.com'}]
+            },
+            {
+                # cancelled instance of the recurring event
+                'id': 'event_4_20230105',
+                'status': 'cancelled'
+            },
+            {
+                'id': 'event_5',
+                'start': {'dateTime': '2023-01-05T09:00:00Z'},
+                'end': {'dateTime': '2023-01-05T10:00:00Z'},
+            }
+        ]
+        self.frame = EventFrame.from_json(self.events_json, calendar_id='primary', timezone=TEST_TIMEZONE)
+
+    def test_from_json(self):
+        frame = self.frame
+        self.assertEqual(len(frame), 4)
+        self.assertListEqual(frame.id, ['event_1', 'event_2', 'event_3', 'event_5'])
+        self.assertListEqual(list(frame.start), [
+            timestamp(2023, 1, 2, 10), timestamp(2023, 1, 2, 10, 30), timestamp(2023, 1, 1), timestamp(2023, 1, 5, 9)
+        ])
+        self.assertListEqual(list(frame.end), [
+            timestamp(2023, 1, 2, 11), timestamp(2023, 1, 2, 12), timestamp(2023, 1, 3), timestamp(2023, 1, 5, 10)
+        ])
+        self.assertListEqual(list(frame.all_day), [False, False, True, False])
+        self.assertListEqual(list(frame.attendees), [2, 0, 1, 0])
+
+        # interned
+        self.assertListEqual(frame.organizer.values, ['boss@gmail.com', 'me@gmail.com'])
+        self.assertListEqual(list(frame.organizer.codes), [0, 1, 0, -1])
+        self.assertListEqual(frame.calendar.values, ['primary'])
+
+        self.assertDictEqual(frame.row(1), {
+            'id': 'event_2',
+            'summary': 'Lunch',
+            'start': timestamp(2023, 1, 2, 10, 30),
+            'end': timestamp(2023, 1, 2, 12),
+            'all_day': False,
+            'calendar': 'primary',
+            'organizer': 'me@gmail.com',
+            'status': 'tentative',
+            'attendees': 0
+        })
+        self.assertEqual(frame.row(3)['organizer'], None)
+
+    def test_from_json_timezone(self):
+        frame = EventFrame.from_json(self.events_json[2:3], timezone='Europe/Prague')
+        self.assertEqual(frame.start[0], timestamp(2022, 12, 31, 23))
+
+    def test_extend(self):
+        frame = EventFrame(timezone=TEST_TIMEZONE)
+        frame.extend(self.events_json[:2], calendar_id='primary')
+        frame.extend(self.events_json[2:], calendar_id='work')
+        self.assertEqual(len(frame), 4)
+        self.assertListEqual(frame.calendar.decode(), ['primary', 'primary', 'work', 'work'])
+
+    def test_filter(self):
+        frame = self.frame
+        self.assertListEqual(frame.filter(status='confirmed').id, ['event_1', 'event_3'])
+        self.assertListEqual(frame.filter(organizer='boss@gmail.com', min_attendees=2).id, ['event_1'])
+        self.assertListEqual(frame.filter(max_attendees=0).id, ['event_2', 'event_5'])
+        self.assertListEqual(frame.filter(all_day=True).id, ['event_3'])
+        self.assertListEqual(frame.filter(calendar_id='primary').id, frame.id)
+        self.assertEqual(len(frame.filter(calendar_id='unknown')), 0)
+        self.assertEqual(len(frame.filter(organizer='unknown@gmail.com')), 0)
+
+        self.assertListEqual(frame.filter(time_min=(3 / Jan / 2023)).id, ['event_5'])
+        self.assertListEqual(frame.filter(time_max=datetime(2023, 1, 2, 10, 30)).id, ['event_1', 'event_3'])
+        self.assertListEqual(frame.filter(time_min=timestamp(2023, 1, 2, 11)).id, ['event_2', 'event_3', 'event_5'])
+
+    def test_filter_without_numpy(self):
+        with patch('gcsa.frame.np', None):
+            self.test_filter()
+            self.assertListEqual(self.frame.filter().id, self.frame.id)
+            self.assertEqual(len(EventFrame().filter(status='confirmed')), 0)
+
+    def test_overlapping(self):
+        frame = self.frame.overlapping((2 / Jan / 2023)[10:30], (2 / Jan / 2023)[11:00])
+        self.assertListEqual(frame.id, ['event_1', 'event_2', 'event_3'])
+
+    def test_overlaps(self):
+        pairs = {(self.frame.id[i], self.frame.id[j]) for i, j in self.frame.overlaps()}
+        self.assertSetEqual(pairs, {
+            ('event_3', 'event_1'),
+            ('event_3', 'event_2'),
+            ('event_1', 'event_2'),
+        })
+
+        # touching events don't overlap
+        frame = EventFrame.from_json([
+            {'id': '1', 'start': {'dateTime': '2023-01-02T10:00:00Z'}, 'end': {'dateTime': '2023-01-02T11:00:00Z'}},
+            {'id': '2', 'start': {'dateTime': '2023-01-02T11:00:00Z'}, 'end': {'dateTime': '2023-01-02T12:00:00Z'}},
+        ])
+        self.assertListEqual(frame.overlaps(), [])
+
+    def test_sort(self):
+        self.assertListEqual(self.frame.sort().id, ['event_3', 'event_1', 'event_2', 'event_5'])
+        self.assertListEqual(self.frame.sort('end', reverse=True).id, ['event_5', 'event_3', 'event_2', 'event_1'])
+        self.assertListEqual(self.frame.sort('summary').id, ['event_3', 'event_2', 'event_1', 'event_5'])
+        self.assertListEqual(self.frame.sort('organizer').id, ['event_1', 'event_3', 'event_2', 'event_5'])
+        with self.assertRaises(ValueError):
+            self.frame.sort('unknown')
+
+    def test_count_by(self):
+        self.assertEqual(self.frame.count_by('organizer'),
+                         Counter({'boss@gmail.com': 2, 'me@gmail.com': 1, None: 1}))
+        self.assertEqual(self.frame.count_by('attendees'), Counter({0: 2, 2: 1, 1: 1}))
+
+    def test_duration(self):
+        self.assertEqual(self.frame.duration(), 3600 + 5400 + 2 * 24 * 3600 + 3600)
+        self.assertEqual(self.frame.filter(all_day=False).duration(), 3600 + 5400 + 3600)
+
+    def test_to_dict(self):
+        columns = self.frame.to_dict()
+        self.assertListEqual(list(columns), list(EventFrame.COLUMNS))
+        self.assertListEqual(columns['organizer'], ['boss@gmail.com', 'me@gmail.com', 'boss@gmail.com', None])
+        self.assertListEqual(columns['attendees'], [2, 0, 1, 0])
+
+    def test_repr_str(self):
+        self.assertEqual(repr(self.frame), '<EventFrame 4 events>')
+        self.assertEqual(str(self.frame), '4 events')
+
+    @skipUnless(numpy, 'numpy is not installed')
+    def test_to_numpy(self):
+        columns = self.frame.to_numpy()
+        self.assertListEqual(columns['start'].tolist(), list(self.frame.start))
+        self.assertListEqual(columns['organizer'].tolist(), ['boss@gmail.com', 'me@gmail.com', 'boss@gmail.com', None])
+        self.assertListEqual(columns['all_day'].tolist(), [False, False, True, False])
+
+    @skipUnless(pandas, 'pandas is not installed')
+    def test_to_pandas(self):
+        df = self.frame.to_pandas()
+        self.assertListEqual(df['id'].tolist(), self.frame.id)
+        self.assertEqual(df['start'][0], pandas.Timestamp('2023-01-02T10:00:00Z'))
+        self.assertEqual(df['organizer'].value_counts()['boss@gmail.com'], 2)
+
+    @skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_to_arrow(self):
+        table = self.frame.to_arrow()
+        self.assertEqual(table.num_rows, 4)
+        self.assertListEqual(table.column('id').to_pylist(), self.frame.id)
@@ -1,10 +1,21 @@
+from datetime import datetime, date, timedelta
 from unittest import TestCase
+from unittest.mock import patch
 
-from beautiful_date import Mar
+from beautiful_date import Mar, hours
+from dateutil.tz import tzutc
 
-from gcsa.free_busy import FreeBusy, TimeRange
+from gcsa.attendee import Attendee, ResponseStatus
+from gcsa.event import Event, Transparency
+from gcsa.free_busy import FreeBusy, TimeRange, BusyIndex
 from gcsa.serializers.free_busy_serializer import FreeBusySerializer
 
+TEST_TIMEZONE = 'UTC'
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=tzutc())
+
 
 class TestFreeBusy(TestCase):
     def test_iter(self):
@@ -94,6 +105,258 @@ class TestFreeBusy(TestCase):
         self.assertEqual(free_busy.__str__(), "<FreeBusy 2023-03-24 13:22:00 - 2023-03-25 13:22:00>")
 
 
+class TestFreeBusyIntervals(TestCase):
+    def setUp(self):
+        def r(start, end):
+            return TimeRange(utc(2023, 3, 24, *start), utc(2023, 3, 24, *end))
+
+        self.free_busy = FreeBusy(
+            time_min=utc(2023, 3, 24, 8),
+            time_max=utc(2023, 3, 24, 18),
+            groups={},
+            calendars={
+                'room1': [r((9,), (10,)), r((9, 30), (11,)), r((14,), (15,))],
+                'room2': [r((10, 30), (12,)), r((15,), (16,))],
+                'room3': [r((8,), (9, 45)), r((10, 45), (11,)), r((17,), (18,))],
+            }
+        )
+
+    def test_union(self):
+        self.assertListEqual(self.free_busy.union(['room1']), [
+            TimeRange(utc(2023, 3, 24, 9), utc(2023, 3, 24, 11)),
+            TimeRange(utc(2023, 3, 24, 14), utc(2023, 3, 24, 15)),
+        ])
+        self.assertListEqual(self.free_busy.union(), [
+            TimeRange(utc(2023, 3, 24, 8), utc(2023, 3, 24, 12)),
+            TimeRange(utc(2023, 3, 24, 14), utc(2023, 3, 24, 16)),
+            TimeRange(utc(2023, 3, 24, 17), utc(2023, 3, 24, 18)),
+        ])
+        self.assertListEqual(self.free_busy.union(['unknown']), [])
+        self.assertListEqual(self.free_busy.union([]), [])
+
+    def test_intersection(self):
+        # 14:00-15:00 and 15:00-16:00 only touch
+        self.assertListEqual(self.free_busy.intersection(['room1', 'room2']), [
+            TimeRange(utc(2023, 3, 24, 10, 30), utc(2023, 3, 24, 11)),
+        ])
+        self.assertListEqual(self.free_busy.intersection(), [
+            TimeRange(utc(2023, 3, 24, 10, 45), utc(2023, 3, 24, 11)),
+        ])
+        self.assertListEqual(self.free_busy.intersection(['room1', 'room3']), [
+            TimeRange(utc(2023, 3, 24, 9), utc(2023, 3, 24, 9, 45)),
+            TimeRange(utc(2023, 3, 24, 10, 45), utc(2023, 3, 24, 11)),
+        ])
+        self.assertListEqual(self.free_busy.intersection(['room1', 'unknown']), [])
+        self.assertListEqual(self.free_busy.intersection([]), [])
+
+    def test_free_within(self):
+        self.assertListEqual(self.free_busy.free_within(), [
+            TimeRange(utc(2023, 3, 24, 12), utc(2023, 3, 24, 14)),
+            TimeRange(utc(2023, 3, 24, 16), utc(2023, 3, 24, 17)),
+        ])
+        self.assertListEqual(self.free_busy.free_within(min_duration=timedelta(hours=2)), [
+            TimeRange(utc(2023, 3, 24, 12), utc(2023, 3, 24, 14)),
+        ])
+        self.assertListEqual(self.free_busy.free_within(utc(2023, 3, 24, 13), utc(2023, 3, 24, 20), ['room1']), [
+            TimeRange(utc(2023, 3, 24, 13), utc(2023, 3, 24, 14)),
+            TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 20)),
+        ])
+        self.assertListEqual(self.free_busy.free_within(calendar_ids=[]), [
+            TimeRange(utc(2023, 3, 24, 8), utc(2023, 3, 24, 18)),
+        ])
+
+    def test_occupancy_ratio(self):
+        ratios = self.free_busy.occupancy_ratio('1h', ['room1'])
+        self.assertEqual(len(ratios), 10)
+        self.assertEqual(ratios[utc(2023, 3, 24, 8)], 0)
+        self.assertEqual(ratios[utc(2023, 3, 24, 9)], 1)
+        self.assertEqual(ratios[utc(2023, 3, 24, 14)], 1)
+
+        ratios = self.free_busy.occupancy_ratio('2h')
+        self.assertListEqual(list(ratios), [utc(2023, 3, 24, h) for h in range(8, 18, 2)])
+        expected = [(1 + 0 + 1.75) / 6, (1 + 1.5 + 0.25) / 6, 0, (1 + 1) / 6, (0 + 0 + 1) / 6]
+        for ratio, expected_ratio in zip(ratios.values(), expected):
+            self.assertAlmostEqual(ratio, expected_ratio)
+
+        # empty calendar is counted in, last bucket is shorter
+        ratios = self.free_busy.occupancy_ratio(timedelta(hours=4), ['room2', 'empty'])
+        for ratio, expected_ratio in zip(ratios.values(), [1.5 / 8, 1 / 8, 0]):
+            self.assertAlmostEqual(ratio, expected_ratio)
+        self.assertEqual(len(ratios), 3)
+
+        self.assertEqual(self.free_busy.occupancy_ratio('1d', []), {utc(2023, 3, 24, 8): 0.0})
+        self.assertEqual(len(self.free_busy.occupancy_ratio('15m')), 40)
+        with self.assertRaises(ValueError):
+            self.free_busy.occupancy_ratio('hourly')
+        with self.assertRaises(ValueError):
+            self.free_busy.occupancy_ratio(timedelta(0))
+
+    def test_naive(self):
+        free_busy = FreeBusy(
+            time_min=(24 / Mar / 2023)[8:00],
+            time_max=(24 / Mar / 2023)[18:00],
+            groups={},
+            calendars={'room': [TimeRange((24 / Mar / 2023)[9:00], (24 / Mar / 2023)[10:00])]}
+        )
+        self.assertListEqual(free_busy.free_within(), [
+            TimeRange((24 / Mar / 2023)[8:00], (24 / Mar / 2023)[9:00]),
+            TimeRange((24 / Mar / 2023)[10:00], (24 / Mar / 2023)[18:00]),
+        ])
+
+
+class TestFreeBusyIntervalsWithoutNumpy(TestFreeBusyIntervals):
+    def setUp(self):
+        super().setUp()
+        numpy_patcher = patch('gcsa.free_busy.np', None)
+        numpy_patcher.start()
+        self.addCleanup(numpy_patcher.stop)
+
+
+class TestBusyIndex(TestCase):
+    def setUp(self):
+        self.events_json = [
+            {'id': '1', 'start': {'dateTime': '2023-03-24T10:00:00Z'}, 'end': {'dateTime': '2023-03-24T11:00:00Z'}},
+            # overlapping
+            {'id': '2', 'start': {'dateTime': '2023-03-24T10:30:00Z'}, 'end': {'dateTime': '2023-03-24T12:00:00Z'}},
+            # touching
+            {'id': '3', 'start': {'dateTime': '2023-03-24T12:00:00Z'}, 'end': {'dateTime': '2023-03-24T12:30:00Z'}},
+            {'id': '4', 'start': {'dateTime': '2023-03-24T16:00:00+01:00'},
+             'end': {'dateTime': '2023-03-24T17:00:00+01:00'}},
+            {'id': '5', 'start': {'date': '2023-03-26'}, 'end': {'date': '2023-03-27'}},
+            # not busy
+            {'id': '6', 'status': 'cancelled'},
+            {'id': '7', 'start': {'dateTime': '2023-03-24T18:00:00Z'}, 'end': {'dateTime': '2023-03-24T19:00:00Z'},
+             'transparency': 'transparent'},
+            {'id': '8', 'start': {'dateTime': '2023-03-24T20:00:00Z'}, 'end': {'dateTime': '2023-03-24T21:00:00Z'},
+             'attendees': [{'self': True, 'responseStatus': 'declined'}]},
+        ]
+        self.index = BusyIndex.from_events(self.events_json, 'calendar1', timezone=TEST_TIMEZONE)
+        self.index.extend([
+            Event('Meeting', start=(24 / Mar / 2023)[11:00], end=(24 / Mar / 2023)[13:00], timezone=TEST_TIMEZONE),
+            Event('Lunch', start=(24 / Mar / 2023)[14:00], end=(24 / Mar / 2023)[15:00],
+                  transparency=Transparency.TRANSPARENT),
+            Event('Declined', start=(24 / Mar / 2023)[16:00], end=(24 / Mar / 2023)[17:00],
+                  attendees=[Attendee('me@gmail.com', _is_self=True, _response_status=ResponseStatus.DECLINED)]),
+        ], 'calendar2')
+
+    def test_busy_ranges(self):
+        self.assertListEqual(self.index.busy_ranges('calendar1'), [
+            TimeRange(utc(2023, 3, 24, 10), utc(2023, 3, 24, 12, 30)),
+            TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 16)),
+            TimeRange(utc(2023, 3, 26), utc(2023, 3, 27)),
+        ])
+        self.assertListEqual(self.index.busy_ranges('calendar2'), [
+            TimeRange(utc(2023, 3, 24, 11), utc(2023, 3, 24, 13)),
+        ])
+        self.assertListEqual(self.index.busy_ranges('calendar1', utc(2023, 3, 24, 11), 25 / Mar / 2023), [
+            TimeRange(utc(2023, 3, 24, 11), utc(2023, 3, 24, 12, 30)),
+            TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 16)),
+        ])
+        self.assertListEqual(self.index.busy_ranges('unknown'), [])
+
+    def test_busy_ranges_merged(self):
+        self.assertListEqual(self.index.busy_ranges(time_max=25 / Mar / 2023), [
+            TimeRange(utc(2023, 3, 24, 10), utc(2023, 3, 24, 13)),
+            TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 16)),
+        ])
+        self.assertListEqual(self.index.busy_ranges(['calendar1', 'calendar2'], utc(2023, 3, 24, 12, 45)), [
+            TimeRange(utc(2023, 3, 24, 12, 45), utc(2023, 3, 24, 13)),
+            TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 16)),
+            TimeRange(utc(2023, 3, 26), utc(2023, 3, 27)),
+        ])
+
+    def test_is_busy(self):
+        self.assertTrue(self.index.is_busy('calendar1', (24 / Mar / 2023)[10:00]))
+        self.assertTrue(self.index.is_busy('calendar1', (24 / Mar / 2023)[12:29]))
+        self.assertFalse(self.index.is_busy('calendar1', (24 / Mar / 2023)[12:30]))
+        self.assertFalse(self.index.is_busy('calendar1', (24 / Mar / 2023)[9:59]))
+        self.assertFalse(self.index.is_busy('calendar1', (24 / Mar / 2023)[18:30]))
+        self.assertFalse(self.index.is_busy('calendar1', (24 / Mar / 2023)[20:30]))
+        self.assertTrue(self.index.is_busy('calendar1', 26 / Mar / 2023))
+        self.assertTrue(self.index.is_busy('calendar1', int(utc(2023, 3, 24, 15, 30).timestamp())))
+        self.assertFalse(self.index.is_busy('calendar2', (24 / Mar / 2023)[14:30]))
+        self.assertFalse(self.index.is_busy('calendar2', (24 / Mar / 2023)[16:30]))
+        self.assertFalse(self.index.is_busy('unknown', (24 / Mar / 2023)[10:00]))
+
+        self.assertListEqual(self.index.busy_calendars((24 / Mar / 2023)[11:30]), ['calendar1', 'calendar2'])
+        self.assertListEqual(self.index.busy_calendars((24 / Mar / 2023)[12:45]), ['calendar2'])
+        self.assertListEqual(self.index.busy_calendars((24 / Mar / 2023)[13:00]), [])
+
+    def test_busy_time(self):
+        self.assertEqual(self.index.busy_seconds('calendar1', 24 / Mar / 2023, 25 / Mar / 2023), 3.5 * 3600)
+        self.assertEqual(self.index.busy_seconds('calendar1', (24 / Mar / 2023)[11:00], (24 / Mar / 2023)[15:30]),
+                         2 * 3600)
+        self.assertEqual(self.index.busy_seconds('calendar1', (24 / Mar / 2023)[10:15], (24 / Mar / 2023)[10:45]),
+                         1800)
+        self.assertEqual(self.index.busy_seconds('calendar1', (24 / Mar / 2023)[13:00], (24 / Mar / 2023)[14:00]), 0)
+        self.assertEqual(self.index.busy_seconds('unknown', 24 / Mar / 2023, 25 / Mar / 2023), 0)
+
+        self.assertDictEqual(self.index.busy_minutes_per_day('calendar1', 23 / Mar / 2023, 27 / Mar / 2023), {
+            date(2023, 3, 23): 0,
+            date(2023, 3, 24): 210,
+            date(2023, 3, 25): 0,
+            date(2023, 3, 26): 24 * 60,
+        })
+
+    def test_busy_minutes_per_day_timezone(self):
+        index = BusyIndex(timezone='Europe/Prague')
+        index.add_busy('calendar', [((25 / Mar / 2023)[23:00], (26 / Mar / 2023)[4:00])])
+        # Clocks are moved forward at 2:00 on the 26th of March
+        self.assertDictEqual(index.busy_minutes_per_day('calendar', 25 / Mar / 2023, 27 / Mar / 2023), {
+            date(2023, 3, 25): 60,
+            date(2023, 3, 26): 3 * 60,
+        })
+
+    def test_to_free_busy(self):
+        free_busy = self.index.to_free_busy(24 / Mar / 2023, 25 / Mar / 2023, ['calendar1', 'calendar2', 'unknown'])
+        self.assertEqual(free_busy.time_min, utc(2023, 3, 24))
+        self.assertEqual(free_busy.time_max, utc(2023, 3, 25))
+        self.assertDictEqual(free_busy.calendars, {
+            'calendar1': [
+                TimeRange(utc(2023, 3, 24, 10), utc(2023, 3, 24, 12, 30)),
+                TimeRange(utc(2023, 3, 24, 15), utc(2023, 3, 24, 16)),
+            ],
+            'calendar2': [
+                TimeRange(utc(2023, 3, 24, 11), utc(2023, 3, 24, 13)),
+            ]
+        })
+        self.assertDictEqual(free_busy.calendars_errors, {'unknown': [{'domain': 'global', 'reason': 'notFound'}]})
+
+        # Same as from the API
+        free_busy_json = {
+            'timeMin': '2023-03-24T00:00:00.000Z',
+            'timeMax': '2023-03-25T00:00:00.000Z',
+            'calendars': {
+                'calendar2': {'busy': [{'start': '2023-03-24T11:00:00Z', 'end': '2023-03-24T13:00:00Z'}]}
+            }
+        }
+        api_free_busy = FreeBusySerializer.to_object(free_busy_json)
+        free_busy = self.index.to_free_busy(24 / Mar / 2023, 25 / Mar / 2023, ['calendar2'])
+        self.assertEqual(free_busy.time_min, api_free_busy.time_min)
+        self.assertEqual(free_busy.time_max, api_free_busy.time_max)
+        self.assertDictEqual(free_busy.calendars, api_free_busy.calendars)
+        self.assertListEqual(list(free_busy), list(api_free_busy))
+
+    def test_from_free_busy(self):
+        free_busy = self.index.to_free_busy(24 / Mar / 2023, 25 / Mar / 2023)
+        index = BusyIndex.from_free_busy(free_busy, timezone=TEST_TIMEZONE)
+        self.assertListEqual(index.calendar_ids, ['calendar1', 'calendar2'])
+        self.assertListEqual(index.busy_ranges('calendar1'), free_busy.calendars['calendar1'])
+        self.assertIn('calendar2', index)
+        self.assertEqual(len(index), 2)
+
+    def test_add_busy(self):
+        index = BusyIndex(timezone=TEST_TIMEZONE)
+        start = (24 / Mar / 2023)[10:00]
+        index.add_busy('calendar', [(start, start + 1 * hours)])
+        index.add_busy('calendar', [(start + 2 * hours, start + 3 * hours), (start + 1 * hours, start + 2 * hours)])
+        self.assertListEqual(index.busy_ranges('calendar'), [TimeRange(utc(2023, 3, 24, 10), utc(2023, 3, 24, 13))])
+
+    def test_repr_str(self):
+        self.assertEqual(repr(self.index), '<BusyIndex 2 calendars>')
+        self.assertEqual(str(self.index), '<BusyIndex 2 calendars>')
+
+
 class TestFreeBusySerializer(TestCase):
     def test_to_json(self):
         free_busy = FreeBusy(
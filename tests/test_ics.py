@@ -0,0 +1,483 @@
+import mmap
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta
+from io import BytesIO, StringIO
+from unittest import TestCase
+
+from beautiful_date import Mar
+from dateutil.tz import gettz
+
+from gcsa.attendee import Attendee, ResponseStatus
+from gcsa.event import Event, Visibility
+from gcsa.ics import write_ics, read_ics
+from gcsa.person import Person
+from gcsa.reminders import PopupReminder, EmailReminder
+from gcsa.recurrence import Recurrence
+from gcsa.serializers.event_serializer import EventSerializer
+
+TEST_TIMEZONE = 'Europe/Prague'
+
+
+def unfold(content):
+    return content.replace('\r\n ', '').split('\r\n')
+
+
+def get_component(lines, name, index=0):
+    """Returns lines of the `index`-th component `name` without BEGIN and END lines."""
+    starts = [i for i, line in enumerate(lines) if line == 'BEGIN:' + name]
+    start = starts[index]
+    return lines[start + 1:lines.index('END:' + name, start)]
+
+
+class TestWriteIcs(TestCase):
+    def write(self, events, **kwargs):
+        file = StringIO()
+        count = write_ics(events, file, **kwargs)
+        self.content = file.getvalue()
+        return count, unfold(self.content)
+
+    def test_calendar(self):
+        count, lines = self.write([], calendar_name='Work, personal')
+        self.assertEqual(count, 0)
+        self.assertListEqual(lines, [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//gcsa//Google Calendar Simple API//EN',
+            'CALSCALE:GREGORIAN',
+            'X-WR-CALNAME:Work\\, personal',
+            'END:VCALENDAR',
+            ''
+        ])
+
+    def test_event(self):
+        event = EventSerializer.to_object({
+            'id': 'event_id',
+            'iCalUID': 'event_id@google.com',
+            'summary': 'Meeting; planning, budget',
+            'description': 'Agenda:\n1. Budget\\costs',
+            'location': 'Room 1',
+            'status': 'confirmed',
+            'transparency': 'transparent',
+            'visibility': 'private',
+            'sequence': 2,
+            'created': '2023-01-01T10:00:00.000Z',
+            'updated': '2023-01-02T10:00:00.000Z',
+            'start': {'dateTime': '2023-03-20T10:00:00+01:00', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2023-03-20T11:30:00+01:00', 'timeZone': TEST_TIMEZONE},
+            'organizer': {'email': 'boss@gmail.com', 'displayName': 'The Boss'},
+            'attendees': [
+                {'email': 'a@gmail.com', 'displayName': 'Doe, John', 'responseStatus': 'accepted'},
+                {'email': 'b@gmail.com', 'optional': True, 'responseStatus': 'needsAction', 'additionalGuests': 2},
+                {'email': 'room@resource.calendar.google.com', 'resource': True},
+            ],
+            'attachments': [{'fileUrl': 'https://drive.google.com/file', 'mimeType': 'application/pdf'}],
+            'reminders': {'useDefault': False, 'overrides': [{'method': 'popup', 'minutes': 10}]}
+        })
+        count, lines = self.write([event])
+        self.assertEqual(count, 1)
+        self.assertListEqual(get_component(lines, 'VEVENT'), [
+            'UID:event_id@google.com',
+            'DTSTAMP:20230102T100000Z',
+            'DTSTART;TZID=Europe/Prague:20230320T100000',
+            'DTEND;TZID=Europe/Prague:20230320T113000',
+            'SUMMARY:Meeting\\; planning\\, budget',
+            'DESCRIPTION:Agenda:\\n1. Budget\\\\costs',
+            'LOCATION:Room 1',
+            'STATUS:CONFIRMED',
+            'TRANSP:TRANSPARENT',
+            'CLASS:PRIVATE',
+            'SEQUENCE:2',
+            'CREATED:20230101T100000Z',
+            'LAST-MODIFIED:20230102T100000Z',
+            'ORGANIZER;CN=The Boss:mailto:boss@gmail.com',
+            'ATTENDEE;CN="Doe, John";ROLE=REQ-PARTICIPANT;PARTSTAT=ACCEPTED:mailto:a@gmail.com',
+            'ATTENDEE;ROLE=OPT-PARTICIPANT;PARTSTAT=NEEDS-ACTION;X-NUM-GUESTS=2:mailto:b@gmail.com',
+            'ATTENDEE;CUTYPE=RESOURCE;ROLE=REQ-PARTICIPANT:mailto:room@resource.calendar.google.com',
+            'ATTACH;FMTTYPE=application/pdf:https://drive.google.com/file',
+            'BEGIN:VALARM',
+            'ACTION:DISPLAY',
+            'TRIGGER:-PT10M',
+            'DESCRIPTION:Meeting\\; planning\\, budget',
+            'END:VALARM',
+        ])
+
+    def test_dates(self):
+        events = [
+            Event('All day', start=20 / Mar / 2023, timezone=TEST_TIMEZONE, event_id='all_day'),
+            Event('UTC', start=(20 / Mar / 2023)[10:00], timezone='UTC', event_id='utc'),
+            Event('Other', start=datetime(2023, 3, 20, 10, tzinfo=gettz('America/New_York')),
+                  timezone=TEST_TIMEZONE, event_id='other'),
+        ]
+        _, lines = self.write(events)
+        self.assertIn('DTSTART;VALUE=DATE:20230320', get_component(lines, 'VEVENT', 0))
+        self.assertIn('DTEND;VALUE=DATE:20230321', get_component(lines, 'VEVENT', 0))
+        self.assertIn('DTSTART:20230320T100000Z', get_component(lines, 'VEVENT', 1))
+        # converted to the timezone of the event
+        self.assertIn('DTSTART;TZID=Europe/Prague:20230320T150000', get_component(lines, 'VEVENT', 2))
+        self.assertEqual(lines.count('BEGIN:VTIMEZONE'), 1)
+
+    def test_no_start(self):
+        event = EventSerializer.to_object({'id': 'no_start', 'summary': 'Partial'})
+        self.assertIsNone(event.start)
+        with self.assertRaisesRegex(ValueError, '"no_start"'):
+            self.write([event])
+
+    def test_recurrence(self):
+        event = Event(
+            'Weekly',
+            start=(20 / Mar / 2023)[10:00],
+            timezone=TEST_TIMEZONE,
+            event_id='weekly',
+            recurrence=['RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=10', 'EXDATE;TZID=America/New_York:20230327T050000']
+        )
+        instance = EventSerializer.to_object({
+            'id': 'weekly_20230403T080000Z',
+            'recurringEventId': 'weekly',
+            'iCalUID': 'weekly@google.com',
+            'summary': 'Weekly (moved)',
+            'originalStartTime': {'dateTime': '2023-04-03T10:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+            'start': {'dateTime': '2023-04-04T10:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+            'end': {'dateTime': '2023-04-04T11:00:00+02:00', 'timeZone': TEST_TIMEZONE},
+        })
+        _, lines = self.write([event, instance])
+
+        vevent = get_component(lines, 'VEVENT', 0)
+        self.assertIn('RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=10', vevent)
+        self.assertIn('EXDATE;TZID=America/New_York:20230327T050000', vevent)
+
+        vevent = get_component(lines, 'VEVENT', 1)
+        self.assertIn('UID:weekly@google.com', vevent)
+        self.assertIn('RECURRENCE-ID;TZID=Europe/Prague:20230403T100000', vevent)
+        self.assertIn('DTSTART;TZID=Europe/Prague:20230404T100000', vevent)
+
+        self.assertListEqual(get_component(lines, 'VTIMEZONE', 0), [
+            'TZID:Europe/Prague',
+            'BEGIN:DAYLIGHT',
+            'DTSTART:19700329T020000',
+            'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU',
+            'TZOFFSETFROM:+0100',
+            'TZOFFSETTO:+0200',
+            'TZNAME:CEST',
+            'END:DAYLIGHT',
+            'BEGIN:STANDARD',
+            'DTSTART:19701025T030000',
+            'RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU',
+            'TZOFFSETFROM:+0200',
+            'TZOFFSETTO:+0100',
+            'TZNAME:CET',
+            'END:STANDARD',
+        ])
+        self.assertListEqual(get_component(lines, 'VTIMEZONE', 1)[:4], [
+            'TZID:America/New_York',
+            'BEGIN:DAYLIGHT',
+            'DTSTART:19700308T020000',
+            'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU',
+        ])
+
+    def test_timezone_without_dst(self):
+        event = Event('Meeting', start=(20 / Mar / 2023)[10:00], timezone='Asia/Tokyo', event_id='tokyo')
+        _, lines = self.write([event])
+        self.assertListEqual(get_component(lines, 'VTIMEZONE'), [
+            'TZID:Asia/Tokyo',
+            'BEGIN:STANDARD',
+            'DTSTART:19700101T000000',
+            'TZOFFSETFROM:+0900',
+            'TZOFFSETTO:+0900',
+            'TZNAME:JST',
+            'END:STANDARD',
+        ])
+
+    def test_reminders(self):
+        event = Event(
+            'Meeting',
+            start=(20 / Mar / 2023)[10:00],
+            timezone=TEST_TIMEZONE,
+            event_id='meeting',
+            reminders=[EmailReminder(days_before=1, at=time(9)), PopupReminder(-5)],
+            _organizer=Person('boss@gmail.com')
+        )
+        _, lines = self.write([event])
+        self.assertListEqual(get_component(lines, 'VALARM', 0), [
+            'ACTION:EMAIL',
+            'TRIGGER:-PT1500M',
+            'DESCRIPTION:Meeting',
+            'SUMMARY:Alarm notification',
+            'ATTENDEE:mailto:boss@gmail.com',
+        ])
+        self.assertIn('TRIGGER:PT5M', get_component(lines, 'VALARM', 1))
+
+        # default reminders are not exported
+        event.reminders = []
+        event.default_reminders = True
+        _, lines = self.write([event])
+        self.assertNotIn('BEGIN:VALARM', lines)
+
+    def test_uid(self):
+        event = Event('Meeting', start=(20 / Mar / 2023)[10:00], timezone=TEST_TIMEZONE)
+        _, lines = self.write([event])
+        uid = next(line for line in lines if line.startswith('UID:'))
+        self.assertRegex(uid, '^UID:[0-9a-v]{32}@gcsa$')
+        # deterministic
+        self.assertIn(uid, self.write([event])[1])
+
+        event.event_id = 'event_id'
+        self.assertIn('UID:event_id@google.com', self.write([event])[1])
+
+    def test_folding(self):
+        summary = 'Long summary ' * 10 + 'with multi-byte characters: ' + '€' * 30
+        attendee = Attendee('a@gmail.com', display_name='A' * 80, _response_status=ResponseStatus.TENTATIVE)
+        event = Event(summary, start=(20 / Mar / 2023)[10:00], timezone=TEST_TIMEZONE, event_id='long',
+                      visibility=Visibility.PUBLIC, attendees=[attendee])
+        _, lines = self.write([event])
+        self.assertIn('SUMMARY:' + summary, lines)
+        self.assertIn('CLASS:PUBLIC', lines)
+        self.assertIn('ATTENDEE;CN=' + 'A' * 80 + ';ROLE=REQ-PARTICIPANT;PARTSTAT=TENTATIVE:mailto:a@gmail.com', lines)
+
+        raw_lines = self.content.split('\r\n')
+        self.assertTrue(all(len(line.encode('utf-8')) <= 75 for line in raw_lines))
+        self.assertGreater(len(raw_lines), len(lines))
+
+    def test_streaming(self):
+        written = []
+
+        class File:
+            def write(self, s):
+                written.append(s)
+
+        def events():
+            for i in range(3):
+                yield Event(f'Event {i}', start=(20 / Mar / 2023)[10 + i:00], timezone='UTC', event_id=f'e{i}')
+                # event is written before the next one is requested
+                self.assertEqual(sum(s.count('BEGIN:VEVENT') for s in written), i + 1)
+
+        self.assertEqual(write_ics(events(), File()), 3)
+
+
+OUTLOOK_CALENDAR = """BEGIN:VCALENDAR\r
+PRODID:-//Microsoft Corporation//Outlook 16.0 MIMEDIR//EN\r
+VERSION:2.0\r
+BEGIN:VTIMEZONE\r
+TZID:Custom Zone\r
+BEGIN:STANDARD\r
+DTSTART:16010101T000000\r
+TZOFFSETFROM:+0530\r
+TZOFFSETTO:+0530\r
+END:STANDARD\r
+END:VTIMEZONE\r
+BEGIN:VEVENT\r
+UID:040000008200E00074C5B7101A82E008\r
+DTSTART;TZID=Pacific Standard Time:20230320T100000\r
+DTEND;TZID=Pacific Standard Time:20230320T110000\r
+RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=5\r
+EXDATE;TZID=Pacific Standard Time:20230327T100000\r
+SUMMARY:Planning\\, Q2 review and a long summary that is folded over multiple lines \r
+ by Outlook €\r
+DESCRIPTION:Agenda:\\n1. Budget\\;\\ncosts\r
+LOCATION:Room 1\r
+CLASS:PRIVATE\r
+TRANSP:OPAQUE\r
+STATUS:CONFIRMED\r
+SEQUENCE:3\r
+CREATED:20230101T100000Z\r
+LAST-MODIFIED:20230102T100000Z\r
+ORGANIZER;CN="Boss: The Big":mailto:boss@example.com\r
+ATTENDEE;CN=John Doe;ROLE=REQ-PARTICIPANT;PARTSTAT=ACCEPTED;RSVP=TRUE:MAILTO:john@example.com\r
+ATTENDEE;ROLE=OPT-PARTICIPANT;PARTSTAT=TENTATIVE;X-NUM-GUESTS=1:mailto:jane@example.com\r
+ATTENDEE;CUTYPE=ROOM:mailto:room@example.com\r
+ATTACH;FMTTYPE=application/pdf;X-FILENAME=agenda.pdf:https://example.com/agenda.pdf\r
+ATTACH;ENCODING=BASE64;VALUE=BINARY:SGVsbG8=\r
+X-MICROSOFT-CDO-BUSYSTATUS:BUSY\r
+BEGIN:VALARM\r
+ACTION:DISPLAY\r
+TRIGGER:-PT15M\r
+DESCRIPTION:Reminder\r
+END:VALARM\r
+BEGIN:VALARM\r
+ACTION:EMAIL\r
+TRIGGER;RELATED=END:-PT1H\r
+END:VALARM\r
+BEGIN:VALARM\r
+ACTION:DISPLAY\r
+TRIGGER:PT5M\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:040000008200E00074C5B7101A82E008\r
+RECURRENCE-ID;TZID=Pacific Standard Time:20230403T100000\r
+DTSTART;TZID=Pacific Standard Time:20230404T120000\r
+DURATION:PT30M\r
+SUMMARY:Planning (moved)\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:holiday\r
+DTSTART;VALUE=DATE:20230410\r
+SUMMARY:Holiday\r
+BEGIN:VALARM\r
+ACTION:DISPLAY\r
+TRIGGER;VALUE=DATE-TIME:20230409T200000Z\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:custom\r
+DTSTART;TZID=Custom Zone:20230320T100000\r
+RRULE:FREQ=DAILY;COUNT=3\r
+EXDATE;TZID=Custom Zone:20230321T100000,20230322T100000\r
+SUMMARY:In custom timezone\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:floating\r
+DTSTART:20230320T100000\r
+DTEND:20230320T120000Z\r
+SUMMARY:Floating\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+class TestReadIcs(TestCase):
+    def read(self, content=OUTLOOK_CALENDAR, **kwargs):
+        return list(read_ics(StringIO(content), timezone=TEST_TIMEZONE, **kwargs))
+
+    def test_event(self):
+        event = self.read()[0]
+        self.assertEqual(event.summary,
+                         'Planning, Q2 review and a long summary that is folded over multiple lines by Outlook €')
+        self.assertEqual(event.description, 'Agenda:\n1. Budget;\ncosts')
+        self.assertEqual(event.location, 'Room 1')
+        self.assertEqual(event.timezone, 'America/Los_Angeles')
+        self.assertEqual(event.start, datetime(2023, 3, 20, 10, tzinfo=gettz('America/Los_Angeles')))
+        self.assertEqual(event.end - event.start, timedelta(hours=1))
+        self.assertEqual(event.visibility, Visibility.PRIVATE)
+        self.assertEqual(event.transparency, 'opaque')
+        self.assertEqual(event.created, datetime(2023, 1, 1, 10, tzinfo=gettz('UTC')))
+        self.assertEqual(event.updated, datetime(2023, 1, 2, 10, tzinfo=gettz('UTC')))
+        self.assertDictEqual(event.other, {'iCalUID': '040000008200E00074C5B7101A82E008', 'status': 'confirmed',
+                                           'sequence': 3})
+
+        self.assertListEqual(event.recurrence, [
+            'RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=5',
+            'EXDATE;TZID=America/Los_Angeles:20230327T100000'
+        ])
+        # can be parsed and expanded
+        self.assertEqual(Recurrence.parse(event.recurrence[1]).timezone, 'America/Los_Angeles')
+
+        self.assertEqual(event.organizer, Person('boss@example.com', display_name='Boss: The Big'))
+        self.assertListEqual(event.attendees, [
+            Attendee('john@example.com', display_name='John Doe', _response_status=ResponseStatus.ACCEPTED),
+            Attendee('jane@example.com', optional=True, additional_guests=1,
+                     _response_status=ResponseStatus.TENTATIVE),
+            Attendee('room@example.com', is_resource=True),
+        ])
+        self.assertEqual(len(event.attachments), 1)
+        self.assertEqual(event.attachments[0].file_url, 'https://example.com/agenda.pdf')
+        self.assertEqual(event.attachments[0].title, 'agenda.pdf')
+        self.assertEqual(event.attachments[0].mime_type, 'application/pdf')
+
+        # alarm after the start is not supported by Google Calendar
+        self.assertFalse(event.default_reminders)
+        self.assertListEqual([(type(r), r.minutes_before_start) for r in event.reminders],
+                             [(PopupReminder, 15), (EmailReminder, 0)])
+
+    def test_instance(self):
+        instance = self.read()[1]
+        self.assertEqual(instance.other['iCalUID'], '040000008200E00074C5B7101A82E008')
+        self.assertDictEqual(instance.other['originalStartTime'], {
+            'dateTime': '2023-04-03T10:00:00-07:00',
+            'timeZone': 'America/Los_Angeles'
+        })
+        self.assertEqual(instance.end - instance.start, timedelta(minutes=30))
+
+    def test_dates(self):
+        _, _, holiday, custom, floating = self.read()
+        self.assertEqual(holiday.start, date(2023, 4, 10))
+        self.assertEqual(holiday.end, date(2023, 4, 11))
+        # 2023-04-09T20:00Z is 2 hours before the midnight in Prague
+        self.assertListEqual(holiday.reminders, [PopupReminder(120)])
+
+        # timezone from VTIMEZONE (+05:30), converted to the default timezone
+        self.assertEqual(custom.timezone, TEST_TIMEZONE)
+        self.assertEqual(custom.start, datetime(2023, 3, 20, 5, 30, tzinfo=gettz(TEST_TIMEZONE)))
+        self.assertEqual(custom.start.utcoffset(), timedelta(hours=1))
+        # ends when it starts
+        self.assertEqual(custom.end, custom.start)
+        # recurrence dates are converted to UTC
+        self.assertListEqual(custom.recurrence, [
+            'RRULE:FREQ=DAILY;COUNT=3',
+            'EXDATE:20230321T043000Z,20230322T043000Z'
+        ])
+
+        self.assertEqual(floating.timezone, TEST_TIMEZONE)
+        self.assertEqual(floating.start, datetime(2023, 3, 20, 10, tzinfo=gettz(TEST_TIMEZONE)))
+        self.assertEqual(floating.end, datetime(2023, 3, 20, 12, tzinfo=gettz('UTC')))
+
+    def test_timezone_without_slash(self):
+        events = self.read(
+            'BEGIN:VEVENT\r\nDTSTART;TZID=CET:20230320T100000\r\nEND:VEVENT\r\n'
+            'BEGIN:VEVENT\r\nDTSTART;TZID=Japan:20230320T100000\r\nEND:VEVENT\r\n'
+        )
+        self.assertListEqual([e.timezone for e in events], ['CET', 'Japan'])
+        self.assertEqual(events[0].start.utcoffset(), timedelta(hours=1))
+        self.assertEqual(events[1].start.utcoffset(), timedelta(hours=9))
+
+    def test_binary(self):
+        # Folded in the middle of the multi-byte character
+        content = OUTLOOK_CALENDAR.replace('by Outlook €', 'by Outlook €€').encode('utf-8')
+        split = content.index('€'.encode('utf-8')) + 1
+        content = content[:split] + b'\r\n ' + content[split:]
+        events = list(read_ics(BytesIO(content), timezone=TEST_TIMEZONE))
+        self.assertEqual(len(events), 5)
+        self.assertTrue(events[0].summary.endswith('by Outlook €€'))
+
+    def test_mmap(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'calendar.ics')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(OUTLOOK_CALENDAR)
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                events = list(read_ics(m, timezone=TEST_TIMEZONE))
+        self.assertListEqual([e.summary for e in events], [e.summary for e in self.read()])
+
+    def test_lazy(self):
+        file = StringIO(OUTLOOK_CALENDAR)
+        events = read_ics(file, timezone=TEST_TIMEZONE)
+        next(events)
+        # only the first event is read
+        self.assertLess(file.tell(), OUTLOOK_CALENDAR.index('RECURRENCE-ID'))
+
+    def test_round_trip(self):
+        events = self.read()
+        file = StringIO()
+        write_ics(events, file)
+        received = list(read_ics(StringIO(file.getvalue()), timezone=TEST_TIMEZONE))
+
+        self.assertEqual(len(received), len(events))
+        for event, received_event in zip(events, received):
+            self.assertEqual(received_event.summary, event.summary)
+            self.assertEqual(received_event.start, event.start)
+            self.assertEqual(received_event.end, event.end)
+            self.assertEqual(received_event.recurrence, event.recurrence)
+            self.assertEqual(received_event.attendees, event.attendees)
+            self.assertEqual(received_event.reminders, event.reminders)
+            self.assertEqual(received_event.other.get('iCalUID'), event.other.get('iCalUID'))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.read('BEGIN:VEVENT\r\nSUMMARY:No start\r\nEND:VEVENT\r\n', strict=True)
+        with self.assertRaises(ValueError):
+            self.read('BEGIN:VEVENT\r\nDTSTART:2023\r\nEND:VEVENT\r\n', strict=True)
+        with self.assertRaises(ValueError):
+            self.read('BEGIN:VEVENT\r\nDTSTART;TZID="Europe/Prague:20230320T100000\r\nEND:VEVENT\r\n', strict=True)
+
+    def test_invalid_skipped(self):
+        content = (
+            'BEGIN:VCALENDAR\r\n'
+            'BEGIN:VEVENT\r\nUID:first\r\nDTSTART:20230320T100000Z\r\nEND:VEVENT\r\n'
+            'BEGIN:VEVENT\r\nUID:invalid\r\nSUMMARY:No start\r\nEND:VEVENT\r\n'
+            'BEGIN:VEVENT\r\nUID:last\r\nDTSTART:20230321T100000Z\r\nEND:VEVENT\r\n'
+            'END:VCALENDAR\r\n'
+        )
+        with self.assertLogs('gcsa.ics', level='WARNING') as logs:
+            events = self.read(content)
+        self.assertListEqual([e.other['iCalUID'] for e in events], ['first', 'last'])
+        self.assertIn('invalid', logs.output[0])
@@ -0,0 +1,99 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from gcsa.rate_limit import TokenBucket, FileTokenBucket, CombinedRateLimiter, RateLimiter, _BaseTokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class CountingRateLimiter(RateLimiter):
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self, tokens=1):
+        self.acquired += tokens
+
+
+class TestTokenBucket(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('gcsa.rate_limit.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_and_rate(self):
+        bucket = TokenBucket(rate=2, capacity=4)
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+        start = self.clock.now
+        for _ in range(10):
+            bucket.acquire()
+        self.assertAlmostEqual(self.clock.now - start, 5)
+
+    def test_refill_is_capped(self):
+        bucket = TokenBucket(rate=1, capacity=2)
+        self.clock.now += 100
+        bucket.acquire(2)
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [1])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=2).acquire(3)
+
+    def test_abstract(self):
+        class IncompleteTokenBucket(_BaseTokenBucket):
+            pass
+
+        with self.assertRaises(TypeError):
+            RateLimiter()
+        with self.assertRaises(TypeError):
+            IncompleteTokenBucket(rate=1, capacity=1)
+
+    def test_file_token_bucket_shared(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bucket')
+            # e.g. buckets of two different processes
+            bucket_1 = FileTokenBucket(path, rate=1, capacity=3)
+            bucket_2 = FileTokenBucket(path, rate=1, capacity=3)
+
+            bucket_1.acquire()
+            bucket_2.acquire()
+            bucket_1.acquire()
+            self.assertEqual(self.clock.sleeps, [])
+
+            bucket_2.acquire()
+            self.assertEqual(self.clock.sleeps, [1])
+
+    def test_combined(self):
+        limiter_1 = CountingRateLimiter()
+        limiter_2 = CountingRateLimiter()
+        CombinedRateLimiter(limiter_1, limiter_2).acquire(2)
+        self.assertEqual(limiter_1.acquired, 2)
+        self.assertEqual(limiter_2.acquired, 2)
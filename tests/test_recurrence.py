@@ -1,10 +1,14 @@
+import pickle
+from copy import deepcopy
+from datetime import datetime, date
 from functools import partial
 from unittest import TestCase
 
 from beautiful_date import Jun, Jul
+from dateutil.tz import tzutc
 
-from gcsa.recurrence import Recurrence, \
-    WEEKLY, MO, WE, TH, Duration
+from gcsa.recurrence import Recurrence, RecurrenceRule, RecurrenceDates, \
+    DAILY, WEEKLY, MONTHLY, SU, MO, WE, TH, FR, Duration
 
 TEST_TIMEZONE = 'Asia/Shanghai'
 
@@ -210,3 +214,132 @@ class TestRecurrence(TestCase):
             p([("Hello", 15 / Jun / 2020)])
         with self.assertRaises(TypeError):
             p([(10 / Jun / 2020, 15 / Jun / 2020), ("Hello", 15 / Jun / 2020)])
+
+
+class TestRecurrenceParse(TestCase):
+    def test_parse_rule(self):
+        rule = Recurrence.parse('RRULE:FREQ=MONTHLY;INTERVAL=2;COUNT=3;BYDAY=MO,-1FR;BYMONTH=1,6;WKST=MO')
+        self.assertIsInstance(rule, RecurrenceRule)
+        self.assertEqual(rule.name, 'RRULE')
+        self.assertEqual(rule.freq, MONTHLY)
+        self.assertEqual(rule.interval, 2)
+        self.assertEqual(rule.count, 3)
+        self.assertIsNone(rule.until)
+        self.assertTupleEqual(rule.by_week_day, (MO, FR(-1)))
+        self.assertTupleEqual(rule.by_month, (1, 6))
+        self.assertTupleEqual(rule.by_month_day, ())
+        self.assertEqual(rule.week_start, MO)
+
+        rule = Recurrence.parse('EXRULE:FREQ=DAILY;UNTIL=20200614T154900Z')
+        self.assertEqual(rule.name, 'EXRULE')
+        self.assertEqual(rule.until, datetime(2020, 6, 14, 15, 49, tzinfo=tzutc()))
+        self.assertIsNone(rule.week_start)
+
+        self.assertEqual(Recurrence.parse('RRULE:FREQ=DAILY;UNTIL=20200614').until, date(2020, 6, 14))
+        self.assertEqual(Recurrence.parse('RRULE:FREQ=DAILY;UNTIL=20200614T154900').until,
+                         datetime(2020, 6, 14, 15, 49))
+
+    def test_parse_dates(self):
+        dates = Recurrence.parse('EXDATE;TZID=Europe/Prague:20230101T100000,20230108T100000')
+        self.assertIsInstance(dates, RecurrenceDates)
+        self.assertEqual(dates.name, 'EXDATE')
+        self.assertEqual(dates.value_type, 'DATE-TIME')
+        self.assertEqual(dates.timezone, 'Europe/Prague')
+        self.assertTupleEqual(dates.values, (datetime(2023, 1, 1, 10), datetime(2023, 1, 8, 10)))
+
+        dates = Recurrence.parse('EXDATE;TZID="Europe/Prague":20230101T100000')
+        self.assertEqual(dates.timezone, 'Europe/Prague')
+        self.assertEqual(str(dates), 'EXDATE;TZID=Europe/Prague:20230101T100000')
+
+        dates = Recurrence.parse('RDATE;VALUE=DATE:20230101,20230108')
+        self.assertEqual(dates.value_type, 'DATE')
+        self.assertIsNone(dates.timezone)
+        self.assertTupleEqual(dates.values, (date(2023, 1, 1), date(2023, 1, 8)))
+
+        dates = Recurrence.parse('RDATE;VALUE=PERIOD:20230101T100000Z/PT2H,20230108T100000Z/20230108T110000Z')
+        self.assertEqual(dates.value_type, 'PERIOD')
+        self.assertTupleEqual(dates.values, (
+            (datetime(2023, 1, 1, 10, tzinfo=tzutc()), Duration(h=2)),
+            (datetime(2023, 1, 8, 10, tzinfo=tzutc()), datetime(2023, 1, 8, 11, tzinfo=tzutc())),
+        ))
+
+    def test_parse_round_trip(self):
+        lines = [
+            'RRULE:FREQ=MONTHLY;COUNT=3;BYDAY=-1FR',
+            'RRULE:FREQ=WEEKLY;WKST=MO;UNTIL=20230101T000000Z;BYDAY=MO,TU',
+            'EXRULE:FREQ=DAILY;UNTIL=20230101',
+            'EXDATE;TZID=Europe/Prague:20230101T100000,20230108T100000',
+            'EXDATE:20230101T100000Z',
+            'RDATE;VALUE=DATE:20230101',
+            'RDATE;VALUE=PERIOD:20230412T090000Z/P1W2DT3H4M5S,20230413T090000Z/20230413T100000Z',
+            Recurrence.rule(freq=MONTHLY, interval=2, until=14 / Jun / 2020, by_second=[0, 30], by_minute=15,
+                            by_hour=[9, 17], by_week_day=[MO(1), FR(-1)], by_month_day=[1, -1], by_year_day=100,
+                            by_week=20, by_month=6, by_set_pos=[1, -1], week_start=MO),
+            Recurrence.exclude_rule(freq=WEEKLY, count=10),
+            Recurrence.times([(14 / Jun / 2020)[10:00], (15 / Jun / 2020)[10:00]], timezone=TEST_TIMEZONE),
+            Recurrence.exclude_dates([14 / Jun / 2020, 15 / Jun / 2020]),
+            Recurrence.periods([((14 / Jun / 2020)[10:00], Duration(d=1))], timezone='UTC'),
+        ]
+        for line in lines:
+            self.assertEqual(str(Recurrence.parse(line)), line)
+
+    def test_parse_cached(self):
+        line = 'RRULE:FREQ=WEEKLY;BYDAY=MO,WE'
+        rule = Recurrence.parse(line)
+        self.assertIs(Recurrence.parse(line), rule)
+        self.assertIs(Recurrence.parse(';'.join(['RRULE:FREQ=WEEKLY', 'BYDAY=MO,WE'])), rule)
+        self.assertIs(pickle.loads(pickle.dumps(rule)), rule)
+        self.assertIs(deepcopy(rule), rule)
+
+    def test_immutable(self):
+        rule = Recurrence.parse('RRULE:FREQ=WEEKLY;BYDAY=MO,WE')
+        with self.assertRaises(AttributeError):
+            rule.freq = DAILY
+        with self.assertRaises(AttributeError):
+            del rule.by_week_day
+        dates = Recurrence.parse('RDATE;VALUE=DATE:20230101')
+        with self.assertRaises(AttributeError):
+            dates.values = ()
+
+    def test_equality(self):
+        rule = Recurrence.parse('RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=5')
+        same_rule = RecurrenceRule(freq=WEEKLY, count=5, by_week_day=(MO, WE))
+        self.assertEqual(rule, same_rule)
+        self.assertEqual(hash(rule), hash(same_rule))
+        self.assertEqual(str(same_rule), 'RRULE:FREQ=WEEKLY;COUNT=5;BYDAY=MO,WE')
+        self.assertNotEqual(rule, RecurrenceRule(freq=WEEKLY, count=5, by_week_day=(MO(1), WE)))
+        self.assertNotEqual(rule, RecurrenceRule('EXRULE', freq=WEEKLY, count=5, by_week_day=(MO, WE)))
+        self.assertEqual(len({rule, same_rule}), 1)
+
+        dates = RecurrenceDates('EXDATE', [datetime(2023, 1, 1, 10)], timezone='Europe/Prague')
+        self.assertEqual(dates, Recurrence.parse('EXDATE;TZID=Europe/Prague:20230101T100000'))
+        self.assertEqual(str(dates), 'EXDATE;TZID=Europe/Prague:20230101T100000')
+        self.assertEqual(str(RecurrenceDates(values=[date(2023, 1, 1)], value_type='DATE')),
+                         'RDATE;VALUE=DATE:20230101')
+
+        self.assertEqual(SU(2), SU(2))
+        self.assertNotEqual(SU(2), SU)
+        self.assertEqual(Duration(w=2), Duration(w=2))
+        self.assertNotEqual(Duration(w=2), Duration(d=14))
+
+    def test_parse_errors(self):
+        with self.assertRaises(TypeError):
+            Recurrence.parse(None)
+        with self.assertRaises(ValueError):
+            Recurrence.parse('DTSTART:20230101T100000Z')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RRULE:FREQ=FORTNIGHTLY')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RRULE:FREQ=DAILY;BYHOUR=25')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RRULE:FREQ=DAILY;BYDAY=XX')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RRULE:FREQ=DAILY;RSCALE=GREGORIAN')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RRULE:FREQ=DAILY;COUNT=1;UNTIL=20230101')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RDATE;X-PARAM=1:20230101T100000Z')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RDATE;VALUE=PERIOD:20230101T100000Z/2H')
+        with self.assertRaises(ValueError):
+            Recurrence.parse('RDATE;VALUE=DATE:2023-01-01')
@@ -0,0 +1,97 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from gcsa.retry import RetryPolicy
+
+
+def http_error(status, reason=None):
+    content = json.dumps({'error': {'errors': [{'reason': reason}]}}).encode() if reason else b''
+    return HttpError(httplib2.Response({'status': status}), content)
+
+
+class FlakyFunction:
+    def __init__(self, errors, result='result'):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+@patch('gcsa.retry.time.sleep')
+class TestRetryPolicy(TestCase):
+    def test_is_retryable(self, _):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(http_error(429)))
+        self.assertTrue(policy.is_retryable(http_error(429), idempotent=False))
+        self.assertTrue(policy.is_retryable(http_error(403, 'rateLimitExceeded'), idempotent=False))
+        self.assertTrue(policy.is_retryable(http_error(403, 'userRateLimitExceeded')))
+        self.assertFalse(policy.is_retryable(http_error(403, 'forbidden')))
+        self.assertFalse(policy.is_retryable(http_error(403)))
+        self.assertTrue(policy.is_retryable(http_error(503)))
+        self.assertFalse(policy.is_retryable(http_error(503), idempotent=False))
+        self.assertFalse(policy.is_retryable(http_error(404)))
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertFalse(policy.is_retryable(ConnectionResetError(), idempotent=False))
+        self.assertFalse(policy.is_retryable(ValueError()))
+
+    def test_get_delay(self, _):
+        policy = RetryPolicy(initial_delay=1, max_delay=10, multiplier=2)
+        for retry, max_delay in [(1, 1), (2, 2), (3, 4), (4, 8), (5, 10), (10, 10)]:
+            for _ in range(20):
+                self.assertTrue(0 <= policy.get_delay(retry) <= max_delay)
+
+    def test_execute(self, sleep):
+        policy = RetryPolicy(max_attempts=3)
+        fn = FlakyFunction([http_error(429), http_error(503)])
+        self.assertEqual(policy.execute(fn), 'result')
+        self.assertEqual(fn.calls, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual((policy.requests, policy.retries, policy.failures), (1, 2, 0))
+
+        fn = FlakyFunction([http_error(503)] * 3)
+        with self.assertRaises(HttpError):
+            policy.execute(fn)
+        self.assertEqual(fn.calls, 3)
+        self.assertEqual((policy.requests, policy.retries, policy.failures), (2, 4, 1))
+
+        fn = FlakyFunction([http_error(503)])
+        with self.assertRaises(HttpError):
+            policy.execute(fn, idempotent=False)
+        self.assertEqual(fn.calls, 1)
+
+        fn = FlakyFunction([http_error(404)])
+        with self.assertRaises(HttpError):
+            policy.execute(fn)
+        self.assertEqual(fn.calls, 1)
+        self.assertEqual((policy.requests, policy.retries, policy.failures), (4, 4, 1))
+
+        policy.reset_counters()
+        self.assertEqual((policy.requests, policy.retries, policy.failures), (0, 0, 0))
+
+        policy.record_retries(3)
+        policy.record_failures()
+        self.assertEqual((policy.requests, policy.retries, policy.failures), (0, 3, 1))
+
+    def test_no_retries(self, _):
+        policy = RetryPolicy(max_attempts=1)
+        fn = FlakyFunction([http_error(429)])
+        with self.assertRaises(HttpError):
+            policy.execute(fn)
+        self.assertEqual(fn.calls, 1)
+
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_repr_str(self, _):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertEqual(str(policy), 'max_attempts=3, requests=0, retries=0, failures=0')
+        self.assertEqual(repr(policy), '<RetryPolicy max_attempts=3, requests=0, retries=0, failures=0>')
@@ -1,8 +1,11 @@
+from datetime import datetime
 from unittest import TestCase
 
+import dateutil.parser
 from beautiful_date import Sept
+from dateutil.tz import tzutc, tzoffset
 
-from gcsa.util.date_time_util import ensure_localisation
+from gcsa.util.date_time_util import ensure_localisation, parse_datetime
 
 
 class TestReminder(TestCase):
@@ -23,3 +26,31 @@ class TestReminder(TestCase):
 
         with self.assertRaises(TypeError):
             ensure_localisation('Hello')
+
+    def test_parse_datetime(self):
+        self.assertEqual(parse_datetime('2022-09-23'), datetime(2022, 9, 23))
+        self.assertEqual(parse_datetime('2022-09-23T13:22:05'), datetime(2022, 9, 23, 13, 22, 5))
+
+        dt = parse_datetime('2022-09-23T13:22:05Z')
+        self.assertEqual(dt, datetime(2022, 9, 23, 13, 22, 5, tzinfo=tzutc()))
+        self.assertEqual(dt.tzinfo, tzutc())
+
+        dt = parse_datetime('2022-09-23T13:22:05.123+02:00')
+        self.assertEqual(dt, datetime(2022, 9, 23, 13, 22, 5, 123000, tzinfo=tzoffset(None, 7200)))
+        self.assertEqual(dt.utcoffset().total_seconds(), 7200)
+
+        dt = parse_datetime('2022-09-23T13:22:05-05:30')
+        self.assertEqual(dt.utcoffset().total_seconds(), -19800)
+
+        # tzinfo objects are shared
+        self.assertIs(
+            parse_datetime('2022-09-23T13:22:05+02:00').tzinfo,
+            parse_datetime('2023-01-01T00:00:00+02:00').tzinfo
+        )
+
+        # falls back to dateutil
+        for s in ('Sep 23 2022 1pm', '2022-09-23T13:22:05.1234567890Z', '20220923T132205Z'):
+            self.assertEqual(parse_datetime(s), dateutil.parser.parse(s))
+
+        with self.assertRaises(ValueError):
+            parse_datetime('not a date')